@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# WARMUP_ON_STARTUP 이면 첫 요청 전에 그래프 / LLM 클라이언트 / 프롬프트 캐시를 미리 만든다
+from tripmind.utils.warmup import warmup_on_startup  # noqa: E402
+
+warmup_on_startup()
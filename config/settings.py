@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -55,6 +56,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 
 # Database
@@ -108,3 +110,167 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# LLM 백엔드 (tripmind.clients.llm.llm_client_factory)
+# claude: Anthropic API, fake: 노드별 스크립트/템플릿 응답 (부하 테스트, benchmark_pipeline)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "claude")
+
+# fake 백엔드 설정 (tripmind.clients.llm.fake_llm_client)
+# latency: 첫 토큰까지의 지연 분포(초, fixed | uniform | normal | lognormal)
+# tokens_per_second: 첫 토큰 이후 스트리밍 속도, time_scale: 모든 대기 시간 배율(0 이면 지연 없음)
+# script: {"노드 이름": ["응답 템플릿", ...]} JSON 파일 ({input} 은 사용자 입력으로 치환)
+FAKE_LLM = {
+    "seed": int(os.getenv("FAKE_LLM_SEED", "0")),
+    "time_scale": float(os.getenv("FAKE_LLM_TIME_SCALE", "1.0")),
+    "script": os.getenv("FAKE_LLM_SCRIPT"),
+    "nodes": {
+        "default": {
+            "latency": {"distribution": "lognormal", "mean": 0.8, "spread": 0.3},
+            "tokens_per_second": 60,
+        },
+        "classify_intent_node": {
+            "latency": {"distribution": "lognormal", "mean": 0.4, "spread": 0.25},
+            "tokens_per_second": 150,
+        },
+        "itinerary_node": {
+            "latency": {"distribution": "lognormal", "mean": 1.5, "spread": 0.4},
+            "tokens_per_second": 50,
+            "chunk_chars": 8,
+        },
+    },
+}
+
+# 일정 에이전트 종류 (tripmind.agents.itinerary.nodes.itinerary_node)
+# tool_calling: Anthropic 네이티브 tool use. 한 턴에 여러 도구를 호출할 수 있어
+#   ParallelToolAgentExecutor 가 장소 검색 등을 한 번에 동시 실행한다 (기본값)
+# structured_chat: JSON action blob 텍스트 생성. 모델 한 턴에 action 이 하나뿐이라
+#   도구가 항상 하나씩 순서대로 실행된다 (병렬 실행 없음)
+ITINERARY_AGENT_TYPE = os.getenv("ITINERARY_AGENT_TYPE", "tool_calling")
+
+# 워커 진입점(config/asgi.py, config/wsgi.py)에서 그래프 / LLM 클라이언트 / 프롬프트 캐시 /
+# 공유 실행기를 미리 만든다 (tripmind.utils.warmup, manage.py warmup 과 같은 작업)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true"
+
+# 라우터와 전문 에이전트를 하나의 부모 그래프(supergraph)로 실행 (턴당 stream 1회, 체크포인트 1개 스레드)
+# false 면 라우터 그래프와 에이전트 그래프를 따로 실행 (tripmind.agents.supergraph)
+AGENT_SUPERGRAPH = os.getenv("AGENT_SUPERGRAPH", "true").lower() == "true"
+
+# 의도 분류 LLM 이 일반 대화 / 인사에는 같은 호출에서 답변까지 생성 (대화 에이전트 LLM 호출 생략)
+# (tripmind.agents.prompt_router.nodes.classify_intent_node)
+ROUTER_COMBINED_RESPONSE = (
+    os.getenv("ROUTER_COMBINED_RESPONSE", "false").lower() == "true"
+)
+
+# SSE 재연결: 세션별 마지막 턴의 이벤트를 링 버퍼에 보관하고 클라이언트 연결이 끊겨도 생성은 계속 진행.
+# Last-Event-ID 로 재연결하면 놓친 이벤트부터 이어서 전송 (tripmind.api.streaming.event_buffer)
+# ASGI 서버에서만 동작하며 WSGI(runserver)에서는 버퍼 없이 바로 스트리밍
+SSE_RESUME = {
+    "enabled": os.getenv("SSE_RESUME_ENABLED", "true").lower() == "true",
+    "max_events": int(os.getenv("SSE_RESUME_MAX_EVENTS", "1000")),
+    "max_sessions": 1000,
+    "ttl_seconds": int(os.getenv("SSE_RESUME_TTL", "300")),
+}
+
+# 모델이 한 턴에 여러 도구를 호출할 때 동시에 실행할 공유 스레드 풀 크기
+# (tripmind.agents.common.utils.parallel_tool_executor)
+AGENT_TOOL_MAX_WORKERS = int(os.getenv("AGENT_TOOL_MAX_WORKERS", "8"))
+
+# 비동기 스트림에서 동기로 남은 단계(calendar / sharing 단독 실행, 메모리 로드 / 요약)를 실행하는
+# 공유 스레드 풀 크기 (tripmind.agents.common.utils.sync_executor)
+# 일정 / 대화 / 의도 분류 노드는 graph.astream 에서 ainvoke 로 LLM 을 호출해 스레드를 잡지 않는다
+AGENT_SYNC_MAX_WORKERS = int(os.getenv("AGENT_SYNC_MAX_WORKERS", "32"))
+
+# 여행지가 정해지면 일정 LLM 이 생각하는 동안 주요 카테고리 장소를 미리 검색해 캐시
+# (tripmind.services.place_search.place_prefetcher, place_search_cache)
+PLACE_SEARCH_PREFETCH = {
+    "enabled": os.getenv("PLACE_SEARCH_PREFETCH_ENABLED", "true").lower() == "true",
+    "categories": ["관광지", "맛집", "카페"],
+    "max_workers": int(os.getenv("PLACE_SEARCH_PREFETCH_WORKERS", "4")),
+    "ttl_seconds": int(os.getenv("PLACE_SEARCH_CACHE_TTL", "3600")),
+    "max_entries": 1000,
+    # 진행 중인 같은 검색을 기다리는 최대 시간(초), 넘으면 직접 검색
+    "join_timeout_seconds": float(os.getenv("PLACE_SEARCH_JOIN_TIMEOUT", "5")),
+}
+
+# LLM 노드별 모델 프로필 (tripmind.clients.llm.model_registry)
+# 노드 프로필에 없는 값은 default 프로필 값을 사용
+LLM_MODEL_PROFILES = {
+    "default": {
+        "model": os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514"),
+        "max_tokens": 3000,
+    },
+    # 의도 분류는 {"intent": ...} 만 출력하므로 작고 빠른 모델 사용
+    "classify_intent_node": {
+        "model": os.getenv("LLM_ROUTER_MODEL", "claude-3-5-haiku-20241022"),
+        "max_tokens": 256,
+        "temperature": 0.0,
+    },
+    # 결합 라우터 (ROUTER_COMBINED_RESPONSE): 의도 분류 + 일반 대화 답변을 한 번에 생성
+    "classify_intent_respond": {
+        "model": os.getenv("LLM_ROUTER_MODEL", "claude-3-5-haiku-20241022"),
+        "max_tokens": 1024,
+    },
+    "conversation_node": {
+        "model": os.getenv(
+            "LLM_CONVERSATION_MODEL",
+            os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514"),
+        ),
+        "max_tokens": 1500,
+    },
+    "itinerary_node": {
+        "model": os.getenv(
+            "LLM_ITINERARY_MODEL",
+            os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514"),
+        ),
+        "max_tokens": 3000,
+    },
+    # 대화 메모리에서 밀려난 이전 턴 요약
+    "memory_summary": {
+        "model": os.getenv("LLM_ROUTER_MODEL", "claude-3-5-haiku-20241022"),
+        "max_tokens": 512,
+        "temperature": 0.0,
+    },
+}
+
+# 노드별 대화 메모리(chat_history) 토큰 예산 (tripmind.services.session.token_budgeted_memory)
+# 예산을 넘는 이전 턴은 롤링 요약으로 합쳐짐
+CHAT_MEMORY_TOKEN_BUDGETS = {
+    "default": int(os.getenv("CHAT_MEMORY_TOKEN_BUDGET", "2000")),
+    "conversation_node": int(os.getenv("CHAT_MEMORY_CONVERSATION_BUDGET", "2000")),
+    "itinerary_node": int(os.getenv("CHAT_MEMORY_ITINERARY_BUDGET", "4000")),
+    "place_search_node": int(os.getenv("CHAT_MEMORY_PLACE_SEARCH_BUDGET", "1000")),
+    "greeting_node": 500,
+}
+
+# 관련 턴 검색 기반 chat_history 선택 (현재 입력과 관련된 과거 턴 top_k + 최근 recent_turns 턴)
+# 최근 턴보다 오래된 턴은 롤링 요약으로 함께 전달 (요약 토큰도 노드 예산에 포함)
+# 지정하지 않은 노드는 토큰 예산 + 롤링 요약만 사용
+CHAT_MEMORY_RETRIEVAL = {
+    node_name: {
+        "top_k": int(os.getenv("CHAT_MEMORY_RETRIEVAL_TOP_K", "3")),
+        "recent_turns": int(os.getenv("CHAT_MEMORY_RECENT_TURNS", "2")),
+    }
+    for node_name in ("itinerary_node", "conversation_node")
+}
+
+# 노드별 LLM 지연 시간 정책 (tripmind.clients.llm.latency_policy)
+# timeout: 시도당 시간 제한(초), max_retries: 일시적 오류 재시도(지터 백오프)
+# hedge: 비스트리밍 호출이 p95(표본 부족 시 hedge_after)를 넘으면 두 번째 요청 발사 (선택, 기본 꺼짐)
+# budget: 노드 전체 실행 시간 예산(초, 일정 에이전트의 max_execution_time)
+LLM_LATENCY_POLICIES = {
+    "default": {
+        "timeout": float(os.getenv("LLM_TIMEOUT", "60")),
+        "max_retries": int(os.getenv("LLM_MAX_RETRIES", "2")),
+    },
+    "classify_intent_node": {
+        "timeout": float(os.getenv("LLM_ROUTER_TIMEOUT", "10")),
+        "hedge": os.getenv("LLM_ROUTER_HEDGE", "false").lower() == "true",
+        "hedge_after": 2.0,
+    },
+    "conversation_node": {"timeout": 45.0},
+    "itinerary_node": {
+        "timeout": float(os.getenv("LLM_ITINERARY_TIMEOUT", "90")),
+        "max_retries": 1,
+        "budget": float(os.getenv("ITINERARY_AGENT_BUDGET", "180")),
+    },
+}
@@ -11,6 +11,9 @@ load_dotenv()
 # Django REST API URL
 API_URL = "http://127.0.0.1:8000/api/tripmind/itinerary/"
 
+# 스트림 연결이 끊겼을 때 Last-Event-ID 로 재연결을 시도할 횟수
+MAX_STREAM_RETRIES = 3
+
 # 앱 제목 설정
 st.set_page_config(page_title="TripMind - 여행 에이전트", page_icon="✈️")
 st.title("✈️ TripMind 여행 에이전트")
@@ -36,11 +39,12 @@ if prompt := st.chat_input("여행 계획에 대해 물어보세요..."):
     # 사용자 메시지 저장
     st.session_state.messages.append({"role": "user", "content": prompt})
 
-    # API 요청 준비
+    # API 요청 준비 (v2: 델타 이벤트 프로토콜)
     headers = {
         "Content-Type": "application/json",
         "X-Session-ID": st.session_state.session_id,
-        "Accept": "text/event-stream",
+        "Accept": "text/event-stream; version=2",
+        "X-TripMind-Stream-Version": "2",
     }
 
     # 대화 히스토리를 포함한 요청 데이터 준비
@@ -54,52 +58,75 @@ if prompt := st.chat_input("여행 계획에 대해 물어보세요..."):
         message_placeholder = st.empty()
         full_response = ""
 
-        try:
-            with requests.post(
-                API_URL, headers=headers, data=json.dumps(data), stream=True
-            ) as response:
-                if response.status_code == 200:
+        last_event_id = None
+        finished = False
+        for attempt in range(MAX_STREAM_RETRIES + 1):
+            try:
+                if last_event_id is None:
+                    response = requests.post(
+                        API_URL, headers=headers, data=json.dumps(data), stream=True
+                    )
+                else:
+                    # 연결이 끊기면 서버 버퍼에서 놓친 이벤트부터 이어받기 (생성은 서버에서 계속 진행)
+                    response = requests.get(
+                        API_URL,
+                        headers={**headers, "Last-Event-ID": last_event_id},
+                        stream=True,
+                    )
+                with response:
+                    if response.status_code == 204:
+                        break
+                    if response.status_code != 200:
+                        st.error(f"API 오류: {response.status_code} - {response.text}")
+                        break
+                    event_type = "message"
                     for line in response.iter_lines():
-                        if line:
-                            try:
-                                # SSE 형식에서 데이터 추출
-                                line = line.decode("utf-8")
-                                if line.startswith("data: "):
-                                    chunk = json.loads(line[6:])  # 'data: ' 제거
-                                    if "response" in chunk:
-                                        print(f"response:{chunk['response']}")
-                                        if (
-                                            chunk["response"]
-                                            != "응답을 생성하지 못했습니다."
-                                        ):
-                                            full_response = chunk["response"]
-                                            message_placeholder.write(full_response)
-                                            st.write(full_response)
-                                    if "streaming" in chunk:
-                                        print(f"streaming:{chunk['streaming']}")
-                                        streaming_data = chunk["streaming"]
-                                        if "message" in streaming_data:
-                                            current_message = streaming_data["message"][
-                                                : streaming_data["current_position"]
-                                            ]
-                                            message_placeholder.write(current_message)
-                                            if streaming_data["is_complete"]:
-                                                full_response = current_message
-
-                                        # 컨텍스트 정보가 있는 경우 사이드바에 표시
-                                        if "context" in chunk and chunk["context"]:
-                                            context = chunk["context"]
-                                            with st.sidebar:
-                                                st.subheader("여행 정보")
-                                                for key, value in context.items():
-                                                    if value:
-                                                        st.write(f"**{key}:** {value}")
-                            except json.JSONDecodeError:
+                        if not line:
+                            # 빈 줄은 이벤트 구분자
+                            event_type = "message"
+                            continue
+                        try:
+                            # SSE 형식에서 이벤트 id, 이름과 데이터 추출
+                            line = line.decode("utf-8")
+                            if line.startswith("id: "):
+                                last_event_id = line[4:].strip()
                                 continue
-                else:
-                    st.error(f"API 오류: {response.status_code} - {response.text}")
-        except Exception as e:
-            st.error(f"요청 오류: {str(e)}")
+                            if line.startswith("event: "):
+                                event_type = line[7:].strip()
+                                continue
+                            if not line.startswith("data: "):
+                                continue
+                            chunk = json.loads(line[6:])  # 'data: ' 제거
+
+                            if event_type == "delta":
+                                if chunk.get("reset"):
+                                    full_response = chunk["text"]
+                                else:
+                                    full_response += chunk["text"]
+                                message_placeholder.write(full_response)
+                            elif event_type == "context":
+                                # 컨텍스트 정보가 있는 경우 사이드바에 표시
+                                with st.sidebar:
+                                    st.subheader("여행 정보")
+                                    for key, value in chunk.items():
+                                        if value:
+                                            st.write(f"**{key}:** {value}")
+                            elif event_type == "error":
+                                st.error(f"대화 오류: {chunk['error']}")
+                                finished = True
+                            elif event_type == "done":
+                                finished = True
+                        except json.JSONDecodeError:
+                            continue
+                if finished or last_event_id is None:
+                    break
+            except requests.exceptions.RequestException as e:
+                if last_event_id is None or attempt == MAX_STREAM_RETRIES:
+                    st.error(f"요청 오류: {str(e)}")
+                    break
+            except Exception as e:
+                st.error(f"요청 오류: {str(e)}")
+                break
 
         # 최종 응답 저장
         if full_response:
@@ -110,14 +137,12 @@ if prompt := st.chat_input("여행 계획에 대해 물어보세요..."):
 # 사이드바 정보
 with st.sidebar:
     st.subheader("TripMind 사용 팁")
-    st.markdown(
-        """
+    st.markdown("""
     1. **여행지 정보 질문**: "바르셀로나에 대해 알려주세요"
     2. **여행 계획 요청**: "도쿄로 3박 4일 여행 계획 세워줘"
     3. **예산 고려**: "예산 50만원으로 제주도 여행"
     4. **특정 요구사항**: "아이와 함께하는 부산 여행 코스"
-    """
-    )
+    """)
 
     # 대화 초기화 버튼
     if st.button("대화 초기화"):
@@ -1,7 +1,7 @@
 from .types.calendar_state_type import CalendarState
 from ..common.types.agent_executor_type import AgentExecutorResult, BaseAgentExcutor
 from tripmind.services.session.session_manage_service import session_manage_service
-from .calendar_agent_graph import calendar_agent_graph
+from tripmind.agents.common.graph_registry import CALENDAR_GRAPH, graph_registry
 
 
 class CalendarRouterAgentExecutor(BaseAgentExcutor):
@@ -12,6 +12,7 @@ class CalendarRouterAgentExecutor(BaseAgentExcutor):
         start_node: str = "input_node",
     ):
         try:
+            calendar_agent_graph = graph_registry.get(CALENDAR_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 calendar_agent_graph, prompt, start_node, session_id
             )
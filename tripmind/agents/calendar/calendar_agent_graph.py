@@ -3,22 +3,15 @@ from langgraph.checkpoint.memory import MemorySaver
 from tripmind.agents.calendar.types.calendar_state_type import CalendarState
 from tripmind.agents.calendar.nodes.calendar_node import calendar_node
 from tripmind.agents.common.nodes.node_wrapper import node_wrapper
-from tripmind.services.calendar.google_calendar_service import GoogleCalendarService
-from tripmind.clients.calendar.google_calendar_client import GoogleCalendarClient
-import os
+from tripmind.services.calendar.google_calendar_service import (
+    get_google_calendar_service,
+)
+from tripmind.agents.common.graph_registry import CALENDAR_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
     wrapped_calendar_node = node_wrapper(
-        lambda state: calendar_node(
-            state,
-            GoogleCalendarService(
-                GoogleCalendarClient(
-                    os.getenv("GOOGLE_CALENDAR_ID"),
-                    os.getenv("GOOGLE_CREDENTIALS_PATH"),
-                )
-            ),
-        )
+        lambda state: calendar_node(state, get_google_calendar_service())
     )
 
     return {
@@ -26,9 +19,7 @@ def wrap_all_nodes():
     }
 
 
-def create_calendar_agent_graph():
-    memory = MemorySaver()
-
+def build_calendar_agent_graph() -> StateGraph:
     graph = StateGraph(CalendarState)
 
     wrapped_nodes = wrap_all_nodes()
@@ -39,7 +30,15 @@ def create_calendar_agent_graph():
 
     graph.add_edge("calendar_node", END)
 
-    return graph.compile(checkpointer=memory)
+    return graph
+
+
+def create_calendar_agent_graph():
+    return build_calendar_agent_graph().compile(checkpointer=MemorySaver())
 
 
-calendar_agent_graph = create_calendar_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "calendar_agent_graph":
+        return graph_registry.get(CALENDAR_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
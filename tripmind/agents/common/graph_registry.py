@@ -0,0 +1,100 @@
+import importlib
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from langgraph.graph.state import CompiledStateGraph
+
+from tripmind.utils.startup_report import startup_report
+
+logger = logging.getLogger(__name__)
+
+PROMPT_ROUTER_GRAPH = "prompt_router"
+ITINERARY_GRAPH = "itinerary"
+CONVERSATION_GRAPH = "conversation"
+PLACE_SEARCH_GRAPH = "place_search"
+CALENDAR_GRAPH = "calendar"
+SHARING_GRAPH = "sharing"
+# 라우터 + 전문 에이전트 서브그래프 (settings.AGENT_SUPERGRAPH)
+SUPERGRAPH = "supergraph"
+
+
+class AgentGraphRegistry:
+    """
+    에이전트 그래프를 처음 사용할 때 컴파일하는 레지스트리
+
+    그래프 모듈은 "모듈 경로:팩토리 함수" 문자열로 등록하므로 레지스트리를 import 해도
+    그래프 모듈, LLM 클라이언트가 import / 생성되지 않는다.
+    미리 만들어 두려면 build_all (manage.py warmup) 을 호출한다.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, str] = {}
+        self._graphs: Dict[str, CompiledStateGraph] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory_path: str):
+        self._factories[name] = factory_path
+
+    def names(self):
+        return list(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        return name in self._graphs
+
+    def get(self, name: str) -> CompiledStateGraph:
+        graph = self._graphs.get(name)
+        if graph is not None:
+            return graph
+
+        with self._lock:
+            if name not in self._graphs:
+                factory = self._load_factory(name)
+                with startup_report.measure(f"graph:{name}"):
+                    self._graphs[name] = factory()
+            return self._graphs[name]
+
+    def build_all(self, names: Optional[list] = None) -> Dict[str, CompiledStateGraph]:
+        return {name: self.get(name) for name in names or self.names()}
+
+    def _load_factory(self, name: str) -> Callable[[], CompiledStateGraph]:
+        if name not in self._factories:
+            raise KeyError(f"등록되지 않은 그래프입니다: {name}")
+        module_path, factory_name = self._factories[name].split(":")
+        with startup_report.measure(f"import:{module_path}"):
+            module = importlib.import_module(module_path)
+        return getattr(module, factory_name)
+
+
+graph_registry = AgentGraphRegistry()
+graph_registry.register(
+    PROMPT_ROUTER_GRAPH,
+    "tripmind.agents.prompt_router.prompt_router_agent_graph:"
+    "create_prompt_router_agent_graph",
+)
+graph_registry.register(
+    ITINERARY_GRAPH,
+    "tripmind.agents.itinerary.itinerary_agent_graph:create_itinerary_agent_graph",
+)
+graph_registry.register(
+    CONVERSATION_GRAPH,
+    "tripmind.agents.conversation.conversation_agent_graph:"
+    "create_conversation_agent_graph",
+)
+graph_registry.register(
+    PLACE_SEARCH_GRAPH,
+    "tripmind.agents.place_search.place_search_agent_graph:"
+    "create_place_search_agent_graph",
+)
+graph_registry.register(
+    CALENDAR_GRAPH,
+    "tripmind.agents.calendar.calendar_agent_graph:create_calendar_agent_graph",
+)
+graph_registry.register(
+    SHARING_GRAPH,
+    "tripmind.agents.sharing.sharing_agent_graph:create_sharing_agent_graph",
+)
+graph_registry.register(
+    SUPERGRAPH,
+    "tripmind.agents.supergraph.supergraph_agent_graph:create_supergraph_agent_graph",
+)
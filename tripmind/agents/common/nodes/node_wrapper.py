@@ -1,8 +1,10 @@
 import logging
 import traceback
 import inspect
-from typing import Dict, Any, Callable, TypeVar, cast
-from functools import wraps
+from typing import Dict, Any, Awaitable, Callable, TypeVar, cast
+from functools import partial, wraps
+
+from langchain_core.runnables import RunnableLambda
 
 from tripmind.guardrails.node_validator import NodeValidator
 from tripmind.utils.response_monitor import response_monitor
@@ -13,10 +15,26 @@ T = TypeVar("T", bound=Dict[str, Any])
 
 
 def node_wrapper(func: Callable[[Any, T], T]) -> Callable[[Any, T], T]:
+    node_name = _get_node_name(func)
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
-        node_name = func.__name__
+        state = _extract_state(func, args, kwargs)
+
+        if not state:
+            logger.error(f"{node_name}: 상태 객체가 없음")
+            return cast(T, {"error": "상태 객체 없음", "messages": []})
+
+        try:
+            validated_state = _start(state)
+            result = _call_func_with_state(func, args, kwargs, validated_state)
+            return _complete(result, state)
+
+        except Exception as e:
+            return _error_state(e, state)
 
+    @wraps(func)
+    async def async_wrapper(*args, **kwargs) -> T:
         state = _extract_state(func, args, kwargs)
 
         if not state:
@@ -24,43 +42,47 @@ def node_wrapper(func: Callable[[Any, T], T]) -> Callable[[Any, T], T]:
             return cast(T, {"error": "상태 객체 없음", "messages": []})
 
         try:
-            logger.info(
-                f"{node_name} 시작: user_input={state.get('user_input', '')[:30]}..."
-            )
-            config = state.get("config_data", {})
-            session_id = config.get("thread_id", "default")
+            validated_state = _start(state)
+            result = await _call_func_with_state(func, args, kwargs, validated_state)
+            return _complete(result, state)
 
-            validated_state = NodeValidator.validate_state(state)
+        except Exception as e:
+            return _error_state(e, state)
 
-            result = _call_func_with_state(func, args, kwargs, validated_state)
+    def _start(state: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info(
+            f"{node_name} 시작: user_input={state.get('user_input', '')[:30]}..."
+        )
+        return NodeValidator.validate_state(state)
 
-            if not isinstance(result, dict):
-                logger.error(f"{node_name}: 결과가 딕셔너리가 아님: {type(result)}")
-                return cast(T, {"error": "결과 형식 오류", "messages": []})
+    def _complete(result, state: Dict[str, Any]) -> T:
+        if not isinstance(result, dict):
+            logger.error(f"{node_name}: 결과가 딕셔너리가 아님: {type(result)}")
+            return cast(T, {"error": "결과 형식 오류", "messages": []})
 
-            _monitor_response_and_validate(result, node_name, session_id, state)
+        config = state.get("config_data", {})
+        session_id = config.get("thread_id", "default")
+        _monitor_response_and_validate(result, node_name, session_id, state)
 
-            logger.info(f"{node_name} 완료")
-            return cast(T, result)
+        logger.info(f"{node_name} 완료")
+        return cast(T, result)
 
-        except Exception as e:
-            logger.error(f"{node_name} 오류: {str(e)}")
-            logger.debug(traceback.format_exc())
+    def _error_state(e: Exception, state: Dict[str, Any]) -> T:
+        logger.error(f"{node_name} 오류: {str(e)}")
+        logger.debug(traceback.format_exc())
 
-            error_message = f"[{node_name} 오류] {str(e)}"
+        error_message = f"[{node_name} 오류] {str(e)}"
 
-            error_state = dict(state)
-            if "messages" not in error_state:
-                error_state["messages"] = []
+        error_state = dict(state)
+        if "messages" not in error_state:
+            error_state["messages"] = []
 
-            error_state["messages"].append(
-                {"role": "assistant", "content": error_message}
-            )
+        error_state["messages"].append({"role": "assistant", "content": error_message})
 
-            error_state["response"] = error_message
-            error_state["error"] = str(e)
+        error_state["response"] = error_message
+        error_state["error"] = str(e)
 
-            return cast(T, error_state)
+        return cast(T, error_state)
 
     def _extract_state(func: Callable, args, kwargs) -> Dict[str, Any]:
         sig = inspect.signature(func)
@@ -117,6 +139,12 @@ def node_wrapper(func: Callable[[Any, T], T]) -> Callable[[Any, T], T]:
 
         result["response"] = validated_response
 
+        # 토큰 스트림은 검증 전 텍스트이므로 완료 상태에는 검증된 응답을 싣는다
+        streaming = result.get("streaming")
+        if isinstance(streaming, dict) and streaming.get("is_complete"):
+            streaming["message"] = validated_response
+            streaming["current_position"] = len(validated_response)
+
         for msg in messages:
             if msg.get("role") == "assistant" and msg.get(
                 "content"
@@ -134,4 +162,21 @@ def node_wrapper(func: Callable[[Any, T], T]) -> Callable[[Any, T], T]:
     #         result["response"] = result.get("user_input", "")
     #         logger.info("user_input에서 response 필드 자동 설정")
 
-    return wrapper
+    return async_wrapper if inspect.iscoroutinefunction(func) else wrapper
+
+
+def _get_node_name(func: Callable) -> str:
+    if isinstance(func, partial):
+        return func.func.__name__
+    return func.__name__
+
+
+def sync_async_node(
+    name: str, func: Callable[[T], T], afunc: Callable[[T], Awaitable[T]]
+) -> RunnableLambda:
+    """
+    graph.stream 은 func, graph.astream 은 afunc 를 실행하는 노드 (둘 다 node_wrapper 적용).
+    afunc 는 이벤트 루프에서 ainvoke 로 LLM 을 호출하므로 스트림마다 스레드를 잡지 않는다.
+    func 만 있는 노드는 LangGraph 가 astream 에서도 기본 스레드 풀(run_in_executor)에서 실행한다.
+    """
+    return RunnableLambda(node_wrapper(func), afunc=node_wrapper(afunc), name=name)
@@ -1,5 +1,9 @@
-from typing import TypedDict
+from typing import AsyncIterator, TypedDict
+
 from tripmind.agents.common.types.base_state_type import Streaming
+from tripmind.agents.common.utils.sync_executor import run_sync
+
+_STREAM_END = object()
 
 
 class AgentExecutorResult(TypedDict):
@@ -22,3 +26,26 @@ class BaseAgentExcutor:
         start_node: str = "input_node",
     ):
         pass
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "input_node",
+    ) -> AsyncIterator[AgentExecutorResult]:
+        """
+        비동기 버전. graph.astream 을 지원하지 않는 에이전트는 동기 제너레이터를
+        공유 스레드 풀(AGENT_SYNC_MAX_WORKERS)에서 한 단계씩 진행하므로, 진행 중인 스트림이
+        LLM 호출 동안 스레드 하나를 잡는다.
+        """
+        results = self.process_prompt(
+            prompt=prompt, session_id=session_id, start_node=start_node
+        )
+        if results is None:
+            return
+
+        while True:
+            result = await run_sync(next, results, _STREAM_END)
+            if result is _STREAM_END:
+                break
+            yield result
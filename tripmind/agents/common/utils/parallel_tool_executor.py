@@ -0,0 +1,105 @@
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentStep
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# 에이전트 실행기가 공유하는 도구 실행 스레드 풀 (요청 수와 무관하게 동시 도구 실행 수 제한)
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    global _tool_pool
+    with _tool_pool_lock:
+        if _tool_pool is None:
+            _tool_pool = ThreadPoolExecutor(
+                max_workers=settings.AGENT_TOOL_MAX_WORKERS,
+                thread_name_prefix="agent-tool",
+            )
+        return _tool_pool
+
+
+class _ToolBatch:
+    """모델 한 턴에서 나온 도구 호출 목록과 실행 결과"""
+
+    def __init__(self):
+        self.actions: List[AgentAction] = []
+        self.futures: List[Future] = []
+
+    def index_of(self, action: AgentAction) -> int:
+        return next(i for i, item in enumerate(self.actions) if item is action)
+
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """
+    모델이 한 턴에 여러 도구를 호출하면 (tool calling agent 의 병렬 tool use 등)
+    순서대로 하나씩 실행하는 대신 공유 스레드 풀에서 동시에 실행하고,
+    결과(AgentStep)는 호출 순서대로 돌려준다.
+
+    AgentExecutor 는 한 턴의 AgentAction 을 모두 yield 한 뒤 _perform_agent_action 을
+    순서대로 호출하므로, 첫 호출 시점에 같은 턴의 도구를 한꺼번에 제출한다.
+    (비동기 경로는 AgentExecutor 가 이미 asyncio.gather 로 동시에 실행한다)
+    """
+
+    _local: threading.local = PrivateAttr(default_factory=threading.local)
+
+    def _iter_next_step(
+        self,
+        name_to_tool_map,
+        color_mapping,
+        inputs,
+        intermediate_steps,
+        run_manager=None,
+    ):
+        batch = _ToolBatch()
+        self._local.batch = batch
+        try:
+            for step in super()._iter_next_step(
+                name_to_tool_map,
+                color_mapping,
+                inputs,
+                intermediate_steps,
+                run_manager,
+            ):
+                if isinstance(step, AgentAction):
+                    batch.actions.append(step)
+                yield step
+        finally:
+            self._local.batch = None
+
+    def _perform_agent_action(
+        self,
+        name_to_tool_map,
+        color_mapping,
+        agent_action: AgentAction,
+        run_manager=None,
+    ) -> AgentStep:
+        batch: Optional[_ToolBatch] = getattr(self._local, "batch", None)
+        if batch is None or len(batch.actions) < 2:
+            return super()._perform_agent_action(
+                name_to_tool_map, color_mapping, agent_action, run_manager
+            )
+
+        if not batch.futures:
+            logger.info(f"[도구 병렬 실행] {[a.tool for a in batch.actions]}")
+            perform = super()._perform_agent_action
+            batch.futures = [
+                _get_tool_pool().submit(
+                    contextvars.copy_context().run,
+                    perform,
+                    name_to_tool_map,
+                    color_mapping,
+                    action,
+                    run_manager,
+                )
+                for action in batch.actions
+            ]
+        return batch.futures[batch.index_of(agent_action)].result()
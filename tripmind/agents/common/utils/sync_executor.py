@@ -0,0 +1,33 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+# 비동기 스트림에서 동기로 남은 단계를 실행하는 공유 스레드 풀 (AGENT_SYNC_MAX_WORKERS)
+# - astream 을 쓰지 않는 에이전트 실행기(calendar / sharing 단독 실행)의 graph.stream 단계
+# - 비동기 노드의 세션 메모리 로드 / 저장 (토큰 예산을 넘으면 요약 LLM 을 동기로 호출)
+# 이벤트 루프 기본 풀(min(32, cpu + 4))과 분리해 이 경로의 동시 실행 수를 설정으로 고정한다.
+# LLM 을 호출하지 않는 동기 노드(장소 검색 / 캘린더 API 등)는 graph.astream 에서
+# LangGraph 가 기본 풀(run_in_executor)로 짧게 실행한다
+_sync_pool: Optional[ThreadPoolExecutor] = None
+_sync_pool_lock = threading.Lock()
+
+
+def _get_sync_pool() -> ThreadPoolExecutor:
+    global _sync_pool
+    with _sync_pool_lock:
+        if _sync_pool is None:
+            _sync_pool = ThreadPoolExecutor(
+                max_workers=settings.AGENT_SYNC_MAX_WORKERS,
+                thread_name_prefix="agent-sync",
+            )
+        return _sync_pool
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """동기 함수를 공유 스레드 풀에서 실행하고 결과를 기다린다"""
+    return await sync_to_async(func, thread_sensitive=False, executor=_get_sync_pool())(
+        *args, **kwargs
+    )
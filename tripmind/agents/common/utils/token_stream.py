@@ -0,0 +1,378 @@
+import logging
+from typing import (
+    AbstractSet,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from langgraph.graph.state import CompiledStateGraph
+
+from tripmind.agents.common.types.agent_executor_type import AgentExecutorResult
+from tripmind.agents.common.types.base_state_type import Streaming
+
+logger = logging.getLogger(__name__)
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_HEX_DIGITS = set("0123456789abcdefABCDEF")
+_HIGH_SURROGATES = (0xD800, 0xDBFF)
+_LOW_SURROGATES = (0xDC00, 0xDFFF)
+_REPLACEMENT_CHAR = "\ufffd"
+
+
+class PlainTextTokenFilter:
+    """LLM 토큰을 그대로 사용자 응답으로 흘려보내는 필터"""
+
+    def feed(self, text: str) -> str:
+        return text
+
+
+class JsonStringFieldTokenFilter:
+    """
+    JSON 형식 응답(structured chat agent 의 action blob 등)이 토큰 단위로 들어올 때
+    지정한 키의 문자열 값만 디코딩해서 흘려보내는 필터.
+
+    첫 번째 '{' 이전의 텍스트(Thought 등)는 무시하며, 여러 필드가 잡히면
+    separator 로 이어 붙인다.
+
+    conditions 에 {필드: (키, 값)} 을 주면 그 필드는 앞서 나온 키의 문자열 값이 일치할 때만
+    흘려보낸다 (예: action 이 "Final Answer" 일 때만 action_input).
+    값 자리에 집합을 주면 그 중 하나와 일치할 때 흘려보낸다.
+    """
+
+    def __init__(
+        self,
+        field_names: Iterable[str],
+        separator: str = "\n\n",
+        conditions: Optional[
+            Dict[str, Tuple[str, Union[str, AbstractSet[str]]]]
+        ] = None,
+    ):
+        self.field_names = set(field_names)
+        self.separator = separator
+        self.conditions = conditions or {}
+        self._values: Dict[str, str] = {}
+        self._string_key: Optional[str] = None
+        self._started = False
+        self._in_string = False
+        self._capturing = False
+        self._escape = False
+        self._unicode_buffer: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._string_buffer = ""
+        self._last_string: Optional[str] = None
+        self._pending_key: Optional[str] = None
+        self._captured_fields = 0
+
+    def feed(self, text: str) -> str:
+        output = []
+        for char in text:
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                continue
+
+            if self._in_string:
+                # 닫는 따옴표에서 남은 글자를 내보낼 수 있으므로 캡처 여부는 _append 가 판단
+                decoded = self._consume_string_char(char)
+                if decoded:
+                    output.append(decoded)
+                continue
+
+            if char == '"':
+                self._start_string()
+                if self._capturing and self._captured_fields > 1:
+                    output.append(self.separator)
+            elif char == ":":
+                self._pending_key = self._last_string
+                self._last_string = None
+            elif not char.isspace():
+                self._pending_key = None
+                self._last_string = None
+        return "".join(output)
+
+    def _start_string(self):
+        self._in_string = True
+        self._string_buffer = ""
+        self._string_key = self._pending_key
+        self._capturing = self._should_capture(self._pending_key)
+        self._pending_key = None
+        if self._capturing:
+            self._captured_fields += 1
+
+    def _consume_string_char(self, char: str) -> str:
+        if self._unicode_buffer is not None:
+            if char not in _HEX_DIGITS:
+                # 잘못된 \uXXXX 는 오류 없이 원문 그대로 흘려보냄
+                raw = "\\u" + self._unicode_buffer
+                self._unicode_buffer = None
+                return (
+                    self._flush_surrogate()
+                    + self._append(raw)
+                    + self._consume_string_char(char)
+                )
+            self._unicode_buffer += char
+            if len(self._unicode_buffer) < 4:
+                return ""
+            code = int(self._unicode_buffer, 16)
+            self._unicode_buffer = None
+            return self._decode_code_point(code)
+
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode_buffer = ""
+                return ""
+            return self._flush_surrogate() + self._append(_ESCAPES.get(char, char))
+
+        if char == "\\":
+            self._escape = True
+            return ""
+
+        if char == '"':
+            flushed = self._flush_surrogate()
+            self._in_string = False
+            self._last_string = None if self._capturing else self._string_buffer
+            if self._string_key is not None and not self._capturing:
+                self._values[self._string_key] = self._string_buffer
+            self._capturing = False
+            return flushed
+
+        return self._flush_surrogate() + self._append(char)
+
+    def _decode_code_point(self, code: int) -> str:
+        # 이모지 등은 \ud83d\ude00 처럼 서로게이트 쌍으로 들어오므로 합쳐서 한 글자로 만든다
+        if _HIGH_SURROGATES[0] <= code <= _HIGH_SURROGATES[1]:
+            flushed = self._flush_surrogate()
+            self._high_surrogate = code
+            return flushed
+        if _LOW_SURROGATES[0] <= code <= _LOW_SURROGATES[1]:
+            if self._high_surrogate is None:
+                return self._append(_REPLACEMENT_CHAR)
+            high, self._high_surrogate = self._high_surrogate, None
+            return self._append(
+                chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+            )
+        return self._flush_surrogate() + self._append(chr(code))
+
+    def _flush_surrogate(self) -> str:
+        # 짝이 없는 서로게이트는 SSE 인코딩(utf-8)에서 실패하므로 대체 문자로 바꿈
+        if self._high_surrogate is None:
+            return ""
+        self._high_surrogate = None
+        return self._append(_REPLACEMENT_CHAR)
+
+    def _should_capture(self, key: Optional[str]) -> bool:
+        if key not in self.field_names:
+            return False
+        if key not in self.conditions:
+            return True
+        condition_key, expected = self.conditions[key]
+        value = self._values.get(condition_key)
+        if isinstance(expected, str):
+            return value == expected
+        return value in expected
+
+    def _append(self, decoded: str) -> str:
+        if self._capturing:
+            return decoded
+        # 키 비교에만 쓰이므로 긴 값은 잘라서 보관
+        if len(self._string_buffer) < 64:
+            self._string_buffer += decoded
+        return ""
+
+
+def _message_text(message) -> str:
+    content = getattr(message, "content", "")
+    text = ""
+    if isinstance(content, str):
+        text = content
+    elif isinstance(content, list):
+        text = "".join(
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        )
+    # 네이티브 tool use 의 도구 입력(JSON)은 tool_call_chunks 의 args 로 나뉘어 들어온다
+    tool_args = "".join(
+        chunk.get("args") or ""
+        for chunk in getattr(message, "tool_call_chunks", None) or []
+    )
+    return text + tool_args
+
+
+class _GraphTokenStream:
+    """graph.stream / graph.astream 청크를 AgentExecutorResult 로 변환"""
+
+    def __init__(self, state: dict, token_filters: Dict[str, Callable[[], object]]):
+        self.state = state
+        self.token_filters = token_filters
+        self.filters = {}
+        self.streamed = ""
+
+    @property
+    def stream_mode(self) -> List[str]:
+        if self.token_filters:
+            return ["messages", "updates"]
+        return ["updates"]
+
+    def convert(self, mode: str, chunk) -> Iterator[AgentExecutorResult]:
+        for _, result in self.convert_with_nodes(mode, chunk):
+            yield result
+
+    def convert_with_nodes(
+        self, mode: str, chunk
+    ) -> Iterator[Tuple[str, AgentExecutorResult]]:
+        """(결과를 만든 노드 이름, 결과)"""
+        if mode == "messages":
+            yield from self._convert_message(chunk)
+            return
+
+        for node_name, node_state in (chunk or {}).items():
+            if not node_state:
+                continue
+            self.state.update(node_state)
+            yield node_name, AgentExecutorResult(
+                response=node_state.get("response", ""),
+                messages=node_state.get("messages", []),
+                context=node_state.get("context", {}),
+                intent=node_state.get("intent", ""),
+                next_node=node_state.get("next_node", ""),
+                streaming=node_state.get("streaming", {}),
+            )
+
+    def _convert_message(self, chunk) -> Iterator[Tuple[str, AgentExecutorResult]]:
+        message, metadata = chunk
+        node_name = metadata.get("langgraph_node", "")
+        if node_name not in self.token_filters:
+            return
+
+        run_key = getattr(message, "id", None) or node_name
+        if run_key not in self.filters:
+            self.filters[run_key] = self.token_filters[node_name]()
+
+        text = self.filters[run_key].feed(_message_text(message))
+        if not text:
+            return
+
+        self.streamed += text
+        yield node_name, AgentExecutorResult(
+            response="",
+            messages=[],
+            context={},
+            intent="",
+            next_node=node_name,
+            streaming=Streaming(
+                message=self.streamed,
+                current_position=len(self.streamed),
+                is_complete=False,
+            ),
+        )
+
+
+def stream_graph_with_tokens(
+    graph: CompiledStateGraph,
+    state: dict,
+    config: dict,
+    token_filters: Dict[str, Callable[[], object]],
+) -> Iterator[AgentExecutorResult]:
+    """
+    그래프를 "messages" + "updates" 모드로 실행한다.
+
+    token_filters 에 등록된 노드에서 호출된 LLM 토큰은 도착하는 즉시 누적 메시지로
+    yield 하고, 노드가 끝나면 기존과 같이 노드 상태 전체를 yield 한다.
+    """
+    token_stream = _GraphTokenStream(state, token_filters)
+
+    # stream_mode 를 리스트로 넘기므로 langgraph 는 항상 (mode, chunk) 를 반환
+    for mode, chunk in graph.stream(
+        state, config=config, stream_mode=token_stream.stream_mode
+    ):
+        yield from token_stream.convert(mode, chunk)
+
+
+async def astream_graph_with_tokens(
+    graph: CompiledStateGraph,
+    state: dict,
+    config: dict,
+    token_filters: Dict[str, Callable[[], object]],
+) -> AsyncIterator[AgentExecutorResult]:
+    """stream_graph_with_tokens 의 graph.astream 버전 (ASGI 뷰에서 사용)"""
+    token_stream = _GraphTokenStream(state, token_filters)
+
+    async for mode, chunk in graph.astream(
+        state, config=config, stream_mode=token_stream.stream_mode
+    ):
+        for result in token_stream.convert(mode, chunk):
+            yield result
+
+
+def stream_subgraphs_with_tokens(
+    graph: CompiledStateGraph,
+    state: dict,
+    config: dict,
+    token_filters: Dict[str, Callable[[], object]],
+    **stream_kwargs,
+) -> Iterator[Tuple[str, str, AgentExecutorResult]]:
+    """
+    서브그래프를 노드로 가진 부모 그래프(supergraph)를 subgraphs=True 로 실행하고
+    (서브그래프 노드 이름, 노드 이름, 결과) 를 yield 한다.
+
+    서브그래프 안쪽 노드의 토큰 / 상태는 stream_graph_with_tokens 와 같은 형태이며,
+    부모 그래프 노드 자신의 상태는 서브그래프 이름 "" 로 전달된다.
+    토큰 누적은 서브그래프별로 따로 한다.
+    """
+    token_streams: Dict[str, _GraphTokenStream] = {}
+    stream_mode = _GraphTokenStream(state, token_filters).stream_mode
+
+    for namespace, mode, chunk in graph.stream(
+        state, config=config, stream_mode=stream_mode, subgraphs=True, **stream_kwargs
+    ):
+        subgraph = _subgraph_name(namespace)
+        token_stream = token_streams.setdefault(
+            subgraph, _GraphTokenStream(state, token_filters)
+        )
+        for node_name, result in token_stream.convert_with_nodes(mode, chunk):
+            yield subgraph, node_name, result
+
+
+async def astream_subgraphs_with_tokens(
+    graph: CompiledStateGraph,
+    state: dict,
+    config: dict,
+    token_filters: Dict[str, Callable[[], object]],
+    **stream_kwargs,
+) -> AsyncIterator[Tuple[str, str, AgentExecutorResult]]:
+    """stream_subgraphs_with_tokens 의 graph.astream 버전"""
+    token_streams: Dict[str, _GraphTokenStream] = {}
+    stream_mode = _GraphTokenStream(state, token_filters).stream_mode
+
+    async for namespace, mode, chunk in graph.astream(
+        state, config=config, stream_mode=stream_mode, subgraphs=True, **stream_kwargs
+    ):
+        subgraph = _subgraph_name(namespace)
+        token_stream = token_streams.setdefault(
+            subgraph, _GraphTokenStream(state, token_filters)
+        )
+        for node_name, result in token_stream.convert_with_nodes(mode, chunk):
+            yield subgraph, node_name, result
+
+
+def _subgraph_name(namespace: tuple) -> str:
+    # namespace: ("<부모 노드>:<task id>", "<서브그래프 노드>:<task id>", ...)
+    return namespace[0].split(":")[0] if namespace else ""
@@ -1,7 +1,17 @@
-from .conversation_agent_graph import conversation_graph
+from tripmind.agents.common.graph_registry import CONVERSATION_GRAPH, graph_registry
 from ..common.types.agent_executor_type import AgentExecutorResult, BaseAgentExcutor
+from ..common.utils.token_stream import (
+    PlainTextTokenFilter,
+    astream_graph_with_tokens,
+    stream_graph_with_tokens,
+)
 from tripmind.services.session.session_manage_service import session_manage_service
 
+# LLM 토큰을 그대로 흘려보낼 노드
+TOKEN_STREAM_NODES = {
+    "conversation_node": PlainTextTokenFilter,
+}
+
 
 class ConversationAgentExecutor(BaseAgentExcutor):
     def process_prompt(
@@ -11,20 +21,38 @@ class ConversationAgentExecutor(BaseAgentExcutor):
         start_node: str = "greeting_node",
     ):
         try:
+            conversation_graph = graph_registry.get(CONVERSATION_GRAPH)
+            state, config = session_manage_service.get_session_state_and_config(
+                conversation_graph, prompt, start_node, session_id
+            )
+
+            yield from stream_graph_with_tokens(
+                conversation_graph, state, config, TOKEN_STREAM_NODES
+            )
+        except Exception as e:
+            yield AgentExecutorResult(
+                response=f"[대화 오류] {str(e)}",
+                messages=[],
+                context={},
+                streaming={},
+            )
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "greeting_node",
+    ):
+        try:
+            conversation_graph = graph_registry.get(CONVERSATION_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 conversation_graph, prompt, start_node, session_id
             )
 
-            for result in conversation_graph.stream(state, config=config):
-                if result:
-                    for node_name, node_state in result.items():
-                        state.update(node_state)
-                        yield AgentExecutorResult(
-                            response=node_state.get("response", ""),
-                            messages=node_state.get("messages", []),
-                            context=node_state.get("context", {}),
-                            streaming=node_state.get("streaming", {}),
-                        )
+            async for result in astream_graph_with_tokens(
+                conversation_graph, state, config, TOKEN_STREAM_NODES
+            ):
+                yield result
         except Exception as e:
             yield AgentExecutorResult(
                 response=f"[대화 오류] {str(e)}",
@@ -1,47 +1,40 @@
+from functools import partial
+
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from .nodes.router_node import router_node
-from .nodes.greeting_node import greeting_node, update_greeting_stream
-from .nodes.conversation_node import conversation_node, update_conversation_stream
+from .nodes.greeting_node import greeting_node
+from .nodes.conversation_node import aconversation_node, conversation_node
 from .types.conversation_state_type import ConversationState
-from ..common.nodes.node_wrapper import node_wrapper
-from tripmind.clients.llm.claude_client import claude_client
-from ..common.utils.validation_checker import should_continue_streaming
+from ..common.nodes.node_wrapper import node_wrapper, sync_async_node
+from tripmind.clients.llm.llm_client_factory import get_llm_client
+from tripmind.agents.common.graph_registry import CONVERSATION_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
+    llm_client = get_llm_client()
     wrapped_router_node = node_wrapper(router_node)
     wrapped_greeting_node = node_wrapper(greeting_node)
-    wrapped_conversation_node = node_wrapper(conversation_node)
-    wrapped_update_greeting_stream = node_wrapper(update_greeting_stream)
-    wrapped_update_conversation_stream = node_wrapper(update_conversation_stream)
+    # graph.astream 에서는 aconversation_node (ainvoke) 로 실행
+    wrapped_conversation_node = sync_async_node(
+        "conversation_node",
+        lambda state: conversation_node(llm_client, state),
+        partial(aconversation_node, llm_client),
+    )
     return {
         "router_node": wrapped_router_node,
         "greeting_node": wrapped_greeting_node,
         "conversation_node": wrapped_conversation_node,
-        "update_greeting_stream_node": wrapped_update_greeting_stream,
-        "update_conversation_stream_node": wrapped_update_conversation_stream,
     }
 
 
-def create_conversation_agent_graph():
-    memory = MemorySaver()
+def build_conversation_agent_graph() -> StateGraph:
     graph = StateGraph(ConversationState)
     wrapped_nodes = wrap_all_nodes()
 
     graph.add_node("router_node", wrapped_nodes["router_node"])
     graph.add_node("greeting_node", wrapped_nodes["greeting_node"])
-    graph.add_node(
-        "conversation_node",
-        lambda state: wrapped_nodes["conversation_node"](claude_client, state),
-    )
-    graph.add_node(
-        "update_greeting_stream_node", wrapped_nodes["update_greeting_stream_node"]
-    )
-    graph.add_node(
-        "update_conversation_stream_node",
-        wrapped_nodes["update_conversation_stream_node"],
-    )
+    graph.add_node("conversation_node", wrapped_nodes["conversation_node"])
 
     graph.set_entry_point("router_node")
 
@@ -53,41 +46,18 @@ def create_conversation_agent_graph():
             "conversation_node": "conversation_node",
         },
     )
-    graph.add_conditional_edges(
-        "greeting_node",
-        should_continue_streaming,
-        {
-            True: "update_greeting_stream_node",
-            False: END,
-        },
-    )
-    graph.add_conditional_edges(
-        "update_greeting_stream_node",
-        should_continue_streaming,
-        {
-            True: "update_greeting_stream_node",
-            False: END,
-        },
-    )
-    graph.add_conditional_edges(
-        "conversation_node",
-        should_continue_streaming,
-        {
-            True: "update_conversation_stream_node",
-            False: END,
-        },
-    )
-    graph.add_conditional_edges(
-        "update_conversation_stream_node",
-        should_continue_streaming,
-        {
-            True: "update_conversation_stream_node",
-            False: END,
-        },
-    )
+    graph.add_edge("greeting_node", END)
     graph.add_edge("conversation_node", END)
 
-    return graph.compile(checkpointer=memory)
+    return graph
+
+
+def create_conversation_agent_graph():
+    return build_conversation_agent_graph().compile(checkpointer=MemorySaver())
 
 
-conversation_graph = create_conversation_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "conversation_graph":
+        return graph_registry.get(CONVERSATION_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,8 @@
 import logging
-import time
+from tripmind.agents.common.utils.sync_executor import run_sync
 from pathlib import Path
 from tripmind.clients.llm.base_llm_client import BaseLLMClient
+from tripmind.clients.llm.single_flight import single_flight
 from tripmind.services.prompt.prompt_service import prompt_service
 from langchain.chains import LLMChain
 from tripmind.agents.conversation.types.conversation_state_type import ConversationState
@@ -16,96 +17,116 @@ def conversation_node(
     llm_client: BaseLLMClient, state: ConversationState
 ) -> ConversationState:
     try:
-
-        session_id = state.get("config_data", {}).get("thread_id", "default")
-        config = {"configurable": {"session_id": session_id}}
-        user_input = state["user_input"]
-        memory = session_manage_service.get_session_memory(
-            session_id,
-            memory_key="chat_history",
-            input_key="input",
-            output_key="output",
-        )
-        prompt = prompt_service.get_system_prompt(
-            str(PROMPT_DIR / "conversation/v1.yaml"),
-        )
-
-        prompt = prompt.partial(
-            model=llm_client.get_llm().model,
-        )
-
-        chain = LLMChain(
-            llm=llm_client.get_llm(),
-            prompt=prompt,
-            verbose=True,
-            output_key="output",
-        )
-
-        response = chain.invoke(
-            {
-                "input": user_input,
-                "chat_history": memory.load_memory_variables({}).get(
-                    "chat_history", []
-                ),
-                "agent_scratchpad": [],
-                "model": llm_client.get_llm().model,
-            },
-            config=config,
+        memory, user_input, chain, inputs, config = _prepare_chain_call(
+            llm_client, state
         )
+        inputs["chat_history"] = _load_chat_history(memory, user_input)
 
-        if isinstance(response, dict):
-            response_text = response["output"]
-        else:
-            response_text = str(response)
-
-        state["streaming"] = {
-            "message": response_text,
-            "current_position": 0,
-            "is_complete": False,
-        }
-
-        memory = session_manage_service.get_session_memory(
-            session_id,
-            memory_key="chat_history",
-            input_key="input",
-            output_key="output",
-        )
-        memory.save_context(
-            inputs={memory.input_key: user_input},
-            outputs={memory.output_key: response_text},
-        )
+        with single_flight.track() as flight:
+            response = chain.invoke(inputs, config=config)
 
-        current_message = response_text[: state["streaming"]["current_position"]]
-        state["messages"].append({"role": "assistant", "content": current_message})
-        state["next_node"] = "update_conversation_stream"
-        return ConversationState(**state)
+        response_text = _get_response_text(response)
+        # 중복 요청(합류한 실행)은 선행 요청이 이미 같은 턴을 저장하므로 건너뜀
+        if not flight.followed:
+            _save_turn(memory, user_input, response_text)
+        return _complete_state(state, response_text)
 
     except Exception as e:
-        logger.error(f"General error: {str(e)}")
-        logger.exception("Full stack trace:")
-        error_message = f"[대화 생성 오류] {str(e)}"
+        return _error_state(state, e)
 
-        state["messages"].append({"role": "assistant", "content": error_message})
-        state["response"] = error_message
-        return ConversationState(**state)
 
-
-def update_conversation_stream(state: ConversationState) -> ConversationState:
+async def aconversation_node(
+    llm_client: BaseLLMClient, state: ConversationState
+) -> ConversationState:
+    """
+    conversation_node 의 비동기 버전 (graph.astream).
+    체인을 ainvoke 로 실행해 LLM 응답을 기다리는 동안 스레드를 잡지 않는다.
+    메모리 로드 / 저장은 요약 LLM 호출이 있을 수 있어 공유 스레드 풀(run_sync)에서 실행한다.
+    """
     try:
-        streaming = state["streaming"]
-        if streaming["is_complete"]:
-            return state
-
-        chunk_size = 20
-        current_pos = streaming["current_position"]
-        next_pos = min(current_pos + chunk_size, len(streaming["message"]))
-        streaming["current_position"] = next_pos
-        streaming["is_complete"] = next_pos >= len(streaming["message"])
-        current_message = streaming["message"][:next_pos]
-        state["messages"][-1]["content"] = current_message
-        state["next_node"] = "update_conversation_stream"
-        time.sleep(1)
-        return state
+        memory, user_input, chain, inputs, config = _prepare_chain_call(
+            llm_client, state
+        )
+        inputs["chat_history"] = await run_sync(_load_chat_history, memory, user_input)
+
+        with single_flight.track() as flight:
+            response = await chain.ainvoke(inputs, config=config)
+
+        response_text = _get_response_text(response)
+        if not flight.followed:
+            await run_sync(_save_turn, memory, user_input, response_text)
+        return _complete_state(state, response_text)
 
     except Exception as e:
-        return state
+        return _error_state(state, e)
+
+
+def _prepare_chain_call(llm_client: BaseLLMClient, state: ConversationState):
+    """세션 메모리, 사용자 입력, 대화 체인과 체인 입력 / config"""
+    session_id = state.get("config_data", {}).get("thread_id", "default")
+    config = {"configurable": {"session_id": session_id}}
+    user_input = state["user_input"]
+    memory = session_manage_service.get_session_memory(
+        session_id,
+        memory_key="chat_history",
+        input_key="input",
+        output_key="output",
+        node_name="conversation_node",
+    )
+    prompt = prompt_service.get_system_prompt(
+        str(PROMPT_DIR / "conversation/v1.yaml"),
+        partial_variables={"model": llm_client.get_llm("conversation_node").model},
+    )
+
+    chain = LLMChain(
+        llm=llm_client.get_llm("conversation_node"),
+        prompt=prompt,
+        verbose=True,
+        output_key="output",
+    )
+
+    inputs = {
+        "input": user_input,
+        "agent_scratchpad": [],
+        "model": llm_client.get_llm("conversation_node").model,
+    }
+    config = {**config, "metadata": prompt_service.get_run_metadata(prompt)}
+    return memory, user_input, chain, inputs, config
+
+
+def _load_chat_history(memory, user_input: str) -> list:
+    return memory.load_memory_variables({"input": user_input}).get("chat_history", [])
+
+
+def _save_turn(memory, user_input: str, response_text: str):
+    memory.save_context(
+        inputs={memory.input_key: user_input},
+        outputs={memory.output_key: response_text},
+    )
+
+
+def _get_response_text(response) -> str:
+    if isinstance(response, dict):
+        return response["output"]
+    return str(response)
+
+
+def _complete_state(state: ConversationState, response_text: str) -> ConversationState:
+    state["streaming"] = {
+        "message": response_text,
+        "current_position": len(response_text),
+        "is_complete": True,
+    }
+    state["messages"].append({"role": "assistant", "content": response_text})
+    state["next_node"] = "conversation_node"
+    return ConversationState(**state)
+
+
+def _error_state(state: ConversationState, e: Exception) -> ConversationState:
+    logger.error(f"General error: {str(e)}")
+    logger.exception("Full stack trace:")
+    error_message = f"[대화 생성 오류] {str(e)}"
+
+    state["messages"].append({"role": "assistant", "content": error_message})
+    state["response"] = error_message
+    return ConversationState(**state)
@@ -1,6 +1,5 @@
 from pathlib import Path
 import logging
-import time
 
 from tripmind.services.prompt.prompt_service import prompt_service
 from tripmind.agents.conversation.types.conversation_state_type import ConversationState
@@ -18,24 +17,24 @@ def greeting_node(state: ConversationState) -> ConversationState:
 
     state["streaming"] = {
         "message": greeting_msg,
-        "current_position": 0,
-        "is_complete": False,
+        "current_position": len(greeting_msg),
+        "is_complete": True,
     }
 
-    current_message = greeting_msg[: state["streaming"]["current_position"]]
     state["messages"].append(
         {
             "role": "assistant",
-            "content": current_message,
+            "content": greeting_msg,
         }
     )
-    state["next_node"] = "update_greeting_stream"
+    state["next_node"] = "greeting_node"
 
     memory = session_manage_service.get_session_memory(
         session_id,
         memory_key="chat_history",
         input_key="input",
         output_key="output",
+        node_name="greeting_node",
     )
     memory.save_context(
         inputs={memory.input_key: user_input},
@@ -43,30 +42,3 @@ def greeting_node(state: ConversationState) -> ConversationState:
     )
     state = ConversationState(**state)
     return state
-
-
-def update_greeting_stream(state: ConversationState) -> ConversationState:
-    try:
-        if "streaming" not in state:
-            state["streaming"] = {
-                "message": "안녕하세요! 트립마인드입니다.",
-                "current_position": 0,
-                "is_complete": False,
-            }
-            return state
-        streaming = state["streaming"]
-        if streaming["is_complete"]:
-            return state
-
-        chunk_size = 50
-        current_pos = streaming["current_position"]
-        next_pos = min(current_pos + chunk_size, len(streaming["message"]))
-        streaming["current_position"] = next_pos
-        streaming["is_complete"] = next_pos >= len(streaming["message"])
-        current_message = streaming["message"][:next_pos]
-        state["messages"][-1]["content"] = current_message
-        state["next_node"] = "update_greeting_stream"
-        time.sleep(1)  # 1초 대기
-        return state
-    except Exception as e:
-        return state
@@ -1,11 +1,27 @@
-from tripmind.agents.itinerary.itinerary_agent_graph import itinerary_graph
+from tripmind.agents.common.graph_registry import ITINERARY_GRAPH, graph_registry
 from tripmind.agents.common.types.agent_executor_type import (
     AgentExecutorResult,
     BaseAgentExcutor,
 )
+from tripmind.agents.common.utils.token_stream import (
+    JsonStringFieldTokenFilter,
+    astream_graph_with_tokens,
+    stream_graph_with_tokens,
+)
 from tripmind.services.session.session_manage_service import session_manage_service
 import traceback
 
+# structured chat agent 는 JSON action blob 을 생성하므로
+# 사용자에게 보여줄 문자열 필드(FinalResponse.natural_text, Final Answer)만 흘려보낸다
+# (tool calling agent 의 FinalResponse 입력도 tool_call_chunks 의 JSON 으로 들어옴).
+# 문자열 action_input 은 도구 입력(예: SearchPlaces 검색어)일 수 있으므로 Final Answer 일 때만
+TOKEN_STREAM_NODES = {
+    "itinerary_node": lambda: JsonStringFieldTokenFilter(
+        ["natural_text", "action_input"],
+        conditions={"action_input": ("action", "Final Answer")},
+    ),
+}
+
 
 class ItineraryAgentExecutor(BaseAgentExcutor):
     def process_prompt(
@@ -15,24 +31,38 @@ class ItineraryAgentExecutor(BaseAgentExcutor):
         start_node: str = "ask_info_node",
     ):
         try:
+            itinerary_graph = graph_registry.get(ITINERARY_GRAPH)
+            state, config = session_manage_service.get_session_state_and_config(
+                itinerary_graph, prompt, start_node, session_id
+            )
+
+            yield from stream_graph_with_tokens(
+                itinerary_graph, state, config, TOKEN_STREAM_NODES
+            )
+        except Exception as e:
+            traceback.print_exc()
+            yield AgentExecutorResult(
+                response=f"[여행 일정 생성 오류] {str(e)}",
+                messages=[],
+                context={},
+            )
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "ask_info_node",
+    ):
+        try:
+            itinerary_graph = graph_registry.get(ITINERARY_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 itinerary_graph, prompt, start_node, session_id
             )
 
-            for result in itinerary_graph.stream(
-                state, config={**config, "recursion_limit": 150}
+            async for result in astream_graph_with_tokens(
+                itinerary_graph, state, config, TOKEN_STREAM_NODES
             ):
-                if result:
-                    for _, node_state in result.items():
-                        state.update(node_state)
-                        yield AgentExecutorResult(
-                            response=node_state.get("response", ""),
-                            messages=node_state.get("messages", []),
-                            context=node_state.get("context", {}),
-                            intent=node_state.get("intent", ""),
-                            next_node=node_state.get("next_node", ""),
-                            streaming=node_state.get("streaming", {}),
-                        )
+                yield result
         except Exception as e:
             traceback.print_exc()
             yield AgentExecutorResult(
@@ -1,44 +1,43 @@
+from functools import partial
+
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
 from tripmind.agents.itinerary.nodes.ask_info_node import ask_info_node
 from .types.itinerary_state_type import ItineraryState
-from .nodes.itinerary_node import itinerary_node, update_itinerary_stream
-from tripmind.agents.common.nodes.node_wrapper import node_wrapper
-from tripmind.clients.llm.claude_client import claude_client
-from ..common.utils.validation_checker import should_continue_streaming
+from .nodes.itinerary_node import aitinerary_node, itinerary_node
+from tripmind.agents.common.nodes.node_wrapper import node_wrapper, sync_async_node
+from tripmind.clients.llm.llm_client_factory import get_llm_client
 from .nodes.itinerary_list_node import itinerary_list_node
 from .nodes.router_node import router_node
+from tripmind.agents.common.graph_registry import ITINERARY_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
-    wrapped_itinerary_node = node_wrapper(
-        lambda state: itinerary_node(claude_client, state)
+    llm_client = get_llm_client()
+    # graph.astream 에서는 aitinerary_node (ainvoke) 로 실행
+    wrapped_itinerary_node = sync_async_node(
+        "itinerary_node",
+        lambda state: itinerary_node(llm_client, state),
+        partial(aitinerary_node, llm_client),
     )
     wrapped_ask_info_node = node_wrapper(ask_info_node)
-    wrapped_update_itinerary_stream = node_wrapper(update_itinerary_stream)
     wrapped_itinerary_list_node = node_wrapper(itinerary_list_node)
     wrapped_router_node = node_wrapper(router_node)
     return {
         "itinerary_node": wrapped_itinerary_node,
-        "update_itinerary_stream_node": wrapped_update_itinerary_stream,
         "ask_info_node": wrapped_ask_info_node,
         "itinerary_list_node": wrapped_itinerary_list_node,
         "router_node": wrapped_router_node,
     }
 
 
-def create_itinerary_agent_graph():
-    memory = MemorySaver()
-
+def build_itinerary_agent_graph() -> StateGraph:
     graph = StateGraph(ItineraryState)
 
     wrapped_nodes = wrap_all_nodes()
 
     graph.add_node("itinerary_node", wrapped_nodes["itinerary_node"])
-    graph.add_node(
-        "update_itinerary_stream_node", wrapped_nodes["update_itinerary_stream_node"]
-    )
     graph.add_node("ask_info_node", wrapped_nodes["ask_info_node"])
     graph.add_node("itinerary_list_node", wrapped_nodes["itinerary_list_node"])
     graph.add_node("router_node", wrapped_nodes["router_node"])
@@ -61,25 +60,18 @@ def create_itinerary_agent_graph():
         ),
     )
 
-    graph.add_conditional_edges(
-        "itinerary_node",
-        should_continue_streaming,
-        {
-            True: "update_itinerary_stream_node",
-            False: END,
-        },
-    )
-
-    graph.add_conditional_edges(
-        "update_itinerary_stream_node",
-        should_continue_streaming,
-        {
-            True: "update_itinerary_stream_node",
-            False: END,
-        },
-    )
+    graph.add_edge("itinerary_node", END)
     graph.add_edge("itinerary_list_node", END)
-    return graph.compile(checkpointer=memory)
+
+    return graph
+
+
+def create_itinerary_agent_graph():
+    return build_itinerary_agent_graph().compile(checkpointer=MemorySaver())
 
 
-itinerary_graph = create_itinerary_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "itinerary_graph":
+        return graph_registry.get(ITINERARY_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 from tripmind.agents.itinerary.types.itinerary_state_type import ItineraryState
 from tripmind.agents.itinerary.utils.extract_info import extract_travel_info
+from tripmind.services.place_search.place_prefetcher import place_prefetcher
 
 
 def ask_info_node(state: ItineraryState) -> ItineraryState:
@@ -18,6 +19,9 @@ def ask_info_node(state: ItineraryState) -> ItineraryState:
         if value:
             context[key] = value
 
+    # 일정 LLM 이 응답을 만드는 동안 여행지 주요 장소를 미리 검색 (SearchPlaces 캐시 적중)
+    place_prefetcher.prefetch(context.get("destination"))
+
     # if len(missing_info) > 0:
     #     msg = f"여행 일정을 만들기 위해 {', '.join(missing_info)}에 대한 정보가 필요합니다. 알려주실 수 있나요? (ex: 서울지역 or 3박 4일 )"
     #     messages.append({"role": "assistant", "content": msg})
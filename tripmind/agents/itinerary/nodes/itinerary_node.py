@@ -1,20 +1,26 @@
-import os
-import time
 import logging
+from tripmind.agents.common.utils.sync_executor import run_sync
 from tripmind.agents.itinerary.tools.calendar_tool import get_calendar_tools
 from tripmind.agents.itinerary.tools.place_search_tool import get_place_search_tools
-from tripmind.clients.calendar.google_calendar_client import GoogleCalendarClient
 from tripmind.clients.llm.base_llm_client import BaseLLMClient
-from tripmind.services.calendar.google_calendar_service import GoogleCalendarService
+from tripmind.clients.llm.latency_policy import latency_guard
+from tripmind.clients.llm.single_flight import single_flight
+from tripmind.services.calendar.google_calendar_service import (
+    get_google_calendar_service,
+)
 from tripmind.services.prompt.prompt_service import prompt_service
 from tripmind.agents.itinerary.types.itinerary_state_type import ItineraryState
 from tripmind.services.place_search.kakao_place_search_service import (
-    KakaoPlaceSearchService,
+    get_kakao_place_search_service,
 )
-from tripmind.clients.place_search.kakao_place_client import KakaoPlaceClient
-from typing import Dict, Any, List
+from tripmind.utils.component_registry import component_registry
+from typing import List, Optional
 from pathlib import Path
-from langchain.agents import AgentExecutor, create_structured_chat_agent
+from django.conf import settings
+from langchain.agents import create_structured_chat_agent, create_tool_calling_agent
+from tripmind.agents.common.utils.parallel_tool_executor import (
+    ParallelToolAgentExecutor,
+)
 from tripmind.services.session.session_manage_service import session_manage_service
 from langchain.tools import StructuredTool
 from tripmind.agents.itinerary.tools.final_response_tool import FinalResponseTool
@@ -24,116 +30,181 @@ from tripmind.agents.sharing.utils.extract_info import extract_share_request
 logger = logging.getLogger(__name__)
 PROMPT_DIR = Path(__file__).parent / "../prompt_templates"
 
+STRUCTURED_CHAT_AGENT = "structured_chat"
+TOOL_CALLING_AGENT = "tool_calling"
+
+# agent_type 별 시스템 프롬프트 템플릿
+ITINERARY_PROMPT_TEMPLATES = {
+    STRUCTURED_CHAT_AGENT: PROMPT_DIR / "itinerary/v4.yaml",
+    TOOL_CALLING_AGENT: PROMPT_DIR / "itinerary/tool_calling_v1.yaml",
+}
+
 
 def itinerary_node(llm_client: BaseLLMClient, state: ItineraryState) -> ItineraryState:
     try:
-        session_id = state.get("config_data", {}).get("thread_id", "default")
-        memory = session_manage_service.get_session_memory(
-            session_id,
-            memory_key="chat_history",
-            input_key="input",
-            output_key="output",
+        memory, full_prompt, agent_executor, inputs, config = _prepare_agent_call(
+            llm_client, state
         )
+        inputs["chat_history"] = _load_chat_history(memory, full_prompt)
 
-        full_prompt = _get_full_prompt(state)
+        with single_flight.track() as flight:
+            result = agent_executor.invoke(inputs, config=config)
 
-        place_search_tools = get_place_search_tools(
-            KakaoPlaceSearchService(KakaoPlaceClient(os.getenv("KAKAO_REST_KEY")))
-        )
-        calendar_tools = get_calendar_tools(
-            GoogleCalendarService(
-                GoogleCalendarClient(
-                    os.getenv("GOOGLE_CALENDAR_ID"),
-                    os.getenv("GOOGLE_CREDENTIALS_PATH"),
-                )
-            )
-        )
+        response_text = _get_response_text(state, result)
+        # 중복 요청(합류한 실행)은 선행 요청이 이미 같은 턴을 저장하므로 건너뜀
+        if not flight.followed:
+            _save_turn(memory, full_prompt, response_text)
+        return _complete_state(state, response_text)
 
-        tools = place_search_tools + calendar_tools + [FinalResponseTool]
-
-        tool_descriptions = "\n".join(
-            [f"Tool: {tool.name}\nDescription: {tool.description}\n" for tool in tools]
-        )
-        tool_names = [tool.name for tool in tools]
-
-        agent_executor = create_itinerary_node_agent(
-            llm_client, state, tools, tool_descriptions, tool_names
-        )
+    except Exception as e:
+        _append_error(state, e)
+        raise e
 
-        config = {
-            "configurable": {"session_id": session_id},
-        }
 
-        result = agent_executor.invoke(
-            {
-                "input": full_prompt,
-                "chat_history": memory.load_memory_variables({}).get(
-                    "chat_history", []
-                ),
-                "tools": tool_descriptions,
-                "tool_names": ", ".join(tool_names),
-                "agent_scratchpad": [],
-            },
-            config=config,
+async def aitinerary_node(
+    llm_client: BaseLLMClient, state: ItineraryState
+) -> ItineraryState:
+    """
+    itinerary_node 의 비동기 버전 (graph.astream).
+    에이전트 실행기를 ainvoke 로 실행해 LLM 응답을 기다리는 동안 스레드를 잡지 않는다.
+    메모리 로드 / 저장은 요약 LLM 호출이 있을 수 있어 공유 스레드 풀(run_sync)에서 실행한다.
+    """
+    try:
+        memory, full_prompt, agent_executor, inputs, config = _prepare_agent_call(
+            llm_client, state
         )
+        inputs["chat_history"] = await run_sync(_load_chat_history, memory, full_prompt)
 
-        if isinstance(result, dict):
-            response_text = result.get("output", "")
-        else:
-            response_text = str(result)
-
-        share_request = extract_share_request(response_text)
-        if share_request:
-            response_text = sharing_service.get_share_request(
-                state.get("user_input", ""),
-                response_text,
-                state.get("context", {}),
-                state.get("config_data", {}).get("base_url", "localhost:8000"),
-            )
-
-        state["streaming"] = {
-            "message": response_text,
-            "current_position": 0,
-            "is_complete": False,
-        }
-
-        memory.save_context(
-            inputs={memory.input_key: full_prompt},
-            outputs={memory.output_key: response_text},
-        )
+        with single_flight.track() as flight:
+            result = await agent_executor.ainvoke(inputs, config=config)
 
-        current_message = response_text[: state["streaming"]["current_position"]]
-        state["messages"].append({"role": "assistant", "content": current_message})
-        state["next_node"] = "update_itinerary_stream"
-        return ItineraryState(**state)
+        response_text = _get_response_text(state, result)
+        if not flight.followed:
+            await run_sync(_save_turn, memory, full_prompt, response_text)
+        return _complete_state(state, response_text)
 
     except Exception as e:
-        logger.error(f"General error: {str(e)}")
-        logger.exception("Full stack trace:")
-        error_response = f"[여행 일정 생성 오류] {str(e)}"
-        state["messages"].append({"role": "assistant", "content": error_response})
+        _append_error(state, e)
         raise e
 
 
-def update_itinerary_stream(state: ItineraryState) -> ItineraryState:
-    try:
-        streaming = state["streaming"]
-        if streaming["is_complete"]:
-            return state
-
-        chunk_size = 50
-        current_pos = streaming["current_position"]
-        next_pos = min(current_pos + chunk_size, len(streaming["message"]))
-        streaming["current_position"] = next_pos
-        streaming["is_complete"] = next_pos >= len(streaming["message"])
-        current_message = streaming["message"][:next_pos]
-        state["messages"][-1]["content"] = current_message
-        state["next_node"] = "update_itinerary_stream"
-        time.sleep(1)
-        return state
+def _prepare_agent_call(llm_client: BaseLLMClient, state: ItineraryState):
+    """세션 메모리, 전체 프롬프트, 공유 실행기와 실행기 입력 / config"""
+    session_id = state.get("config_data", {}).get("thread_id", "default")
+    memory = session_manage_service.get_session_memory(
+        session_id,
+        memory_key="chat_history",
+        input_key="input",
+        output_key="output",
+        node_name="itinerary_node",
+    )
 
-    except Exception as e:
-        return state
+    full_prompt = _get_full_prompt(state)
+
+    tools = get_itinerary_tools()
+    tool_descriptions, tool_names = get_tool_descriptions(tools)
+
+    # 도구 / 에이전트 실행기는 프로세스 공유, 세션별 대화 기록만 요청마다 주입
+    agent_executor = get_itinerary_agent_executor(llm_client)
+
+    config = {
+        "configurable": {"session_id": session_id},
+        "metadata": agent_executor.metadata or {},
+    }
+    inputs = {
+        "input": full_prompt,
+        "tools": tool_descriptions,
+        "tool_names": ", ".join(tool_names),
+        "agent_scratchpad": [],
+    }
+    return memory, full_prompt, agent_executor, inputs, config
+
+
+def _load_chat_history(memory, full_prompt: str) -> list:
+    return memory.load_memory_variables({"input": full_prompt}).get("chat_history", [])
+
+
+def _save_turn(memory, full_prompt: str, response_text: str):
+    memory.save_context(
+        inputs={memory.input_key: full_prompt},
+        outputs={memory.output_key: response_text},
+    )
+
+
+def _get_response_text(state: ItineraryState, result) -> str:
+    if isinstance(result, dict):
+        response_text = result.get("output", "")
+    else:
+        response_text = str(result)
+
+    share_request = extract_share_request(response_text)
+    if share_request:
+        response_text = sharing_service.get_share_request(
+            state.get("user_input", ""),
+            response_text,
+            state.get("context", {}),
+            state.get("config_data", {}).get("base_url", "localhost:8000"),
+        )
+    return response_text
+
+
+def _complete_state(state: ItineraryState, response_text: str) -> ItineraryState:
+    state["streaming"] = {
+        "message": response_text,
+        "current_position": len(response_text),
+        "is_complete": True,
+    }
+    state["messages"].append({"role": "assistant", "content": response_text})
+    state["next_node"] = "itinerary_node"
+    return ItineraryState(**state)
+
+
+def _append_error(state: ItineraryState, e: Exception):
+    logger.error(f"General error: {str(e)}")
+    logger.exception("Full stack trace:")
+    error_response = f"[여행 일정 생성 오류] {str(e)}"
+    state["messages"].append({"role": "assistant", "content": error_response})
+
+
+def get_itinerary_tools() -> List[StructuredTool]:
+    """일정 에이전트 도구 (프로세스 공유, 장소 검색 / 캘린더 서비스도 공유 인스턴스)"""
+    return component_registry.get(
+        "itinerary_tools",
+        lambda: get_place_search_tools(get_kakao_place_search_service())
+        + get_calendar_tools(get_google_calendar_service())
+        + [FinalResponseTool],
+    )
+
+
+def get_tool_descriptions(tools: List[StructuredTool]):
+    tool_descriptions = "\n".join(
+        [f"Tool: {tool.name}\nDescription: {tool.description}\n" for tool in tools]
+    )
+    return tool_descriptions, [tool.name for tool in tools]
+
+
+def get_itinerary_agent_executor(
+    llm_client: BaseLLMClient, agent_type: Optional[str] = None
+) -> ParallelToolAgentExecutor:
+    """
+    agent_type 별로 한 번만 만드는 공유 실행기 (memory 없음).
+    대화 기록은 호출 시 chat_history 로 넘기고 itinerary_node 가 직접 저장한다.
+    프롬프트 파일이 수정되면 (mtime 변경) 실행기를 다시 만든다.
+    """
+    agent_type = agent_type or settings.ITINERARY_AGENT_TYPE
+    template_path = ITINERARY_PROMPT_TEMPLATES.get(agent_type)
+    version = (
+        prompt_service.get_template_version(template_path) if template_path else None
+    )
+
+    def build():
+        tools = get_itinerary_tools()
+        tool_descriptions, tool_names = get_tool_descriptions(tools)
+        return build_itinerary_agent_executor(
+            llm_client, tools, tool_descriptions, tool_names, agent_type
+        )
+
+    return component_registry.get(f"itinerary_agent:{agent_type}", build, version)
 
 
 def create_itinerary_node_agent(
@@ -142,36 +213,67 @@ def create_itinerary_node_agent(
     tools: List[StructuredTool],
     tool_descriptions: str,
     tool_names: List[str],
-) -> Dict[str, Any]:
+    agent_type: Optional[str] = None,
+) -> ParallelToolAgentExecutor:
+    """세션 대화 기록(memory)을 붙인 실행기를 새로 만든다 (벤치마크 / 테스트용)"""
     session_id = state.get("config_data", {}).get("thread_id", "default")
-    system_prompt = prompt_service.get_system_prompt(
-        str(PROMPT_DIR / "itinerary/v3.yaml"),
+    agent_executor = build_itinerary_agent_executor(
+        llm_client, tools, tool_descriptions, tool_names, agent_type
     )
-    system_prompt = system_prompt.partial(
-        model=llm_client.get_llm().model,
-        tools=tool_descriptions,
-        tool_names=", ".join(tool_names),
+    agent_executor.memory = session_manage_service.get_session_memory(
+        session_id,
+        memory_key="chat_history",
+        input_key="input",
+        output_key="output",
+        node_name="itinerary_node",
     )
+    return agent_executor
 
-    agent = create_structured_chat_agent(
-        llm=llm_client.get_llm(), tools=tools, prompt=system_prompt
-    )
-    memory = session_manage_service.get_session_memory(
-        session_id, memory_key="chat_history", input_key="input", output_key="output"
-    )
 
-    agent_executor = AgentExecutor(
+def build_itinerary_agent_executor(
+    llm_client: BaseLLMClient,
+    tools: List[StructuredTool],
+    tool_descriptions: str,
+    tool_names: List[str],
+    agent_type: Optional[str] = None,
+) -> ParallelToolAgentExecutor:
+    """
+    agent_type (기본값 ITINERARY_AGENT_TYPE 설정)
+    - structured_chat: 모델이 JSON action blob 을 텍스트로 생성 (파싱 실패 시 재호출)
+    - tool_calling: 도구를 API 의 tools 로 바인딩해 네이티브 tool use 로 호출
+    """
+    agent_type = agent_type or settings.ITINERARY_AGENT_TYPE
+    llm = llm_client.get_llm("itinerary_node")
+
+    if agent_type == TOOL_CALLING_AGENT:
+        system_prompt = prompt_service.get_tool_calling_prompt(
+            str(ITINERARY_PROMPT_TEMPLATES[TOOL_CALLING_AGENT]),
+            partial_variables={"model": llm.model},
+        )
+        agent = create_tool_calling_agent(llm=llm, tools=tools, prompt=system_prompt)
+    elif agent_type == STRUCTURED_CHAT_AGENT:
+        system_prompt = prompt_service.get_system_prompt(
+            str(ITINERARY_PROMPT_TEMPLATES[STRUCTURED_CHAT_AGENT]),
+            partial_variables={
+                "model": llm.model,
+                "tools": tool_descriptions,
+                "tool_names": ", ".join(tool_names),
+            },
+        )
+        agent = create_structured_chat_agent(llm=llm, tools=tools, prompt=system_prompt)
+    else:
+        raise ValueError(f"지원하지 않는 ITINERARY_AGENT_TYPE 입니다: {agent_type}")
+
+    return ParallelToolAgentExecutor(
         agent=agent,
         tools=tools,
-        memory=memory,
         verbose=True,
         handle_parsing_errors=True,
-        max_execution_time=None,
+        max_execution_time=latency_guard.get_policy("itinerary_node").budget,
         early_stopping_method="force",
+        metadata=prompt_service.get_run_metadata(system_prompt),
     )
 
-    return agent_executor
-
 
 def _get_full_prompt(state: ItineraryState) -> str:
     user_input = state.get("user_input", "")
@@ -4,6 +4,7 @@ from tripmind.services.place_search.base_place_search_service import PlaceSearch
 from tripmind.agents.itinerary.types.place_search_tool_type import (
     SearchPlacesInput,
 )
+from tripmind.services.place_search.place_search_cache import place_search_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,10 @@ def get_place_search_tools(
 
         try:
             logger.debug(f"검색 도구 호출됨: query={keyword}, location={location}")
-            places = place_search_service.search_places(keyword, location)
+            # 선검색(place_prefetcher)된 키워드면 캐시 결과를 쓰거나 진행 중인 검색을 기다린다
+            places = place_search_cache.get_or_fetch(
+                keyword, lambda: place_search_service.search_places(keyword, location)
+            )
             if not places:
                 return f"'{keyword}'에 대한 검색 결과가 없습니다."
 
@@ -54,7 +58,7 @@ def get_place_search_tools(
                 "반드시 자연어를 제외한 입력 형식(JSON):\n"
                 "동일한 도구는 3번 이상 사용을 절대 금지합니다.\n"
                 "{\n"
-                '  "keyword": "검색할 키워드 (예: 경복궁)",\n'
+                '  "keyword": "검색할 키워드 (예: 경복궁, 제주 맛집, 제주 카페)",\n'
                 '  "location": "37.5704,126.9768"  // 생략 가능\n'
                 "}\n"
                 "예시:\n"
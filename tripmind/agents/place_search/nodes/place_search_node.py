@@ -1,13 +1,10 @@
-import os
 import logging
-import time
 
 from tripmind.agents.place_search.utils.query_builder import build_search_query
 from tripmind.services.place_search.kakao_place_search_service import (
-    KakaoPlaceSearchService,
+    get_kakao_place_search_service,
 )
 from tripmind.services.session.session_manage_service import session_manage_service
-from tripmind.clients.place_search.kakao_place_client import KakaoPlaceClient
 from ..types.place_search_state_type import (
     PlaceSearchState,
     PlaceSearchContext,
@@ -31,9 +28,7 @@ def place_search_node(state: PlaceSearchState) -> PlaceSearchState:
             parsed_info.get("count"),
         )
 
-        kakao_place_search_service = KakaoPlaceSearchService(
-            KakaoPlaceClient(os.getenv("KAKAO_REST_KEY"))
-        )
+        kakao_place_search_service = get_kakao_place_search_service()
         search_results = kakao_place_search_service.search_places(
             query=query, location=location, size=int(count or 5)
         )
@@ -54,14 +49,14 @@ def place_search_node(state: PlaceSearchState) -> PlaceSearchState:
             )
         )
 
-        current_message = response_text[:0]
-        message = messages + [{"role": "assistant", "content": current_message}]
+        message = messages + [{"role": "assistant", "content": response_text}]
 
         memory = session_manage_service.get_session_memory(
             session_id,
             memory_key="chat_history",
             input_key="input",
             output_key="output",
+            node_name="place_search_node",
         )
         memory.save_context(
             inputs={memory.input_key: user_input},
@@ -72,41 +67,14 @@ def place_search_node(state: PlaceSearchState) -> PlaceSearchState:
             messages=message,
             parsed_info=parsed_info,
             context=place_search_context,
-            next_node="update_place_search_stream",
+            next_node="place_search_node",
             streaming={
                 "message": response_text,
-                "current_position": 0,
-                "is_complete": False,
+                "current_position": len(response_text),
+                "is_complete": True,
             },
         )
 
     except Exception as e:
         logger.error(f"장소 검색 오류: {str(e)}")
         raise RuntimeError(f"[PlaceSearchNode] 오류 발생: {str(e)}")
-
-
-def update_place_search_stream(state: PlaceSearchState) -> PlaceSearchState:
-    try:
-        streaming = state.get("streaming", {})
-        messages = state.get("messages", [])
-
-        if streaming["is_complete"]:
-            return state
-
-        chunk_size = 20
-        current_pos = streaming["current_position"]
-        next_pos = min(current_pos + chunk_size, len(streaming["message"]))
-
-        streaming["current_position"] = next_pos
-
-        streaming["is_complete"] = next_pos >= len(streaming["message"])
-        current_message = streaming["message"][:next_pos]
-
-        messages[-1]["content"] = current_message
-
-        state["messages"] = messages
-        state["next_node"] = "update_place_search_stream"
-        time.sleep(1)  # 1초 대기
-        return PlaceSearchState(**state)
-    except Exception as e:
-        return state
@@ -1,6 +1,7 @@
 from tripmind.agents.place_search.types.place_search_state_type import PlaceSearchState
-from .place_search_agent_graph import place_search_graph
+from tripmind.agents.common.graph_registry import PLACE_SEARCH_GRAPH, graph_registry
 from ..common.types.agent_executor_type import AgentExecutorResult, BaseAgentExcutor
+from ..common.utils.token_stream import astream_graph_with_tokens
 from tripmind.services.session.session_manage_service import session_manage_service
 
 
@@ -12,15 +13,14 @@ class PlaceSearchAgentExecutor(BaseAgentExcutor):
         start_node: str = "ask_info_node",
     ):
         try:
+            place_search_graph = graph_registry.get(PLACE_SEARCH_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 place_search_graph, prompt, start_node, session_id
             )
 
             place_search_state = PlaceSearchState(**state)
 
-            for result in place_search_graph.stream(
-                place_search_state, config={**config, "recursion_limit": 100}
-            ):
+            for result in place_search_graph.stream(place_search_state, config=config):
                 if result:
                     for _, node_state in result.items():
                         state.update(node_state)
@@ -37,3 +37,29 @@ class PlaceSearchAgentExecutor(BaseAgentExcutor):
                 context={},
                 streaming={},
             )
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "ask_info_node",
+    ):
+        try:
+            place_search_graph = graph_registry.get(PLACE_SEARCH_GRAPH)
+            state, config = session_manage_service.get_session_state_and_config(
+                place_search_graph, prompt, start_node, session_id
+            )
+
+            place_search_state = PlaceSearchState(**state)
+
+            async for result in astream_graph_with_tokens(
+                place_search_graph, place_search_state, config, {}
+            ):
+                yield result
+        except Exception as e:
+            yield AgentExecutorResult(
+                response=f"[대화 오류] {str(e)}",
+                messages=[],
+                context={},
+                streaming={},
+            )
@@ -3,39 +3,28 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from tripmind.agents.place_search.types.place_search_state_type import PlaceSearchState
 from ..place_search.nodes.ask_info_node import ask_info_node
-from ..place_search.nodes.place_search_node import (
-    place_search_node,
-    update_place_search_stream,
-)
+from ..place_search.nodes.place_search_node import place_search_node
 from ..common.nodes.node_wrapper import node_wrapper
-from ..common.utils.validation_checker import should_continue_streaming
+from tripmind.agents.common.graph_registry import PLACE_SEARCH_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
     wrapped_ask_info_node = node_wrapper(ask_info_node)
     wrapped_place_search_node = node_wrapper(place_search_node)
-    wrapped_update_place_search_stream = node_wrapper(update_place_search_stream)
     return {
         "ask_info_node": wrapped_ask_info_node,
         "place_search_node": wrapped_place_search_node,
-        "update_place_search_stream_node": wrapped_update_place_search_stream,
     }
 
 
 # 그래프 생성
-def create_place_search_agent_graph():
-    memory = MemorySaver()
-
+def build_place_search_agent_graph() -> StateGraph:
     graph = StateGraph(PlaceSearchState)
 
     wrapped_nodes = wrap_all_nodes()
 
     graph.add_node("ask_info_node", wrapped_nodes["ask_info_node"])
     graph.add_node("place_search_node", wrapped_nodes["place_search_node"])
-    graph.add_node(
-        "update_place_search_stream_node",
-        wrapped_nodes["update_place_search_stream_node"],
-    )
 
     graph.set_entry_point("ask_info_node")
     graph.add_conditional_edges(
@@ -47,26 +36,17 @@ def create_place_search_agent_graph():
         ),
     )
 
-    graph.add_conditional_edges(
-        "place_search_node",
-        should_continue_streaming,
-        {
-            True: "update_place_search_stream_node",
-            False: END,
-        },
-    )
-    graph.add_conditional_edges(
-        "update_place_search_stream_node",
-        should_continue_streaming,
-        {
-            True: "update_place_search_stream_node",
-            False: END,
-        },
-    )
-
     graph.add_edge("place_search_node", END)
 
-    return graph.compile(checkpointer=memory)
+    return graph
+
+
+def create_place_search_agent_graph():
+    return build_place_search_agent_graph().compile(checkpointer=MemorySaver())
 
 
-place_search_graph = create_place_search_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "place_search_graph":
+        return graph_registry.get(PLACE_SEARCH_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 
 
@@ -66,3 +67,17 @@ INTENT_TO_NODE_MAP = {
     Intent.UNKNOWN: "classify_intent_node",
     Intent.GREETING: "greeting_node",
 }
+
+# 규칙 기반 분류 신뢰도가 이 값 이상이면 LLM 의도 분류를 건너뜀
+INTENT_FAST_PATH_THRESHOLD = float(os.getenv("INTENT_FAST_PATH_THRESHOLD", "0.6"))
+
+# 규칙 기반으로 확신할 수 없을 때 로컬 분류기 확률이 이 값 이상이면 LLM 의도 분류를 건너뜀
+INTENT_LOCAL_CLASSIFIER_THRESHOLD = float(
+    os.getenv("INTENT_LOCAL_CLASSIFIER_THRESHOLD", "0.85")
+)
+
+# 결합 모드(settings.ROUTER_COMBINED_RESPONSE)에서 라우터가 직접 답변하는 의도
+ROUTER_ANSWERABLE_INTENTS = {Intent.CONVERSATION, Intent.GREETING}
+
+# 라우터가 직접 답변했음을 나타내는 context 키
+ROUTER_ANSWERED_KEY = "answered_by_router"
@@ -0,0 +1,185 @@
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tripmind.utils.component_registry import component_registry
+from tripmind.utils.text_featurizer import HashedNgramFeaturizer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = (
+    Path(__file__).resolve().parent / "models" / "intent_classifier.npz"
+)
+
+
+class LocalIntentClassifier:
+    """
+    해시 문자 n-gram + 다항 로지스틱 회귀 의도 분류기 (NumPy 전용)
+
+    오프라인에서 (user_input, intent) 기록으로 학습하고, 라우팅 시에는
+    희소 특징만 계산하므로 1ms 미만으로 예측한다.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        featurizer: Optional[HashedNgramFeaturizer] = None,
+    ):
+        self.labels = list(labels)
+        self.featurizer = featurizer or HashedNgramFeaturizer()
+        self.weights = np.zeros(
+            (self.featurizer.n_features, len(self.labels)), dtype=np.float32
+        )
+        self.bias = np.zeros(len(self.labels), dtype=np.float32)
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        intents: Sequence[str],
+        epochs: int = 200,
+        learning_rate: float = 1.0,
+        l2: float = 1e-4,
+        featurizer: Optional[HashedNgramFeaturizer] = None,
+    ) -> "LocalIntentClassifier":
+        classifier = cls(sorted(set(intents)), featurizer)
+        # 밀집 행렬(문장 수 x n_features) 대신 희소 (행, 인덱스, 값) 으로 학습
+        features = classifier.featurizer.transform_sparse(texts)
+        label_index = {label: i for i, label in enumerate(classifier.labels)}
+        targets = np.zeros((len(texts), len(classifier.labels)), dtype=np.float32)
+        targets[np.arange(len(texts)), [label_index[i] for i in intents]] = 1.0
+
+        # 전체 배치 경사 하강법 (softmax cross entropy + L2)
+        for _ in range(epochs):
+            logits = _sparse_matmul(features, classifier.weights, len(texts))
+            probs = _softmax(logits + classifier.bias)
+            error = (probs - targets) / len(texts)
+            classifier.weights -= learning_rate * (
+                _sparse_transpose_matmul(
+                    features, error, classifier.featurizer.n_features
+                )
+                + l2 * classifier.weights
+            )
+            classifier.bias -= learning_rate * error.sum(axis=0)
+
+        return classifier
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        indices, values = self.featurizer.transform_one(text)
+        logits = values @ self.weights[indices] + self.bias
+        return _softmax(logits[np.newaxis, :])[0]
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        probs = self.predict_proba(text)
+        best = int(np.argmax(probs))
+        return self.labels[best], float(probs[best])
+
+    def evaluate(self, texts: Sequence[str], intents: Sequence[str]) -> float:
+        if not texts:
+            return 0.0
+        correct = sum(
+            1 for text, intent in zip(texts, intents) if self.predict(text)[0] == intent
+        )
+        return correct / len(texts)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            labels=np.array(self.labels),
+            n_features=self.featurizer.n_features,
+            ngram_range=np.array(self.featurizer.ngram_range),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalIntentClassifier":
+        with np.load(path) as data:
+            featurizer = HashedNgramFeaturizer(
+                n_features=int(data["n_features"]),
+                ngram_range=tuple(int(n) for n in data["ngram_range"]),
+            )
+            classifier = cls([str(label) for label in data["labels"]], featurizer)
+            classifier.weights = data["weights"]
+            classifier.bias = data["bias"]
+        return classifier
+
+
+def _sparse_matmul(
+    features: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    weights: np.ndarray,
+    n_rows: int,
+) -> np.ndarray:
+    """희소 특징 (행, 인덱스, 값) @ weights -> (n_rows, 라벨 수)"""
+    rows, indices, values = features
+    return np.stack(
+        [
+            np.bincount(rows, weights=values * weights[indices, j], minlength=n_rows)
+            for j in range(weights.shape[1])
+        ],
+        axis=1,
+    ).astype(np.float32)
+
+
+def _sparse_transpose_matmul(
+    features: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    error: np.ndarray,
+    n_features: int,
+) -> np.ndarray:
+    """희소 특징의 전치 @ error -> (n_features, 라벨 수)"""
+    rows, indices, values = features
+    return np.stack(
+        [
+            np.bincount(indices, weights=values * error[rows, j], minlength=n_features)
+            for j in range(error.shape[1])
+        ],
+        axis=1,
+    ).astype(np.float32)
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def load_local_intent_classifier(
+    path: Optional[str] = None,
+) -> Optional[LocalIntentClassifier]:
+    """학습된 모델이 있으면 로드, 없으면 None (2단계 분류 비활성)"""
+    path = path or os.getenv("INTENT_CLASSIFIER_PATH", str(DEFAULT_MODEL_PATH))
+    if not os.path.exists(path):
+        return None
+
+    try:
+        classifier = LocalIntentClassifier.load(path)
+        logger.info(f"로컬 의도 분류기 로드: {path} (labels={classifier.labels})")
+        return classifier
+    except Exception as e:
+        logger.warning(f"로컬 의도 분류기 로드 실패: {str(e)}")
+        return None
+
+
+def split_train_test(
+    texts: List[str], intents: List[str], test_ratio: float, seed: int = 42
+) -> Tuple[List[str], List[str], List[str], List[str]]:
+    order = np.random.default_rng(seed).permutation(len(texts))
+    test_size = int(len(texts) * test_ratio)
+    test, train = order[:test_size], order[test_size:]
+    return (
+        [texts[i] for i in train],
+        [intents[i] for i in train],
+        [texts[i] for i in test],
+        [intents[i] for i in test],
+    )
+
+
+def get_local_intent_classifier() -> Optional[LocalIntentClassifier]:
+    """처음 사용할 때 한 번만 로드하는 공유 분류기 (모델 파일이 없으면 None)"""
+    return component_registry.get(
+        "local_intent_classifier", load_local_intent_classifier
+    )
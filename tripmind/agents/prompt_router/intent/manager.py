@@ -4,7 +4,21 @@ from typing import Dict
 from tripmind.agents.prompt_router.constants.intent_constants import (
     Intent,
 )
-from tripmind.agents.prompt_router.types.indent_type import IntentPatterns
+from tripmind.agents.prompt_router.types.indent_type import IntentMatch, IntentPatterns
+
+# 매칭 하나당 근거 가중치. 정규식 패턴이 단순 키워드보다 구체적인 근거로 본다.
+PATTERN_WEIGHT = 0.6
+KEYWORD_WEIGHT = 0.35
+
+# 점수가 같을 때의 우선순위 (기존 규칙 기반 분류 순서)
+INTENT_PRIORITY = [
+    Intent.END.value,
+    Intent.CALENDAR.value,
+    Intent.SHARING.value,
+    Intent.ITINERARY.value,
+    Intent.PLACE_SEARCH.value,
+    Intent.GREETING.value,
+]
 
 
 class IntentPatternManager:
@@ -70,32 +84,41 @@ class IntentPatternManager:
         }
 
     def determine_intent_by_rule_based(self, text: str) -> str:
-        text = text.lower()
+        return self.match_intent(text).intent
 
-        if self._patterns["end"].matches(text):
-            return Intent.END.value
-
-        # 캘린더 의도 확인
-        if self._patterns["calendar"].matches(text):
-            return Intent.CALENDAR.value
-
-        # 일정 공유 의도 확인
-        if self._patterns["sharing"].matches(text):
-            return Intent.SHARING.value
+    def match_intent(self, text: str) -> IntentMatch:
+        """
+        의도별로 매칭된 패턴/키워드 수로 근거 점수를 계산하고,
+        2순위 의도의 점수만큼 신뢰도를 낮춰 모호한 입력을 구분한다.
+        """
+        text = text.lower()
 
-        # 일정 생성 의도 확인
-        if self._patterns["itinerary"].matches(text):
-            return Intent.ITINERARY.value
+        scored = []
+        for priority, intent in enumerate(INTENT_PRIORITY):
+            patterns = self._patterns[intent].matched_patterns(text)
+            keywords = self._patterns[intent].matched_keywords(text)
+            if not patterns and not keywords:
+                continue
+            score = 1 - (1 - PATTERN_WEIGHT) ** len(patterns) * (
+                1 - KEYWORD_WEIGHT
+            ) ** len(keywords)
+            scored.append((score, -priority, intent, patterns + keywords))
 
-        # 장소 검색 의도 확인
-        if self._patterns["place_search"].matches(text):
-            return Intent.PLACE_SEARCH.value
+        if not scored:
+            return IntentMatch(intent=Intent.UNKNOWN.value)
 
-        # 인사 의도 확인
-        if self._patterns["greeting"].matches(text):
-            return Intent.GREETING.value
+        scored.sort(reverse=True)
+        best_score, _, intent, matched = scored[0]
+        runner_up_score, runner_up = (
+            (scored[1][0], scored[1][2]) if len(scored) > 1 else (0.0, "")
+        )
 
-        return Intent.UNKNOWN.value
+        return IntentMatch(
+            intent=intent,
+            confidence=round(best_score * (1 - runner_up_score), 4),
+            matched=matched,
+            runner_up=runner_up,
+        )
 
 
 intent_pattern_manager = IntentPatternManager()
@@ -0,0 +1,50 @@
+import logging
+import threading
+from collections import Counter
+
+from tripmind.agents.prompt_router.types.indent_type import IntentMatch
+
+logger = logging.getLogger(__name__)
+
+FAST_PATH = "fast_path"
+LOCAL_MODEL_PATH = "local_model"
+LLM_PATH = "llm"
+
+
+class IntentRoutingStats:
+    """규칙 기반 fast path / 로컬 분류기 / LLM 분류 경로 선택 기록 (임계값 튜닝용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths = Counter()
+        self._fast_path_intents = Counter()
+
+    def record(self, path: str, match: IntentMatch, threshold: float):
+        with self._lock:
+            self._paths[path] += 1
+            if path == FAST_PATH:
+                self._fast_path_intents[match.intent] += 1
+            fast_path_rate = self._fast_path_rate()
+
+        logger.info(
+            f"[의도 라우팅] path={path} intent={match.intent} "
+            f"confidence={match.confidence:.2f} threshold={threshold:.2f} "
+            f"runner_up={match.runner_up or '-'} matched={match.matched} "
+            f"fast_path_rate={fast_path_rate:.2%}"
+        )
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "total": sum(self._paths.values()),
+                "paths": dict(self._paths),
+                "fast_path_intents": dict(self._fast_path_intents),
+                "fast_path_rate": self._fast_path_rate(),
+            }
+
+    def _fast_path_rate(self) -> float:
+        total = sum(self._paths.values())
+        return self._paths[FAST_PATH] / total if total else 0.0
+
+
+intent_routing_stats = IntentRoutingStats()
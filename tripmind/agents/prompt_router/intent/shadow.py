@@ -0,0 +1,123 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from tripmind.agents.prompt_router.constants.intent_constants import (
+    INTENT_FAST_PATH_THRESHOLD,
+    Intent,
+)
+from tripmind.agents.prompt_router.intent.manager import (
+    IntentPatternManager,
+    intent_pattern_manager,
+)
+from tripmind.agents.prompt_router.nodes.classify_intent_node import (
+    classify_intent_with_llm,
+)
+from tripmind.clients.llm.llm_client_factory import get_llm_client
+
+logger = logging.getLogger(__name__)
+
+SHADOW_LOG_DIR = Path(__file__).resolve().parents[3] / "logs" / "intent_shadow"
+
+# LLM 분류기(get_intent)는 캘린더/공유 의도를 일정 에이전트로 합쳐서 반환한다
+_ITINERARY_FAMILY = {
+    Intent.ITINERARY.value,
+    Intent.CALENDAR.value,
+    Intent.SHARING.value,
+}
+
+
+def normalize_intent(intent: str) -> str:
+    return Intent.ITINERARY.value if intent in _ITINERARY_FAMILY else intent
+
+
+class IntentShadowRecorder:
+    """
+    섀도 모드: 샘플링된 요청에 대해 규칙 기반 분류와 LLM 분류를 모두 실행하고
+    일치 여부와 각 경로의 지연 시간을 JSONL 로 기록한다.
+
+    실제 라우팅에는 영향을 주지 않도록 백그라운드 스레드에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        llm_classifier: Callable[[str], Intent],
+        sample_rate: float = 0.0,
+        log_dir: Optional[Path] = None,
+        pattern_manager: IntentPatternManager = intent_pattern_manager,
+    ):
+        self.llm_classifier = llm_classifier
+        self.sample_rate = sample_rate
+        self.log_dir = Path(log_dir or SHADOW_LOG_DIR)
+        self.pattern_manager = pattern_manager
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="intent-shadow"
+        )
+
+    def maybe_submit(self, user_input: str):
+        if not user_input or random.random() >= self.sample_rate:
+            return None
+        return self._executor.submit(self.run, user_input)
+
+    def run(self, user_input: str) -> Optional[dict]:
+        try:
+            started = time.perf_counter()
+            match = self.pattern_manager.match_intent(user_input)
+            rule_latency_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            llm_intent = self.llm_classifier(user_input)
+            llm_latency_ms = (time.perf_counter() - started) * 1000
+            llm_intent = getattr(llm_intent, "value", llm_intent)
+
+            record = {
+                "timestamp": datetime.now().isoformat(),
+                "user_input": user_input,
+                "rule_intent": match.intent,
+                "rule_confidence": match.confidence,
+                "rule_matched": match.matched,
+                "fast_path": match.intent != Intent.UNKNOWN.value
+                and match.confidence >= INTENT_FAST_PATH_THRESHOLD,
+                "llm_intent": llm_intent,
+                "agree": normalize_intent(match.intent) == normalize_intent(llm_intent),
+                "rule_latency_ms": round(rule_latency_ms, 3),
+                "llm_latency_ms": round(llm_latency_ms, 1),
+            }
+            self._write(record)
+
+            if not record["agree"]:
+                logger.info(
+                    f"[의도 섀도] 불일치: rule={match.intent}"
+                    f"({match.confidence:.2f}) llm={llm_intent} "
+                    f"input={user_input[:50]}"
+                )
+            return record
+        except Exception as e:
+            logger.warning(f"의도 섀도 분류 실패: {str(e)}")
+            return None
+
+    def _write(self, record: dict):
+        os.makedirs(self.log_dir, exist_ok=True)
+        today = datetime.now().strftime("%Y-%m-%d")
+        path = self.log_dir / f"shadow-{today}.jsonl"
+        with self._lock:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _classify_with_claude(user_input: str) -> Intent:
+    return classify_intent_with_llm(get_llm_client(), user_input)
+
+
+intent_shadow_recorder = IntentShadowRecorder(
+    llm_classifier=_classify_with_claude,
+    sample_rate=float(os.getenv("INTENT_SHADOW_SAMPLE_RATE", "0")),
+)
@@ -2,10 +2,17 @@ import logging
 import traceback
 import json
 from pathlib import Path
+from typing import Tuple
+
+from tripmind.agents.common.utils.sync_executor import run_sync
+
+from django.conf import settings
 
 from tripmind.agents.prompt_router.constants.intent_constants import (
     INTENT_DESCRIPTIONS,
     INTENT_TO_NODE_MAP,
+    ROUTER_ANSWERABLE_INTENTS,
+    ROUTER_ANSWERED_KEY,
     Intent,
 )
 from tripmind.agents.prompt_router.types.prompt_router_state_type import (
@@ -13,76 +20,276 @@ from tripmind.agents.prompt_router.types.prompt_router_state_type import (
 )
 from tripmind.clients.llm.base_llm_client import BaseLLMClient
 from tripmind.services.prompt.prompt_service import prompt_service
+from tripmind.services.session.session_manage_service import session_manage_service
 from langchain.chains import LLMChain
 
 logger = logging.getLogger(__name__)
 PROMPT_DIR = Path(__file__).parent / "../prompt_templates"
 
+# 의도 분류 프롬프트의 정적 partial
+INTENT_DESCRIPTIONS_TEXT = "\n".join(
+    f"- {intent.value}: {description}"
+    for intent, description in INTENT_DESCRIPTIONS.items()
+)
+
+# 의도 분류 + 대화 답변 (ROUTER_COMBINED_RESPONSE) 체인
+COMBINED_RESPONSE_CHAIN = {
+    "template_name": "classify_intent/v3.yaml",
+    "llm_node_name": "classify_intent_respond",
+}
+
 
 def classify_intent_node(
     llm_client: BaseLLMClient, state: PromptRouterState
 ) -> PromptRouterState:
     session_id = state.get("config_data", {}).get("session_id", "default")
     user_input = state.get("user_input", "")
-    next_node = state.get("next_node", "")
     messages = state.get("messages", [])
 
     try:
         config = {"configurable": {"session_id": session_id}}
-        intent_descriptions = "\n".join(
-            [
-                f"- {intent.value}: {description}"
-                for intent, description in INTENT_DESCRIPTIONS.items()
-            ]
-        )
+        if settings.ROUTER_COMBINED_RESPONSE:
+            return _classify_and_respond(llm_client, state, config)
 
-        prompt = prompt_service.get_system_prompt(
-            str(PROMPT_DIR / "classify_intent/v1.yaml"),
-        )
+        response = _invoke_classify_chain(llm_client, user_input, config)
+        return _classified_state(user_input, messages, response)
 
-        prompt = prompt.partial(
-            intent_descriptions=intent_descriptions,
-            model=llm_client.get_llm().model,
-        )
+    except Exception as e:
+        traceback.print_exc()
+        return _error_state(user_input, messages, e)
 
-        chain = LLMChain(
-            llm=llm_client.get_llm(),
-            prompt=prompt,
-            verbose=True,
-            output_key="output",
-        )
 
-        response = chain.invoke(
-            {
-                "input": user_input,
-                "chat_history": [],
-            },
-            config=config,
-        )
+async def aclassify_intent_node(
+    llm_client: BaseLLMClient, state: PromptRouterState
+) -> PromptRouterState:
+    """
+    classify_intent_node 의 비동기 버전 (graph.astream).
+    분류 체인을 ainvoke 로 실행해 LLM 응답을 기다리는 동안 스레드를 잡지 않는다.
+    """
+    session_id = state.get("config_data", {}).get("session_id", "default")
+    user_input = state.get("user_input", "")
+    messages = state.get("messages", [])
+
+    try:
+        config = {"configurable": {"session_id": session_id}}
+        if settings.ROUTER_COMBINED_RESPONSE:
+            return await _aclassify_and_respond(llm_client, state, config)
+
+        response = await _ainvoke_classify_chain(llm_client, user_input, config)
+        return _classified_state(user_input, messages, response)
+
+    except Exception as e:
+        traceback.print_exc()
+        return _error_state(user_input, messages, e)
+
+
+def _classified_state(user_input: str, messages: list, response) -> PromptRouterState:
+    intent = get_intent(response)
+
+    next_node = INTENT_TO_NODE_MAP.get(intent, "conversation")
+
+    return PromptRouterState(
+        user_input=user_input,
+        intent=intent.value,
+        next_node=next_node,
+        messages=messages,
+        context={"intent": intent.value},
+        response=response,
+    )
+
+
+def _error_state(user_input: str, messages: list, e: Exception) -> PromptRouterState:
+    return PromptRouterState(
+        user_input=user_input,
+        intent=Intent.CONVERSATION.value,
+        next_node="conversation",
+        messages=messages,
+        context={"intent": Intent.CONVERSATION.value},
+        response=f"의도 분류 중 오류가 발생했습니다: {str(e)}",
+    )
+
+
+def _classify_and_respond(
+    llm_client: BaseLLMClient, state: PromptRouterState, config: dict
+) -> PromptRouterState:
+    """
+    의도 분류와 일반 대화 답변을 한 번의 LLM 호출로 처리 (ROUTER_COMBINED_RESPONSE)
+
+    conversation / greeting 이면서 답변이 있으면 대화 에이전트를 거치지 않고 바로 응답하며,
+    답변은 대화 노드 메모리에 저장해 다음 대화 턴에서도 이어진다.
+    그 외에는 기존과 같이 분류된 노드로 라우팅한다.
+    """
+    user_input = state.get("user_input", "")
+    memory = _get_conversation_memory(state)
+    response = _invoke_classify_chain(
+        llm_client,
+        user_input,
+        config,
+        chat_history=_load_chat_history(memory, user_input),
+        **COMBINED_RESPONSE_CHAIN,
+    )
 
-        intent = get_intent(response)
+    intent, answer = _get_intent_and_answer(response)
+    if answer:
+        _save_turn(memory, user_input, answer)
+    return _combined_state(state, response, intent, answer)
 
-        next_node = INTENT_TO_NODE_MAP.get(intent, "conversation")
 
+async def _aclassify_and_respond(
+    llm_client: BaseLLMClient, state: PromptRouterState, config: dict
+) -> PromptRouterState:
+    """_classify_and_respond 의 비동기 버전 (메모리 로드 / 저장은 run_sync)"""
+    user_input = state.get("user_input", "")
+    memory = _get_conversation_memory(state)
+    chat_history = await run_sync(_load_chat_history, memory, user_input)
+    response = await _ainvoke_classify_chain(
+        llm_client,
+        user_input,
+        config,
+        chat_history=chat_history,
+        **COMBINED_RESPONSE_CHAIN,
+    )
+
+    intent, answer = _get_intent_and_answer(response)
+    if answer:
+        await run_sync(_save_turn, memory, user_input, answer)
+    return _combined_state(state, response, intent, answer)
+
+
+def _get_conversation_memory(state: PromptRouterState):
+    session_id = state.get("config_data", {}).get("thread_id", "default")
+    return session_manage_service.get_session_memory(
+        session_id,
+        memory_key="chat_history",
+        input_key="input",
+        output_key="output",
+        node_name="conversation_node",
+    )
+
+
+def _load_chat_history(memory, user_input: str) -> list:
+    return memory.load_memory_variables({"input": user_input}).get("chat_history", [])
+
+
+def _save_turn(memory, user_input: str, answer: str):
+    memory.save_context(
+        inputs={memory.input_key: user_input},
+        outputs={memory.output_key: answer},
+    )
+
+
+def _get_intent_and_answer(response) -> Tuple[Intent, str]:
+    intent = get_intent(response)
+    answer = _get_answer(response) if intent in ROUTER_ANSWERABLE_INTENTS else ""
+    return intent, answer
+
+
+def _combined_state(
+    state: PromptRouterState, response, intent: Intent, answer: str
+) -> PromptRouterState:
+    user_input = state.get("user_input", "")
+    messages = state.get("messages", [])
+    if not answer:
         return PromptRouterState(
             user_input=user_input,
             intent=intent.value,
-            next_node=next_node,
+            next_node=INTENT_TO_NODE_MAP.get(intent, "conversation"),
             messages=messages,
             context={"intent": intent.value},
             response=response,
         )
 
-    except Exception as e:
-        traceback.print_exc()
-        return PromptRouterState(
-            user_input=user_input,
-            intent=Intent.CONVERSATION.value,
-            next_node="conversation",
-            messages=messages,
-            context={"intent": Intent.CONVERSATION.value},
-            response=f"의도 분류 중 오류가 발생했습니다: {str(e)}",
-        )
+    messages.append({"role": "assistant", "content": answer})
+    return PromptRouterState(
+        user_input=user_input,
+        intent=intent.value,
+        next_node="classify_intent_node",
+        messages=messages,
+        context={"intent": intent.value, ROUTER_ANSWERED_KEY: True},
+        response=answer,
+        streaming={
+            "message": answer,
+            "current_position": len(answer),
+            "is_complete": True,
+        },
+    )
+
+
+def classify_intent_with_llm(llm_client: BaseLLMClient, user_input: str) -> Intent:
+    """그래프 밖에서(섀도 모드 등) LLM 의도 분류만 수행"""
+    return get_intent(_invoke_classify_chain(llm_client, user_input, {}))
+
+
+def _invoke_classify_chain(
+    llm_client: BaseLLMClient,
+    user_input: str,
+    config: dict,
+    template_name: str = "classify_intent/v2.yaml",
+    llm_node_name: str = "classify_intent_node",
+    chat_history: list = None,
+) -> dict:
+    chain, inputs, config = _build_classify_chain(
+        llm_client, user_input, config, template_name, llm_node_name, chat_history
+    )
+    return chain.invoke(inputs, config=config)
+
+
+async def _ainvoke_classify_chain(
+    llm_client: BaseLLMClient,
+    user_input: str,
+    config: dict,
+    template_name: str = "classify_intent/v2.yaml",
+    llm_node_name: str = "classify_intent_node",
+    chat_history: list = None,
+) -> dict:
+    chain, inputs, config = _build_classify_chain(
+        llm_client, user_input, config, template_name, llm_node_name, chat_history
+    )
+    return await chain.ainvoke(inputs, config=config)
+
+
+def _build_classify_chain(
+    llm_client: BaseLLMClient,
+    user_input: str,
+    config: dict,
+    template_name: str,
+    llm_node_name: str,
+    chat_history: list = None,
+):
+    prompt = prompt_service.get_system_prompt(
+        str(PROMPT_DIR / template_name),
+        partial_variables={
+            "intent_descriptions": INTENT_DESCRIPTIONS_TEXT,
+            "model": llm_client.get_llm(llm_node_name).model,
+        },
+    )
+
+    chain = LLMChain(
+        llm=llm_client.get_llm(llm_node_name),
+        prompt=prompt,
+        verbose=True,
+        output_key="output",
+    )
+
+    inputs = {
+        "input": user_input,
+        "chat_history": chat_history or [],
+    }
+    return (
+        chain,
+        inputs,
+        {**config, "metadata": prompt_service.get_run_metadata(prompt)},
+    )
+
+
+def _get_answer(response) -> str:
+    output = response.get("output", "") if isinstance(response, dict) else response
+    try:
+        answer = json.loads(str(output)).get("response")
+    except (ValueError, AttributeError) as e:
+        logger.error(f"라우터 답변 파싱 중 오류: {str(e)}")
+        return ""
+    return answer.strip() if isinstance(answer, str) else ""
 
 
 def get_intent(response: str) -> Intent:
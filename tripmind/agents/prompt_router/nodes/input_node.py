@@ -2,7 +2,22 @@ from tripmind.agents.prompt_router.types.prompt_router_state_type import (
     PromptRouterState,
 )
 from tripmind.agents.prompt_router.intent.manager import intent_pattern_manager
-from tripmind.agents.prompt_router.constants.intent_constants import INTENT_TO_NODE_MAP
+from tripmind.agents.prompt_router.intent.local_classifier import (
+    get_local_intent_classifier,
+)
+from tripmind.agents.prompt_router.intent.routing_stats import (
+    FAST_PATH,
+    LLM_PATH,
+    LOCAL_MODEL_PATH,
+    intent_routing_stats,
+)
+from tripmind.agents.prompt_router.constants.intent_constants import (
+    INTENT_FAST_PATH_THRESHOLD,
+    INTENT_LOCAL_CLASSIFIER_THRESHOLD,
+    INTENT_TO_NODE_MAP,
+    Intent,
+)
+from tripmind.agents.prompt_router.types.indent_type import IntentMatch
 
 
 def input_node(state: PromptRouterState) -> PromptRouterState:
@@ -11,7 +26,19 @@ def input_node(state: PromptRouterState) -> PromptRouterState:
     message = state.get("messages", [])
     message.append({"role": "user", "content": user_input})
 
-    intent = intent_pattern_manager.determine_intent_by_rule_based(user_input)
+    match = intent_pattern_manager.match_intent(user_input)
+
+    # 1단계: 규칙 기반, 2단계: 로컬 분류기, 둘 다 확신이 없을 때만 LLM 의도 분류로 보낸다
+    if match.intent != Intent.UNKNOWN.value and (
+        match.confidence >= INTENT_FAST_PATH_THRESHOLD
+    ):
+        intent = match.intent
+        intent_routing_stats.record(FAST_PATH, match, INTENT_FAST_PATH_THRESHOLD)
+    else:
+        intent = _classify_with_local_model(user_input)
+        if intent == Intent.UNKNOWN.value:
+            intent_routing_stats.record(LLM_PATH, match, INTENT_FAST_PATH_THRESHOLD)
+
     next_node = INTENT_TO_NODE_MAP.get(intent, "conversation")
 
     return PromptRouterState(
@@ -22,3 +49,23 @@ def input_node(state: PromptRouterState) -> PromptRouterState:
         next_node=next_node,
         intent=intent,
     )
+
+
+def _classify_with_local_model(user_input: str) -> str:
+    local_intent_classifier = get_local_intent_classifier()
+    if local_intent_classifier is None:
+        return Intent.UNKNOWN.value
+
+    intent, probability = local_intent_classifier.predict(user_input)
+    if (
+        intent == Intent.UNKNOWN.value
+        or probability < INTENT_LOCAL_CLASSIFIER_THRESHOLD
+    ):
+        return Intent.UNKNOWN.value
+
+    intent_routing_stats.record(
+        LOCAL_MODEL_PATH,
+        IntentMatch(intent=intent, confidence=probability, matched=["local_model"]),
+        INTENT_LOCAL_CLASSIFIER_THRESHOLD,
+    )
+    return intent
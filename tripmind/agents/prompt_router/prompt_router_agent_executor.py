@@ -1,9 +1,47 @@
-from .prompt_router_agent_graph import prompt_router_graph
+from django.conf import settings
+
+from tripmind.agents.common.graph_registry import PROMPT_ROUTER_GRAPH, graph_registry
 from .types.prompt_router_state_type import PromptRouterState
+from .constants.intent_constants import (
+    ROUTER_ANSWERABLE_INTENTS,
+    ROUTER_ANSWERED_KEY,
+)
 from ..common.types.agent_executor_type import AgentExecutorResult, BaseAgentExcutor
+from ..common.utils.token_stream import (
+    JsonStringFieldTokenFilter,
+    astream_graph_with_tokens,
+)
+from .intent.shadow import intent_shadow_recorder
 from tripmind.services.session.session_manage_service import session_manage_service
 
 
+def get_token_stream_nodes() -> dict:
+    """
+    결합 모드에서는 라우터 응답 JSON 의 "response" 값(대화 답변)을 토큰 단위로 흘려보낸다.
+    모델이 다른 의도에 response 를 붙여도 흘려보내지 않도록 앞서 나온 intent 로 거른다
+    (v3.yaml 은 intent 를 먼저 출력하도록 한다).
+    """
+    if not settings.ROUTER_COMBINED_RESPONSE:
+        return {}
+    answerable = {intent.value for intent in ROUTER_ANSWERABLE_INTENTS}
+    return {
+        "classify_intent_node": lambda: JsonStringFieldTokenFilter(
+            ["response"], conditions={"response": ("intent", answerable)}
+        )
+    }
+
+
+def is_router_answer(result: dict) -> bool:
+    """라우터가 직접 답변해서 다음 에이전트를 실행할 필요가 없는 결과인지"""
+    return bool((result.get("context") or {}).get(ROUTER_ANSWERED_KEY))
+
+
+def is_router_token(result: dict) -> bool:
+    """astream_prompt 가 흘려보내는 답변 토큰(누적 메시지)인지"""
+    streaming = result.get("streaming") or {}
+    return bool(streaming.get("message")) and not streaming.get("is_complete")
+
+
 class PromptRouterAgentExecutor(BaseAgentExcutor):
     def process_prompt(
         self,
@@ -12,12 +50,16 @@ class PromptRouterAgentExecutor(BaseAgentExcutor):
         start_node: str = "input_node",
     ) -> AgentExecutorResult:
         try:
+            prompt_router_graph = graph_registry.get(PROMPT_ROUTER_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 prompt_router_graph, prompt, start_node, session_id
             )
 
             prompt_router_state = PromptRouterState(**state)
 
+            # 샘플링된 요청은 규칙 기반/LLM 분류를 백그라운드에서 비교 기록
+            intent_shadow_recorder.maybe_submit(prompt)
+
             result: PromptRouterState = prompt_router_graph.invoke(
                 prompt_router_state, config=config
             )
@@ -33,3 +75,79 @@ class PromptRouterAgentExecutor(BaseAgentExcutor):
 
         except Exception as e:
             return {"response": f"[대화 오류] {str(e)}", "messages": [], "context": {}}
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "input_node",
+    ) -> AgentExecutorResult:
+        try:
+            prompt_router_graph = graph_registry.get(PROMPT_ROUTER_GRAPH)
+            state, config = session_manage_service.get_session_state_and_config(
+                prompt_router_graph, prompt, start_node, session_id
+            )
+
+            prompt_router_state = PromptRouterState(**state)
+
+            # 샘플링된 요청은 규칙 기반/LLM 분류를 백그라운드에서 비교 기록
+            intent_shadow_recorder.maybe_submit(prompt)
+
+            result: PromptRouterState = await prompt_router_graph.ainvoke(
+                prompt_router_state, config=config
+            )
+
+            return AgentExecutorResult(
+                response=result.get("response", "응답을 생성하지 못했습니다."),
+                messages=result.get("messages", []),
+                context=result.get("context", {}),
+                intent=result.get("intent", "unknown"),
+                next_node=result.get("next_node", "unknown"),
+                streaming=result.get("streaming", {}),
+            )
+
+        except Exception as e:
+            return {"response": f"[대화 오류] {str(e)}", "messages": [], "context": {}}
+
+    async def astream_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: str = "input_node",
+    ):
+        """
+        aprocess_prompt 의 스트리밍 버전.
+        라우터가 직접 답변하면(결합 모드) 답변 토큰을 먼저 yield 하고,
+        마지막으로 의도 / next_node 가 담긴 라우팅 결과를 yield 한다.
+        """
+        try:
+            prompt_router_graph = graph_registry.get(PROMPT_ROUTER_GRAPH)
+            state, config = session_manage_service.get_session_state_and_config(
+                prompt_router_graph, prompt, start_node, session_id
+            )
+
+            intent_shadow_recorder.maybe_submit(prompt)
+
+            routed = {}
+            async for result in astream_graph_with_tokens(
+                prompt_router_graph,
+                PromptRouterState(**state),
+                config,
+                get_token_stream_nodes(),
+            ):
+                if is_router_token(result):
+                    yield result
+                else:
+                    routed.update({k: v for k, v in result.items() if v})
+
+            yield AgentExecutorResult(
+                response=routed.get("response", "응답을 생성하지 못했습니다."),
+                messages=routed.get("messages", []),
+                context=routed.get("context", {}),
+                intent=routed.get("intent", "unknown"),
+                next_node=routed.get("next_node", "unknown"),
+                streaming=routed.get("streaming", {}),
+            )
+
+        except Exception as e:
+            yield {"response": f"[대화 오류] {str(e)}", "messages": [], "context": {}}
@@ -1,20 +1,28 @@
+from functools import partial
+
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
-from tripmind.clients.llm.claude_client import claude_client
+from tripmind.clients.llm.llm_client_factory import get_llm_client
 from tripmind.agents.prompt_router.types.prompt_router_state_type import (
     PromptRouterState,
 )
 from tripmind.agents.prompt_router.nodes.input_node import input_node
 from tripmind.agents.prompt_router.nodes.classify_intent_node import (
+    aclassify_intent_node,
     classify_intent_node,
 )
-from tripmind.agents.common.nodes.node_wrapper import node_wrapper
+from tripmind.agents.common.nodes.node_wrapper import node_wrapper, sync_async_node
+from tripmind.agents.common.graph_registry import PROMPT_ROUTER_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
+    llm_client = get_llm_client()
     wrapped_input_node = node_wrapper(input_node)
-    wrapped_classify_intent_node = node_wrapper(
-        lambda state: classify_intent_node(claude_client, state)
+    # graph.astream 에서는 aclassify_intent_node (ainvoke) 로 실행
+    wrapped_classify_intent_node = sync_async_node(
+        "classify_intent_node",
+        lambda state: classify_intent_node(llm_client, state),
+        partial(aclassify_intent_node, llm_client),
     )
 
     return {
@@ -23,9 +31,7 @@ def wrap_all_nodes():
     }
 
 
-def create_prompt_router_agent_graph():
-    memory = MemorySaver()
-
+def build_prompt_router_agent_graph() -> StateGraph:
     graph = StateGraph(PromptRouterState)
 
     wrapped_nodes = wrap_all_nodes()
@@ -45,7 +51,15 @@ def create_prompt_router_agent_graph():
     )
     graph.add_edge("classify_intent_node", END)
 
-    return graph.compile(checkpointer=memory)
+    return graph
+
+
+def create_prompt_router_agent_graph():
+    return build_prompt_router_agent_graph().compile(checkpointer=MemorySaver())
 
 
-prompt_router_graph = create_prompt_router_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "prompt_router_graph":
+        return graph_registry.get(PROMPT_ROUTER_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
 from typing import List, Pattern
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 
 
@@ -19,3 +19,19 @@ class IntentPatterns:
 
         # 패턴 매칭
         return any(pattern.search(text) for pattern in self.patterns)
+
+    def matched_patterns(self, text: str) -> List[str]:
+        return [pattern.pattern for pattern in self.patterns if pattern.search(text)]
+
+    def matched_keywords(self, text: str) -> List[str]:
+        return [kw for kw in (self.keywords or []) if kw in text]
+
+
+@dataclass
+class IntentMatch:
+    """규칙 기반 의도 분류 결과와 신뢰도"""
+
+    intent: str
+    confidence: float = 0.0
+    matched: List[str] = field(default_factory=list)
+    runner_up: str = ""
@@ -1,7 +1,7 @@
 from .types.sharing_state_type import SharingRouterState
 from ..common.types.agent_executor_type import AgentExecutorResult, BaseAgentExcutor
 from tripmind.services.session.session_manage_service import session_manage_service
-from .sharing_agent_graph import sharing_agent_graph
+from tripmind.agents.common.graph_registry import SHARING_GRAPH, graph_registry
 
 
 class SharingRouterAgentExecutor(BaseAgentExcutor):
@@ -12,6 +12,7 @@ class SharingRouterAgentExecutor(BaseAgentExcutor):
         start_node: str = "input_node",
     ):
         try:
+            sharing_agent_graph = graph_registry.get(SHARING_GRAPH)
             state, config = session_manage_service.get_session_state_and_config(
                 sharing_agent_graph, prompt, start_node, session_id
             )
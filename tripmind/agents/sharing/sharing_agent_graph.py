@@ -3,6 +3,7 @@ from langgraph.checkpoint.memory import MemorySaver
 from tripmind.agents.sharing.types.sharing_state_type import SharingRouterState
 from tripmind.agents.sharing.nodes.sharing_node import sharing_node
 from tripmind.agents.common.nodes.node_wrapper import node_wrapper
+from tripmind.agents.common.graph_registry import SHARING_GRAPH, graph_registry
 
 
 def wrap_all_nodes():
@@ -13,9 +14,7 @@ def wrap_all_nodes():
     }
 
 
-def create_sharing_agent_graph():
-    memory = MemorySaver()
-
+def build_sharing_agent_graph() -> StateGraph:
     graph = StateGraph(SharingRouterState)
 
     wrapped_nodes = wrap_all_nodes()
@@ -26,7 +25,15 @@ def create_sharing_agent_graph():
 
     graph.add_edge("sharing_node", END)
 
-    return graph.compile(checkpointer=memory)
+    return graph
+
+
+def create_sharing_agent_graph():
+    return build_sharing_agent_graph().compile(checkpointer=MemorySaver())
 
 
-sharing_agent_graph = create_sharing_agent_graph()
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "sharing_agent_graph":
+        return graph_registry.get(SHARING_GRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1 @@
+# tripmind agents package
@@ -0,0 +1,20 @@
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+
+# supergraph 의 서브그래프 노드 이름
+PROMPT_ROUTER_AGENT = "prompt_router"
+ITINERARY_AGENT = "itinerary"
+CONVERSATION_AGENT = "conversation"
+PLACE_SEARCH_AGENT = "place_search"
+CALENDAR_AGENT = "calendar"
+SHARING_AGENT = "sharing"
+
+# 분류된 의도 -> 서브그래프 (그 외 의도는 대화 에이전트, 기존 뷰의 라우팅과 동일)
+INTENT_TO_AGENT = {
+    Intent.ITINERARY.value: ITINERARY_AGENT,
+    Intent.PLACE_SEARCH.value: PLACE_SEARCH_AGENT,
+    Intent.SHARING.value: SHARING_AGENT,
+    Intent.CALENDAR.value: CALENDAR_AGENT,
+}
+
+# 대화 에이전트 router_node 가 처리할 수 있는 시작 노드
+CONVERSATION_START_NODES = ("greeting_node", "conversation_node")
@@ -0,0 +1,123 @@
+import traceback
+from typing import Optional
+
+from tripmind.agents.common.graph_registry import SUPERGRAPH, graph_registry
+from tripmind.agents.common.types.agent_executor_type import (
+    AgentExecutorResult,
+    BaseAgentExcutor,
+)
+from tripmind.agents.common.utils.token_stream import (
+    astream_subgraphs_with_tokens,
+    stream_subgraphs_with_tokens,
+)
+from tripmind.agents.conversation.conversation_agent_executor import (
+    TOKEN_STREAM_NODES as CONVERSATION_TOKEN_STREAM_NODES,
+)
+from tripmind.agents.itinerary.itinerary_agent_executor import (
+    TOKEN_STREAM_NODES as ITINERARY_TOKEN_STREAM_NODES,
+)
+from tripmind.agents.prompt_router.intent.shadow import intent_shadow_recorder
+from tripmind.agents.supergraph.constants.supergraph_constants import (
+    PROMPT_ROUTER_AGENT,
+)
+from tripmind.agents.prompt_router.prompt_router_agent_executor import (
+    get_token_stream_nodes as get_router_token_stream_nodes,
+    is_router_answer,
+    is_router_token,
+)
+
+
+def get_token_stream_nodes() -> dict:
+    return {
+        **get_router_token_stream_nodes(),
+        **ITINERARY_TOKEN_STREAM_NODES,
+        **CONVERSATION_TOKEN_STREAM_NODES,
+    }
+
+
+def is_client_result(subgraph: str, node_name: str, result: dict) -> bool:
+    """
+    기존 라우터 실행기 + 에이전트 실행기 조합이 클라이언트에 보내던 결과만 통과시킨다.
+    - 라우터 서브그래프: 답변 토큰만 (결합 모드)
+    - 부모 그래프: 라우터가 직접 답변한 경우의 라우터 결과만
+    - 전문 에이전트 서브그래프: 토큰과 노드 상태 전부
+    """
+    if subgraph == PROMPT_ROUTER_AGENT:
+        return is_router_token(result)
+    if not subgraph:
+        return node_name == PROMPT_ROUTER_AGENT and is_router_answer(result)
+    return True
+
+
+class SupergraphAgentExecutor(BaseAgentExcutor):
+    """
+    라우팅부터 전문 에이전트 응답까지 supergraph 한 번의 stream 으로 처리한다.
+    세션 상태는 그래프 체크포인터가 이어 주므로 get_state 로 다시 읽지 않고,
+    턴이 끝날 때 체크포인트를 한 번만 기록한다 (checkpoint_during=False).
+    """
+
+    def process_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: Optional[str] = None,
+    ):
+        # supergraph 는 항상 라우터부터 시작하므로 start_node 는 사용하지 않는다
+        try:
+            for subgraph, node_name, result in self.stream_turn(prompt, session_id):
+                if is_client_result(subgraph, node_name, result):
+                    yield result
+        except Exception as e:
+            traceback.print_exc()
+            yield AgentExecutorResult(
+                response=f"[대화 오류] {str(e)}",
+                messages=[],
+                context={},
+            )
+
+    async def aprocess_prompt(
+        self,
+        prompt: str,
+        session_id: str = "default",
+        start_node: Optional[str] = None,
+    ):
+        try:
+            async for subgraph, node_name, result in self.astream_turn(
+                prompt, session_id
+            ):
+                if is_client_result(subgraph, node_name, result):
+                    yield result
+        except Exception as e:
+            traceback.print_exc()
+            yield AgentExecutorResult(
+                response=f"[대화 오류] {str(e)}",
+                messages=[],
+                context={},
+            )
+
+    def stream_turn(self, prompt: str, session_id: str = "default"):
+        """(서브그래프 노드 이름, 노드 이름, 결과) 전부 (라우팅 결과 포함)"""
+        state, config = self._get_state_and_config(prompt, session_id)
+        yield from stream_subgraphs_with_tokens(
+            graph_registry.get(SUPERGRAPH),
+            state,
+            config,
+            get_token_stream_nodes(),
+            checkpoint_during=False,
+        )
+
+    async def astream_turn(self, prompt: str, session_id: str = "default"):
+        state, config = self._get_state_and_config(prompt, session_id)
+        async for item in astream_subgraphs_with_tokens(
+            graph_registry.get(SUPERGRAPH),
+            state,
+            config,
+            get_token_stream_nodes(),
+            checkpoint_during=False,
+        ):
+            yield item
+
+    def _get_state_and_config(self, prompt: str, session_id: str):
+        # 샘플링된 요청은 규칙 기반/LLM 분류를 백그라운드에서 비교 기록
+        intent_shadow_recorder.maybe_submit(prompt)
+        return {"user_input": prompt}, {"configurable": {"thread_id": session_id}}
@@ -0,0 +1,148 @@
+from typing import Callable, Dict
+
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+from tripmind.agents.calendar.calendar_agent_graph import build_calendar_agent_graph
+from tripmind.agents.common.graph_registry import SUPERGRAPH, graph_registry
+from tripmind.agents.conversation.conversation_agent_graph import (
+    build_conversation_agent_graph,
+)
+from tripmind.agents.itinerary.itinerary_agent_graph import build_itinerary_agent_graph
+from tripmind.agents.place_search.place_search_agent_graph import (
+    build_place_search_agent_graph,
+)
+from tripmind.agents.prompt_router.prompt_router_agent_executor import (
+    is_router_answer,
+)
+from tripmind.agents.prompt_router.prompt_router_agent_graph import (
+    build_prompt_router_agent_graph,
+)
+from tripmind.agents.sharing.sharing_agent_graph import build_sharing_agent_graph
+from tripmind.agents.supergraph.constants.supergraph_constants import (
+    CALENDAR_AGENT,
+    CONVERSATION_AGENT,
+    CONVERSATION_START_NODES,
+    INTENT_TO_AGENT,
+    ITINERARY_AGENT,
+    PLACE_SEARCH_AGENT,
+    PROMPT_ROUTER_AGENT,
+    SHARING_AGENT,
+)
+from tripmind.agents.supergraph.types.supergraph_state_type import SupergraphState
+
+AGENT_GRAPH_BUILDERS: Dict[str, Callable[[], StateGraph]] = {
+    ITINERARY_AGENT: build_itinerary_agent_graph,
+    CONVERSATION_AGENT: build_conversation_agent_graph,
+    PLACE_SEARCH_AGENT: build_place_search_agent_graph,
+    CALENDAR_AGENT: build_calendar_agent_graph,
+    SHARING_AGENT: build_sharing_agent_graph,
+}
+
+
+def select_agent(router_result: dict) -> str:
+    if is_router_answer(router_result):
+        return END
+    return INTENT_TO_AGENT.get(router_result.get("intent"), CONVERSATION_AGENT)
+
+
+def get_start_node(agent: str, state: SupergraphState) -> str:
+    next_node = state.get("next_node") or ""
+    if agent == CONVERSATION_AGENT and next_node not in CONVERSATION_START_NODES:
+        return "conversation_node"
+    return next_node
+
+
+def subgraph_node(
+    agent: str, subgraph: CompiledStateGraph, is_router: bool = False
+) -> RunnableLambda:
+    """
+    서브그래프를 실행하는 부모 그래프 노드
+
+    서브그래프 입력은 기존 실행기가 그래프별 체크포인트 위에 넘기던 것과 같다
+    (이전 턴의 서브그래프 상태 + 이번 사용자 입력 / 메시지 / 시작 노드).
+    서브그래프의 context 등은 agent_states 에 따로 보관하므로 에이전트끼리 섞이지 않는다.
+    노드는 config_data 의 thread_id 로 세션 메모리를 찾으므로 부모 그래프의 thread_id 를 넘긴다.
+    """
+
+    def agent_input(state: SupergraphState, config: RunnableConfig) -> dict:
+        user_input = state.get("user_input", "")
+        return {
+            **(state.get("agent_states") or {}).get(agent, {}),
+            "user_input": user_input,
+            "messages": [{"role": "user", "content": user_input}],
+            "next_node": "input_node" if is_router else get_start_node(agent, state),
+            "config_data": {"thread_id": config["configurable"]["thread_id"]},
+        }
+
+    def agent_output(state: SupergraphState, result: dict) -> dict:
+        output = {
+            "response": result.get("response", ""),
+            "messages": result.get("messages", []),
+            "context": result.get("context", {}),
+            "next_node": result.get("next_node", ""),
+            "streaming": result.get("streaming"),
+            "agent_states": {**(state.get("agent_states") or {}), agent: result},
+        }
+        if is_router:
+            output.update(intent=result.get("intent"), agent=select_agent(result))
+        return output
+
+    def run(state: SupergraphState, config: RunnableConfig) -> dict:
+        return agent_output(state, subgraph.invoke(agent_input(state, config), config))
+
+    async def arun(state: SupergraphState, config: RunnableConfig) -> dict:
+        return agent_output(
+            state, await subgraph.ainvoke(agent_input(state, config), config)
+        )
+
+    return RunnableLambda(run, afunc=arun, name=agent)
+
+
+def build_supergraph_agent_graph() -> StateGraph:
+    """
+    라우터를 진입 노드로, 전문 에이전트 그래프를 서브그래프 노드로 가진 부모 그래프
+
+    서브그래프는 체크포인터 없이 (checkpointer=False) 컴파일해 한 턴의 상태가
+    부모 그래프의 체크포인트 하나에만 기록되도록 한다.
+    """
+    graph = StateGraph(SupergraphState)
+
+    graph.add_node(
+        PROMPT_ROUTER_AGENT,
+        subgraph_node(
+            PROMPT_ROUTER_AGENT,
+            build_prompt_router_agent_graph().compile(
+                checkpointer=False, name=PROMPT_ROUTER_AGENT
+            ),
+            is_router=True,
+        ),
+    )
+    for agent, build in AGENT_GRAPH_BUILDERS.items():
+        graph.add_node(
+            agent,
+            subgraph_node(agent, build().compile(checkpointer=False, name=agent)),
+        )
+        graph.add_edge(agent, END)
+
+    graph.set_entry_point(PROMPT_ROUTER_AGENT)
+    graph.add_conditional_edges(
+        PROMPT_ROUTER_AGENT,
+        lambda state: state["agent"],
+        {**{agent: agent for agent in AGENT_GRAPH_BUILDERS}, END: END},
+    )
+
+    return graph
+
+
+def create_supergraph_agent_graph():
+    return build_supergraph_agent_graph().compile(checkpointer=MemorySaver())
+
+
+def __getattr__(name):
+    # 그래프는 import 시점이 아니라 graph_registry 에서 처음 사용할 때 컴파일한다
+    if name == "supergraph_agent_graph":
+        return graph_registry.get(SUPERGRAPH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,11 @@
+from typing import Any, Dict, Optional
+
+from tripmind.agents.common.types.base_state_type import BaseState
+
+
+class SupergraphState(BaseState):
+    response: Optional[str]
+    # 라우터가 고른 서브그래프 노드 이름 (라우터가 직접 답변했으면 END)
+    agent: Optional[str]
+    # 서브그래프별 마지막 상태. 그래프마다 따로 두던 체크포인트를 한 스레드에 보관
+    agent_states: Optional[Dict[str, Dict[str, Any]]]
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LAST_EVENT_ID_HEADER = "Last-Event-ID"
+
+# 이벤트 루프는 태스크를 약한 참조로만 들고 있으므로, 보관소에서 밀려난 턴도 끝까지 실행되도록 유지
+_running_tasks = set()
+
+
+def get_last_event_id(request) -> Optional[int]:
+    """Last-Event-ID 헤더 (EventSource 자동 재연결) 또는 last_event_id 쿼리 파라미터"""
+    value = request.headers.get(LAST_EVENT_ID_HEADER) or request.GET.get(
+        "last_event_id"
+    )
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TurnEventBuffer:
+    """
+    한 턴(요청 하나)의 SSE 프레임 링 버퍼
+
+    생성은 백그라운드 태스크가 계속 진행하며 프레임을 쌓고, 응답(구독자)은 버퍼를 따라 읽는다.
+    클라이언트 연결이 끊겨도 생성은 멈추지 않으며, 재연결하면 Last-Event-ID 이후 프레임부터
+    다시 받는다. 이벤트 id 는 프로세스 전체에서 단조 증가한다.
+    """
+
+    def __init__(self, encoder, max_events: int, event_ids: "itertools.count"):
+        self.encoder = encoder
+        self._event_ids = event_ids
+        self._events: Deque[Tuple[int, str]] = deque(maxlen=max_events)
+        self._first_event_id: Optional[int] = None
+        self._dropped_until = 0
+        self._changed = asyncio.Event()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def last_event_id(self) -> int:
+        return self._events[-1][0] if self._events else self._dropped_until
+
+    def has_event(self, event_id: int) -> bool:
+        """event_id 가 이 턴이 보낸 이벤트인지 (id 는 모든 세션이 공유하므로 다른 턴의 id 를 거른다)"""
+        return (
+            self._first_event_id is not None
+            and self._first_event_id <= event_id <= self.last_event_id
+        )
+
+    def start(self, frames: AsyncIterator[str]):
+        task = asyncio.create_task(self._produce(frames))
+        _running_tasks.add(task)
+        task.add_done_callback(_running_tasks.discard)
+
+    async def subscribe(self, last_event_id: int = 0) -> AsyncIterator[str]:
+        """last_event_id 이후 프레임을 보내고, 턴이 끝날 때까지 새 프레임을 이어서 보낸다"""
+        cursor = last_event_id
+        while True:
+            frames, cursor = self._pending(cursor)
+            for frame in frames:
+                yield frame
+            if frames:
+                continue
+            if self.is_finished:
+                return
+            # _pending 이후 await 없이 가져오므로 그 사이에 추가된 프레임을 놓치지 않는다
+            await self._changed.wait()
+
+    def _pending(self, cursor: int) -> Tuple[List[str], int]:
+        if cursor < self._dropped_until:
+            snapshot = self.encoder.snapshot()
+            if snapshot is None:
+                # 남아 있는 가장 오래된 프레임부터 다시 보낸다
+                cursor = self._dropped_until
+            else:
+                return self._snapshot_frames(snapshot), self.last_event_id
+
+        pending = [(seq, frame) for seq, frame in self._events if seq > cursor]
+        if not pending:
+            return [], cursor
+        return [_with_id(seq, frame) for seq, frame in pending], pending[-1][0]
+
+    def _snapshot_frames(self, snapshot: List[str]) -> List[str]:
+        # 끝난 턴이면 마지막 프레임(done / error)까지 보낸다. id 는 마지막 프레임에만 붙인다
+        if self.is_finished and self._events:
+            seq, frame = self._events[-1]
+            return snapshot + [_with_id(seq, frame)]
+        return snapshot[:-1] + [_with_id(self.last_event_id, snapshot[-1])]
+
+    async def _produce(self, frames: AsyncIterator[str]):
+        try:
+            async for frame in frames:
+                self._append(frame)
+        except Exception as e:
+            logger.exception("[SSE 버퍼] 생성 중 오류")
+            self._append(self.encoder.error(e))
+        finally:
+            self.finished_at = time.monotonic()
+            self._notify()
+
+    def _append(self, frame: str):
+        if len(self._events) == self._events.maxlen:
+            self._dropped_until = self._events[0][0]
+        seq = next(self._event_ids)
+        if self._first_event_id is None:
+            self._first_event_id = seq
+        self._events.append((seq, frame))
+        self._notify()
+
+    def _notify(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class StreamEventStore:
+    """
+    세션별 최근 턴의 TurnEventBuffer 보관소 (워커 프로세스 메모리, ASGI 전용)
+
+    - 세션당 마지막 턴만 보관하며 새 요청이 오면 교체 (이전 턴 생성은 끝까지 진행)
+    - 최대 max_sessions 세션 (LRU), 끝난 턴은 ttl_seconds 가 지나면 폐기
+    - 재연결 요청이 같은 워커로 와야 하므로 여러 워커에서는 세션 고정(sticky) 라우팅이 필요
+    """
+
+    def __init__(self, max_events: int, max_sessions: int, ttl_seconds: float):
+        self.max_events = max_events
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._turns: "OrderedDict[str, TurnEventBuffer]" = OrderedDict()
+        self._event_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start_turn(
+        self, session_id: str, frames: AsyncIterator[str], encoder
+    ) -> TurnEventBuffer:
+        turn = TurnEventBuffer(encoder, self.max_events, self._event_ids)
+        turn.start(frames)
+        with self._lock:
+            self._turns[session_id] = turn
+            self._turns.move_to_end(session_id)
+            self._evict()
+        return turn
+
+    def get(self, session_id: str) -> Optional[TurnEventBuffer]:
+        with self._lock:
+            self._evict()
+            return self._turns.get(session_id)
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [
+            session_id
+            for session_id, turn in self._turns.items()
+            if turn.is_finished and now - turn.finished_at > self.ttl_seconds
+        ]
+        for session_id in expired:
+            del self._turns[session_id]
+        while len(self._turns) > self.max_sessions:
+            self._turns.popitem(last=False)
+
+
+def _with_id(seq: int, frame: str) -> str:
+    return f"id: {seq}\n{frame}"
+
+
+stream_event_store = StreamEventStore(
+    max_events=settings.SSE_RESUME["max_events"],
+    max_sessions=settings.SSE_RESUME["max_sessions"],
+    ttl_seconds=settings.SSE_RESUME["ttl_seconds"],
+)
@@ -0,0 +1,194 @@
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+STREAM_VERSION_HEADER = "X-TripMind-Stream-Version"
+
+SSE_PROTOCOL_V1 = 1
+SSE_PROTOCOL_V2 = 2
+SUPPORTED_VERSIONS = (SSE_PROTOCOL_V1, SSE_PROTOCOL_V2)
+
+_ACCEPT_VERSION_PATTERN = re.compile(
+    r"text/event-stream\s*;[^,]*?\bversion\s*=\s*\"?(\d+)\"?", re.IGNORECASE
+)
+
+
+def negotiate_stream_version(request) -> int:
+    """
+    요청 헤더로 SSE 이벤트 프로토콜 버전을 결정한다.
+
+    - X-TripMind-Stream-Version: 2
+    - Accept: text/event-stream; version=2
+    둘 다 없거나 지원하지 않는 버전이면 기존 클라이언트를 위해 v1 을 사용한다.
+    """
+    requested = request.headers.get(STREAM_VERSION_HEADER)
+    if not requested:
+        match = _ACCEPT_VERSION_PATTERN.search(request.headers.get("Accept", ""))
+        requested = match.group(1) if match else None
+
+    try:
+        version = int(requested)
+    except (TypeError, ValueError):
+        return SSE_PROTOCOL_V1
+
+    return version if version in SUPPORTED_VERSIONS else SSE_PROTOCOL_V1
+
+
+def format_sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class SSEEncoderV1:
+    """기존 프로토콜: 매 프레임마다 AgentExecutorResult 전체를 전송"""
+
+    version = SSE_PROTOCOL_V1
+
+    def encode(self, results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        for result in results:
+            if result:
+                yield f"data: {json.dumps(result)}\n\n"
+
+    async def aencode(
+        self, results: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[str]:
+        async for result in results:
+            if result:
+                yield f"data: {json.dumps(result)}\n\n"
+
+    def error(self, error: Exception) -> str:
+        return f"data: {json.dumps(_error_payload(error))}\n\n"
+
+    def snapshot(self) -> Optional[List[str]]:
+        # 프레임마다 누적 결과 전체를 보내므로 남아 있는 프레임을 다시 보내면 된다
+        return None
+
+
+class SSEEncoderV2:
+    """
+    델타 프로토콜: start -> delta* / context* -> done 순서로 이벤트를 전송한다.
+
+    - start: {"version", "session_id"}
+    - delta: {"text"} 직전까지 보낸 텍스트 뒤에 붙일 부분만 전송.
+             검증 등으로 앞부분이 바뀐 경우 {"text", "reset": true} 로 전체를 교체
+    - context: 변경된 경우에만 context 전체 전송
+    - done: {"intent", "next_node"}
+    - error: {"error"}
+    messages 목록은 클라이언트가 직접 관리하므로 전송하지 않는다.
+    """
+
+    version = SSE_PROTOCOL_V2
+
+    def __init__(self, session_id: str = "default"):
+        self.session_id = session_id
+        self._sent_text = ""
+        self._fallback_response = ""
+        self._context: Dict[str, Any] = {}
+        self._intent = ""
+        self._next_node = ""
+
+    def encode(self, results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        yield self._start()
+        for result in results:
+            yield from self._encode_result(result)
+        yield from self._finish()
+
+    async def aencode(
+        self, results: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[str]:
+        yield self._start()
+        async for result in results:
+            for frame in self._encode_result(result):
+                yield frame
+        for frame in self._finish():
+            yield frame
+
+    def error(self, error) -> str:
+        return format_sse({"error": str(error)}, event="error")
+
+    def snapshot(self) -> Optional[List[str]]:
+        """
+        재연결 시 버퍼에서 밀려난 이벤트를 대신할 프레임.
+        지금까지 보낸 텍스트 전체(reset)와 마지막 context 로 클라이언트 상태를 맞춘다.
+        """
+        frames = [self._start()]
+        if self._sent_text:
+            frames.append(
+                format_sse({"text": self._sent_text, "reset": True}, event="delta")
+            )
+        if self._context:
+            frames.append(format_sse(self._context, event="context"))
+        return frames
+
+    def _start(self) -> str:
+        return format_sse(
+            {"version": self.version, "session_id": self.session_id}, event="start"
+        )
+
+    def _finish(self) -> Iterator[str]:
+        # 스트리밍 상태 없이 response 만 반환하는 에이전트는 마지막 응답을 한 번에 전송
+        if not self._sent_text and self._fallback_response:
+            yield from self._delta(self._fallback_response)
+
+        yield format_sse(
+            {"intent": self._intent, "next_node": self._next_node}, event="done"
+        )
+
+    def _encode_result(self, result: Dict[str, Any]) -> Iterator[str]:
+        if not result:
+            return
+        if result.get("error"):
+            yield self.error(result["error"])
+            return
+
+        self._intent = result.get("intent") or self._intent
+        self._next_node = result.get("next_node") or self._next_node
+
+        streaming = result.get("streaming") or {}
+        if streaming.get("message"):
+            message = streaming["message"][
+                : streaming.get("current_position", len(streaming["message"]))
+            ]
+            yield from self._delta(message)
+        elif result.get("response"):
+            self._fallback_response = result["response"]
+
+        context = result.get("context")
+        if context and context != self._context:
+            self._context = dict(context)
+            yield format_sse(self._context, event="context")
+
+    def _delta(self, message: str) -> Iterator[str]:
+        if message == self._sent_text:
+            return
+        if message.startswith(self._sent_text):
+            text = message[len(self._sent_text) :]
+            payload = {"text": text}
+        else:
+            payload = {"text": message, "reset": True}
+        self._sent_text = message
+        yield format_sse(payload, event="delta")
+
+
+def get_sse_encoder(version: int, session_id: str = "default"):
+    if version == SSE_PROTOCOL_V2:
+        return SSEEncoderV2(session_id=session_id)
+    return SSEEncoderV1()
+
+
+def _error_payload(error) -> Dict[str, Any]:
+    return {
+        "error": str(error),
+        "response": f"[대화 오류] {str(error)}",
+        "messages": [],
+        "context": {},
+    }
@@ -1,5 +1,6 @@
 from django.urls import path
 from tripmind.api.views.conversation_history_view import ConversationHistoryAPIView
+from tripmind.api.views.metrics_view import LLMMetricsView
 from tripmind.api.views.itinerary_api_view import (
     ItineraryAPIView,
     ItineraryDetailAPIView,
@@ -13,6 +14,7 @@ app_name = "tripmind"
 
 urlpatterns = [
     path("itinerary/", ItineraryAPIView.as_view(), name="itinerary"),
+    path("metrics/", LLMMetricsView.as_view(), name="llm-metrics"),
     # 하위 PATH는 현재 동작을 하지 않음.
     path(
         "conversation/",
@@ -1,5 +1,8 @@
 import json
-from django.http import StreamingHttpResponse
+import logging
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views import View
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -32,8 +35,35 @@ from tripmind.agents.conversation.conversation_agent_executor import (
 )
 from tripmind.agents.prompt_router.prompt_router_agent_executor import (
     PromptRouterAgentExecutor,
+    is_router_answer,
+    is_router_token,
 )
 from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.agents.supergraph.supergraph_agent_executor import (
+    SupergraphAgentExecutor,
+)
+from tripmind.api.streaming.event_buffer import (
+    get_last_event_id,
+    stream_event_store,
+)
+from tripmind.api.streaming.sse_protocol import (
+    STREAM_VERSION_HEADER,
+    get_sse_encoder,
+    negotiate_stream_version,
+)
+from tripmind.utils.component_registry import component_registry
+
+logger = logging.getLogger(__name__)
+
+# 의도별 에이전트 실행기 (상태가 없으므로 component_registry 에서 프로세스 공유)
+AGENT_EXECUTOR_CLASSES = {
+    Intent.CLASSIFY_INTENT.value: PromptRouterAgentExecutor,
+    Intent.ITINERARY.value: ItineraryAgentExecutor,
+    Intent.PLACE_SEARCH.value: PlaceSearchAgentExecutor,
+    Intent.SHARING.value: SharingRouterAgentExecutor,
+    Intent.CALENDAR.value: CalendarRouterAgentExecutor,
+    Intent.CONVERSATION.value: ConversationAgentExecutor,
+}
 
 
 # 프로덕션 환경에서는 비활성화 해야함
@@ -41,9 +71,24 @@ from tripmind.agents.prompt_router.constants.intent_constants import Intent
 class ItineraryAPIView(View):
     """
     여행 일정 전문 에이전트 API
+
+    ASGI 환경에서 비동기 제너레이터로 SSE 를 전송하므로 스트림마다 스레드를 점유하지 않는다.
+    ASGI 에서 SSE_RESUME 이 켜져 있으면 이벤트에 id 를 붙여 세션별 버퍼에 보관하고, 연결이 끊겨도
+    생성은 계속 진행한다. Last-Event-ID 로 재연결하면 놓친 이벤트부터 이어서 받는다.
     """
 
-    def post(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
+        """
+        스트림 재연결 API (EventSource 자동 재연결)
+
+        Last-Event-ID 헤더 또는 last_event_id 쿼리 파라미터 이후 이벤트를 보내고,
+        진행 중인 턴이면 끝날 때까지 이어서 보낸다. 세션의 마지막 턴이 보낸 id 가 아니면
+        (이어받을 턴이 없거나 이전 턴의 id) 204. POST 는 항상 새 턴을 시작한다.
+        """
+        response = self._resume_response(request, self._get_session_id(request))
+        return response or HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+    async def post(self, request, *args, **kwargs):
         """
         메시지 처리 API
         """
@@ -53,14 +98,40 @@ class ItineraryAPIView(View):
             if not serializer.is_valid():
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            session_id = request.session.session_key or request.headers.get(
-                "X-Session-ID", "default"
-            )
+            session_id = self._get_session_id(request)
 
             prompt = serializer.validated_data["message"]
+            encoder = get_sse_encoder(
+                negotiate_stream_version(request), session_id=session_id
+            )
+
+            if settings.AGENT_SUPERGRAPH:
+                # 라우팅부터 에이전트 응답까지 supergraph 한 번의 stream 으로 처리
+                return self._stream_response(
+                    request,
+                    session_id,
+                    encoder,
+                    self._event_stream(
+                        ItineraryService(self._get_supergraph_executor()),
+                        session_id,
+                        serializer,
+                        None,
+                        encoder,
+                    ),
+                )
+
+            if settings.ROUTER_COMBINED_RESPONSE:
+                # 의도 분류 호출이 대화 답변까지 만들 수 있으므로 라우팅부터 스트림 안에서 진행
+                return self._stream_response(
+                    request,
+                    session_id,
+                    encoder,
+                    self._routed_event_stream(prompt, session_id, encoder),
+                )
+
             agent_executor = self._get_agent_executor(Intent.CLASSIFY_INTENT.value)
 
-            router_result = agent_executor.process_prompt(
+            router_result = await agent_executor.aprocess_prompt(
                 prompt=prompt,
                 session_id=session_id,
             )
@@ -74,11 +145,13 @@ class ItineraryAPIView(View):
 
             itinerary_service = ItineraryService(agent_executor)
 
-            return StreamingHttpResponse(
+            return self._stream_response(
+                request,
+                session_id,
+                encoder,
                 self._event_stream(
-                    itinerary_service, session_id, serializer, next_node
+                    itinerary_service, session_id, serializer, next_node, encoder
                 ),
-                content_type="text/event-stream",
             )
         except json.JSONDecodeError:
             return Response(
@@ -91,37 +164,103 @@ class ItineraryAPIView(View):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _get_session_id(self, request):
+        return request.session.session_key or request.headers.get(
+            "X-Session-ID", "default"
+        )
+
+    def _stream_response(self, request, session_id, encoder, frames):
+        # WSGI(runserver, 테스트 Client)에서는 async_to_sync 가 post() 반환 시 이벤트 루프의
+        # 태스크를 취소하므로, 백그라운드 생성은 ASGI 에서만 사용하고 그 외에는 바로 스트리밍
+        if settings.SSE_RESUME["enabled"] and isinstance(request, ASGIRequest):
+            # 생성은 백그라운드 태스크로 진행하고 응답은 버퍼를 구독
+            frames = stream_event_store.start_turn(
+                session_id, frames, encoder
+            ).subscribe()
+        response = StreamingHttpResponse(frames, content_type="text/event-stream")
+        response[STREAM_VERSION_HEADER] = str(encoder.version)
+        return response
+
+    def _resume_response(self, request, session_id):
+        last_event_id = get_last_event_id(request)
+        if last_event_id is None or not settings.SSE_RESUME["enabled"]:
+            return None
+        turn = stream_event_store.get(session_id)
+        if turn is None or not turn.has_event(last_event_id):
+            return None
+        response = StreamingHttpResponse(
+            turn.subscribe(last_event_id), content_type="text/event-stream"
+        )
+        response[STREAM_VERSION_HEADER] = str(turn.encoder.version)
+        return response
+
     def _get_agent_executor(self, intent):
-        if intent == Intent.CLASSIFY_INTENT.value:
-            return PromptRouterAgentExecutor()
-        elif intent == Intent.ITINERARY.value:
-            return ItineraryAgentExecutor()
-        elif intent == Intent.PLACE_SEARCH.value:
-            return PlaceSearchAgentExecutor()
-        elif intent == Intent.SHARING.value:
-            return SharingRouterAgentExecutor()
-        elif intent == Intent.CALENDAR.value:
-            return CalendarRouterAgentExecutor()
-        else:
-            return ConversationAgentExecutor()
+        if intent not in AGENT_EXECUTOR_CLASSES:
+            intent = Intent.CONVERSATION.value
+        return component_registry.get(
+            f"agent_executor:{intent}", AGENT_EXECUTOR_CLASSES[intent]
+        )
+
+    def _get_supergraph_executor(self):
+        return component_registry.get(
+            "agent_executor:supergraph", SupergraphAgentExecutor
+        )
 
-    def _event_stream(self, itinerary_service, session_id, serializer, next_node):
+    async def _event_stream(
+        self, itinerary_service, session_id, serializer, next_node, encoder
+    ):
         try:
-            for result in itinerary_service.process_message(
-                session_id=session_id,
-                message=serializer.validated_data["message"],
-                start_node=next_node,
-            ):
-                if result:
-                    yield f"data: {json.dumps(result)}\n\n"
+            with component_registry.track_request(f"session={session_id}"):
+                async for frame in encoder.aencode(
+                    itinerary_service.aprocess_message(
+                        session_id=session_id,
+                        message=serializer.validated_data["message"],
+                        start_node=next_node,
+                    )
+                ):
+                    yield frame
         except Exception as e:
-            error_response = {
-                "error": str(e),
-                "response": f"[대화 오류] {str(e)}",
-                "messages": [],
-                "context": {},
-            }
-            yield f"data: {json.dumps(error_response)}\n\n"
+            yield encoder.error(e)
+
+    async def _routed_event_stream(self, prompt, session_id, encoder):
+        try:
+            with component_registry.track_request(f"session={session_id}"):
+                async for frame in encoder.aencode(
+                    self._arouted_results(prompt, session_id)
+                ):
+                    yield frame
+        except Exception as e:
+            yield encoder.error(e)
+
+    async def _arouted_results(self, prompt, session_id):
+        """
+        라우터 결과를 스트리밍으로 받아, 라우터가 직접 답변했으면(일반 대화 / 인사)
+        그 답변으로 끝내고 아니면 분류된 에이전트로 이어서 처리한다.
+        """
+        router_result = {}
+        async for result in self._get_agent_executor(
+            Intent.CLASSIFY_INTENT.value
+        ).astream_prompt(prompt=prompt, session_id=session_id):
+            if is_router_token(result):
+                yield result
+            else:
+                router_result = result
+
+        if is_router_answer(router_result) or not router_result.get("intent"):
+            yield router_result
+            return
+
+        logger.info(f"메시지: '{prompt}' -> 분류된 의도: {router_result['intent']}")
+
+        itinerary_service = ItineraryService(
+            self._get_agent_executor(router_result["intent"])
+        )
+        async for result in itinerary_service.aprocess_message(
+            session_id=session_id,
+            message=prompt,
+            start_node=router_result["next_node"],
+        ):
+            yield result
 
 
 class ItineraryDetailAPIView(View):
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.views import View
+from tripmind.clients.llm.llm_metrics import llm_metrics
+from tripmind.utils.component_registry import component_registry
+from tripmind.utils.startup_report import startup_report
+
+
+def _backend_llm_metrics():
+    # fake 백엔드(부하 테스트)는 파일로 남기지 않는 별도 핸들러에 집계
+    if settings.LLM_BACKEND == "fake":
+        from tripmind.clients.llm.fake_llm_client import fake_llm_metrics
+
+        return fake_llm_metrics
+    return llm_metrics
+
+
+class LLMMetricsView(View):
+    """LLM 호출 지표, 워커 콜드 스타트 시간, 공유 구성 요소 생성 수 (Prometheus 텍스트 형식)"""
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(
+            _backend_llm_metrics().render_prometheus()
+            + startup_report.render_prometheus()
+            + component_registry.render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
@@ -0,0 +1,40 @@
+import itertools
+import threading
+from typing import Any, Dict, List
+
+from tripmind.clients.calendar.base_calendar_client import BaseCalendarClient
+
+
+class FakeCalendarClient(BaseCalendarClient):
+    """
+    Google Calendar API 대신 이벤트를 메모리에만 보관하는 클라이언트.
+    LLM_BACKEND=fake 부하 테스트가 인증 정보 없이 캘린더 도구를 실행하도록 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.events: List[Dict[str, Any]] = []
+
+    def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            event_id = f"fake-event-{next(self._ids)}"
+            event = {
+                **event_data,
+                "id": event_id,
+                "htmlLink": f"https://calendar.google.com/event?eid={event_id}",
+            }
+            self.events.append(event)
+        return dict(event)
+
+    def get_events(self, time_min: str, time_max: str) -> List[Dict[str, Any]]:
+        # dateTime 은 ISO 형식이므로 날짜 부분 문자열 비교로 기간을 거른다
+        start_date, end_date = time_min[:10], time_max[:10]
+        with self._lock:
+            return [
+                dict(event)
+                for event in self.events
+                if start_date
+                <= event.get("start", {}).get("dateTime", "")[:10]
+                <= end_date
+            ]
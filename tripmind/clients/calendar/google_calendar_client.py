@@ -1,5 +1,8 @@
 import os
+import threading
 from typing import Dict, Any, List
+import google_auth_httplib2
+import httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from tripmind.clients.calendar.base_calendar_client import BaseCalendarClient
@@ -10,21 +13,35 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
 
 class GoogleCalendarClient(BaseCalendarClient):
+    """
+    인증 정보와 discovery 로 만든 서비스 객체는 공유하고, httplib2 전송 계층은 스레드 안전하지
+    않으므로 요청 실행(execute)에는 스레드별 AuthorizedHttp 를 사용한다.
+    """
 
     def __init__(self, calendar_id: str, config_path: str):
         service_account_file = config_path
         self.calendar_id = calendar_id
 
-        credentials = service_account.Credentials.from_service_account_file(
+        self.credentials = service_account.Credentials.from_service_account_file(
             service_account_file or os.getenv("GOOGLE_CREDENTIALS_PATH"), scopes=SCOPES
         )
-        self.service = build("calendar", "v3", credentials=credentials)
+        self.service = build("calendar", "v3", credentials=self.credentials)
+        self._local = threading.local()
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http()
+            )
+            self._local.http = http
+        return http
 
     def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         result = (
             self.service.events()
             .insert(calendarId=self.calendar_id, body=event_data)
-            .execute()
+            .execute(http=self._http())
         )
         return result
 
@@ -38,6 +55,6 @@ class GoogleCalendarClient(BaseCalendarClient):
                 singleEvents=True,
                 orderBy="startTime",
             )
-            .execute()
+            .execute(http=self._http())
         )
         return events_result.get("items", [])
@@ -1,11 +1,13 @@
 from abc import abstractmethod
+from typing import Optional
 from langchain_core.language_models.base import BaseLanguageModel
 from langchain_core.output_parsers import BaseOutputParser
 
 
 class BaseLLMClient:
     @abstractmethod
-    def get_llm(self) -> BaseLanguageModel:
+    def get_llm(self, node_name: Optional[str] = None) -> BaseLanguageModel:
+        """node_name 이 주어지면 해당 노드의 모델 프로필을 사용"""
         pass
 
     @abstractmethod
@@ -1,23 +1,65 @@
 import os
-from typing import Optional
-from langchain_anthropic import ChatAnthropic
+import threading
+from typing import Dict, Optional
 from langchain.llms.base import BaseLLM
 from pydantic import BaseModel
 from tripmind.clients.llm.base_llm_client import BaseLLMClient
+from tripmind.clients.llm.latency_policy import latency_guard
+from tripmind.clients.llm.llm_gateway import GatewayChatAnthropic
+from tripmind.clients.llm.llm_metrics import llm_metrics
+from tripmind.clients.llm.model_registry import ModelProfile, model_registry
+from tripmind.clients.llm.response_cache import llm_response_cache
+from tripmind.clients.llm.single_flight import single_flight
 from langchain.output_parsers import PydanticOutputParser
 from langchain.agents import OpenAIFunctionsAgent
 
 
 class ClaudeClient(BaseLLMClient):
     def __init__(self):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        model = os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514")
-        self.llm: Optional[BaseLLM] = ChatAnthropic(
-            model=model, anthropic_api_key=api_key, max_tokens=3000
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self._lock = threading.Lock()
+        self._llms: Dict[ModelProfile, BaseLLM] = {}
+        self.llm: Optional[BaseLLM] = self.get_llm()
+
+    def get_llm(self, node_name: Optional[str] = None) -> BaseLLM:
+        """노드 이름에 해당하는 모델 프로필의 LLM (같은 프로필은 인스턴스 공유)"""
+        profile = model_registry.get_profile(node_name)
+        with self._lock:
+            llm = self._llms.get(profile)
+            if llm is None:
+                llm = self._create_llm(profile)
+                self._llms[profile] = llm
+            return llm
+
+    def _create_llm(self, profile: ModelProfile) -> BaseLLM:
+        # 라우터 / 대화 / 일정 노드의 모든 호출은 llm_gateway 의 동시성 제한과 커넥션 풀을 공유
+        # 시스템 프롬프트의 cache_control 블록에 대한 캐시 적중/미스는 노드별로 집계
+        # 응답 캐시가 켜진 노드의 동일 요청은 게이트웨이를 거치지 않고 캐시에서 반환
+        return GatewayChatAnthropic(
+            model=profile.model,
+            anthropic_api_key=self.api_key,
+            max_tokens=profile.max_tokens,
+            temperature=profile.temperature,
+            # 재시도는 SDK 대신 노드별 latency_guard 정책으로 처리
+            max_retries=0,
+            callbacks=[llm_metrics],
+            cache=llm_response_cache,
         )
 
-    def get_llm(self) -> BaseLLM:
-        return self.llm
+    def get_prompt_cache_stats(self) -> dict:
+        return llm_metrics.get_prompt_cache_stats()
+
+    def get_response_cache_stats(self) -> dict:
+        return llm_response_cache.get_stats() if llm_response_cache else {}
+
+    def get_single_flight_stats(self) -> dict:
+        return single_flight.get_stats()
+
+    def get_latency_stats(self) -> dict:
+        return latency_guard.metrics.get_stats()
+
+    def get_llm_metrics(self) -> dict:
+        return llm_metrics.get_stats()
 
     def get_output_parser(self, pydantic_object: BaseModel) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=pydantic_object)
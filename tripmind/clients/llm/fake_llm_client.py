@@ -0,0 +1,493 @@
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from django.conf import settings
+from langchain.agents.output_parsers import ReActJsonSingleInputOutputParser
+from langchain.output_parsers import PydanticOutputParser
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, ConfigDict, Field
+
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.clients.llm.base_llm_client import BaseLLMClient
+from tripmind.clients.llm.llm_metrics import LLMMetricsHandler
+from tripmind.clients.llm.model_registry import model_registry
+from tripmind.services.session.token_budgeted_memory import estimate_tokens
+
+DEFAULT_NODE = "default"
+
+# 테스트 / 부하 테스트 호출은 실제 호출 기록(JSONL)에 남기지 않고 메모리에서만 집계
+fake_llm_metrics = LLMMetricsHandler(persist=False)
+
+# (현재 사용자 입력, 전체 메시지, 결정적 난수) -> 응답 텍스트
+Responder = Callable[[str, List[BaseMessage], random.Random], str]
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    첫 토큰까지의 지연 시간 분포 (초)
+
+    - fixed: 항상 mean
+    - uniform: [mean - spread, mean + spread]
+    - normal: 평균 mean, 표준편차 spread (0 미만은 0)
+    - lognormal: 중앙값 mean, log 공간 표준편차 spread (꼬리가 긴 API 지연 재현)
+    """
+
+    distribution: str = "fixed"
+    mean: float = 0.0
+    spread: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal":
+            value = rng.lognormvariate(math.log(self.mean), self.spread)
+        else:
+            value = self.mean
+        return max(value, 0.0)
+
+
+@dataclass(frozen=True)
+class FakeNodeProfile:
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    # 첫 토큰 이후 스트리밍 속도, 0 이면 나머지를 지연 없이 전송
+    tokens_per_second: float = 0.0
+    chunk_chars: int = 4
+
+
+def _last_user_input(messages: List[BaseMessage]) -> str:
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            content = (
+                message.content
+                if isinstance(message.content, str)
+                else str(message.content)
+            )
+            # 일정 노드는 "추가 정보 ... 현재 요청:\n<입력>" 형태로 전달
+            if "현재 요청:" in content:
+                content = content.split("현재 요청:", 1)[1]
+            return content.strip()
+    return ""
+
+
+_INTENT_PATTERNS = [
+    (Intent.SHARING, re.compile(r"공유")),
+    (Intent.CALENDAR, re.compile(r"캘린더|달력")),
+    (Intent.ITINERARY, re.compile(r"일정|계획|코스|\d+\s*박|\d+\s*일")),
+    (Intent.PLACE_SEARCH, re.compile(r"맛집|카페|숙소|장소|근처")),
+    (Intent.GREETING, re.compile(r"안녕|반가|^hello|^hi\b")),
+]
+
+_DESTINATIONS = ("서울", "부산", "제주", "강릉", "경주", "전주", "여수", "속초", "대구")
+
+
+def classify_intent_response(
+    user_input: str, messages: List[BaseMessage], rng: random.Random
+) -> str:
+    """의도 분류 프롬프트 형식({"intent": ...})의 JSON"""
+    lowered = user_input.lower()
+    intent = next(
+        (intent for intent, pattern in _INTENT_PATTERNS if pattern.search(lowered)),
+        Intent.CONVERSATION,
+    )
+    return json.dumps({"intent": intent.value})
+
+
+def classify_and_respond_response(
+    user_input: str, messages: List[BaseMessage], rng: random.Random
+) -> str:
+    """결합 라우터 프롬프트 형식: 대화 / 인사면 {"intent", "response"}, 아니면 {"intent"}"""
+    intent = json.loads(classify_intent_response(user_input, messages, rng))["intent"]
+    if intent not in (Intent.CONVERSATION.value, Intent.GREETING.value):
+        return json.dumps({"intent": intent})
+    return json.dumps(
+        {"intent": intent, "response": text_response(user_input, messages, rng)},
+        ensure_ascii=False,
+    )
+
+
+def itinerary_response(
+    user_input: str, messages: List[BaseMessage], rng: random.Random
+) -> str:
+    """structured chat agent 형식의 FinalResponse 툴 호출 (FinalResponseListInput)"""
+    destination = next(
+        (name for name in _DESTINATIONS if name in user_input),
+        rng.choice(_DESTINATIONS),
+    )
+    days_match = re.search(r"(\d+)\s*일", user_input)
+    days = min(int(days_match.group(1)), 5) if days_match else rng.randint(1, 3)
+    date_match = re.search(r"\d{4}-\d{2}-\d{2}", user_input)
+    start = (
+        date.fromisoformat(date_match.group(0))
+        if date_match
+        else date(2025, 6, 1) + timedelta(days=rng.randint(0, 60))
+    )
+
+    items = []
+    for day in range(days):
+        activities = [
+            {
+                "time": f"{hour:02d}:00",
+                "title": f"{destination} 명소 {day * 3 + index + 1}",
+                "description": f"{destination}에서 {hour}시에 방문하기 좋은 장소입니다.",
+                "address": f"{destination} 중심가 {rng.randint(1, 200)}",
+            }
+            for index, hour in enumerate((9, 13, 18))
+        ]
+        items.append(
+            {
+                "title": f"{destination} {days}일 여행 - {day + 1}일차",
+                "destination": destination,
+                "duration": f"{days}일",
+                "date": (start + timedelta(days=day)).isoformat(),
+                "activities": activities,
+                "tips": ["편한 신발을 착용하세요"],
+                "natural_text": (
+                    f"{day + 1}일차에는 "
+                    + ", ".join(f"{a['time']} {a['title']}" for a in activities)
+                    + " 순서로 둘러보세요."
+                ),
+            }
+        )
+
+    action = {"action": "FinalResponse", "action_input": {"items": items}}
+    return f"```json\n{json.dumps(action, ensure_ascii=False, indent=2)}\n```"
+
+
+def summary_response(
+    user_input: str, messages: List[BaseMessage], rng: random.Random
+) -> str:
+    return "사용자는 여행 일정을 상담했고, 여행지와 날짜 선호를 이야기했습니다."
+
+
+def text_response(
+    user_input: str, messages: List[BaseMessage], rng: random.Random
+) -> str:
+    return (
+        f"'{user_input[:40]}'에 대해 답변드릴게요. "
+        "여행지, 일정, 인원을 알려주시면 더 자세히 도와드릴 수 있어요."
+    )
+
+
+DEFAULT_RESPONDERS: Dict[str, Responder] = {
+    "classify_intent_node": classify_intent_response,
+    "classify_intent_respond": classify_and_respond_response,
+    "itinerary_node": itinerary_response,
+    "memory_summary": summary_response,
+    DEFAULT_NODE: text_response,
+}
+
+
+def script_responder(templates: List[str]) -> Responder:
+    """스크립트 파일의 응답 템플릿 중 하나를 결정적으로 골라 {input} 을 치환"""
+
+    def respond(user_input: str, messages: List[BaseMessage], rng: random.Random):
+        return rng.choice(templates).replace("{input}", user_input)
+
+    return respond
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    실제 API 호출 없이 노드별 응답을 생성하는 채팅 모델
+
+    같은 seed / 노드 / 메시지에 대해서는 응답, 지연 시간, 청크 분할이 항상 같다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: str = "fake"
+    node_name: str = DEFAULT_NODE
+    responder: Responder = Field(default=text_response, exclude=True)
+    profile: FakeNodeProfile = Field(default_factory=FakeNodeProfile, exclude=True)
+    seed: int = 0
+    # 모든 대기 시간에 곱하는 값 (0 이면 지연 없이 응답)
+    time_scale: float = 1.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "tripmind-fake"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model": self.model, "node_name": self.node_name, "seed": self.seed}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        """tool calling agent 용. 바인딩된 도구 이름의 action 응답은 네이티브 tool call 로 반환"""
+        return self.bind(
+            tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        plan = self._plan(messages, stop, kwargs.get("tools"))
+        time.sleep(plan.first_token_delay + sum(delay for _, delay in plan.chunks))
+        return self._result(messages, plan)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        plan = self._plan(messages, stop, kwargs.get("tools"))
+        await asyncio.sleep(
+            plan.first_token_delay + sum(delay for _, delay in plan.chunks)
+        )
+        return self._result(messages, plan)
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        plan = self._plan(messages, stop, kwargs.get("tools"))
+        time.sleep(plan.first_token_delay)
+        for index, (chunk, delay) in enumerate(plan.chunks):
+            generation = self._chunk(messages, plan, chunk, index)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk, chunk=generation)
+            yield generation
+            time.sleep(delay)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        plan = self._plan(messages, stop, kwargs.get("tools"))
+        await asyncio.sleep(plan.first_token_delay)
+        for index, (chunk, delay) in enumerate(plan.chunks):
+            generation = self._chunk(messages, plan, chunk, index)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk, chunk=generation)
+            yield generation
+            await asyncio.sleep(delay)
+
+    def _plan(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> "_ResponsePlan":
+        prompt = "\n".join(str(message.content) for message in messages)
+        rng = random.Random(f"{self.seed}:{self.node_name}:{prompt}")
+
+        text = self.responder(_last_user_input(messages), messages, rng)
+        for stop_sequence in stop or []:
+            text = text.split(stop_sequence, 1)[0]
+
+        tool_call = _as_tool_call(text, tools, rng) if tools else None
+        payload = (
+            json.dumps(tool_call["args"], ensure_ascii=False) if tool_call else text
+        )
+
+        size = max(self.profile.chunk_chars, 1)
+        pieces = [payload[i : i + size] for i in range(0, len(payload), size)] or [""]
+        tps = self.profile.tokens_per_second
+        return _ResponsePlan(
+            text="" if tool_call else text,
+            tool_call=tool_call,
+            first_token_delay=self.profile.latency.sample(rng) * self.time_scale,
+            chunks=[
+                (
+                    piece,
+                    estimate_tokens(piece) / tps * self.time_scale if tps > 0 else 0.0,
+                )
+                for piece in pieces
+            ],
+            usage=self._usage(messages, payload),
+        )
+
+    def _usage(self, messages: List[BaseMessage], text: str) -> Dict[str, int]:
+        input_tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        output_tokens = estimate_tokens(text)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _result(self, messages: List[BaseMessage], plan: "_ResponsePlan") -> ChatResult:
+        message = AIMessage(
+            content=plan.text,
+            tool_calls=[plan.tool_call] if plan.tool_call else [],
+            usage_metadata=plan.usage,
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _chunk(
+        self,
+        messages: List[BaseMessage],
+        plan: "_ResponsePlan",
+        chunk: str,
+        index: int,
+    ) -> ChatGenerationChunk:
+        # 사용량은 마지막 청크에만 실어 합쳤을 때 한 번만 더해지게 한다
+        usage = plan.usage if index == len(plan.chunks) - 1 else None
+        if plan.tool_call is None:
+            message = AIMessageChunk(content=chunk, usage_metadata=usage)
+        else:
+            first = index == 0
+            message = AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {
+                        "name": plan.tool_call["name"] if first else None,
+                        "args": chunk,
+                        "id": plan.tool_call["id"] if first else None,
+                        "index": 0,
+                    }
+                ],
+                usage_metadata=usage,
+            )
+        return ChatGenerationChunk(message=message)
+
+
+@dataclass
+class _ResponsePlan:
+    """응답 내용과 첫 토큰 지연, [(청크, 청크 이후 지연)]"""
+
+    text: str
+    tool_call: Optional[Dict[str, Any]]
+    first_token_delay: float
+    chunks: List[Tuple[str, float]]
+    usage: Dict[str, int]
+
+
+def _as_tool_call(
+    text: str, tools: List[Dict[str, Any]], rng: random.Random
+) -> Optional[Dict[str, Any]]:
+    """structured chat 형식의 action 응답을 바인딩된 도구의 네이티브 tool call 로 변환"""
+    try:
+        action = parse_json_markdown(text)
+    except Exception:
+        return None
+    tool_names = {tool["function"]["name"] for tool in tools}
+    if not isinstance(action, dict) or action.get("action") not in tool_names:
+        return None
+    return {
+        "name": action["action"],
+        "args": action.get("action_input") or {},
+        "id": f"toolu_fake_{rng.getrandbits(48):012x}",
+    }
+
+
+class FakeLLMClient(BaseLLMClient):
+    """
+    부하 테스트 / 벤치마크용 LLM 백엔드 (LLM_BACKEND=fake)
+
+    노드별로 유효한 형식의 응답(의도 JSON, FinalResponse 툴 호출 등)을 돌려주고,
+    FAKE_LLM 설정의 지연 시간 분포와 토큰 스트리밍 속도를 재현한다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        responders: Optional[Dict[str, Responder]] = None,
+    ):
+        config = config if config is not None else settings.FAKE_LLM
+        self.seed = int(config.get("seed", 0))
+        self.time_scale = float(config.get("time_scale", 1.0))
+        self.profiles = {
+            node_name: self._parse_profile(values)
+            for node_name, values in (config.get("nodes") or {}).items()
+        }
+        self.responders = {**DEFAULT_RESPONDERS, **(responders or {})}
+        if config.get("script"):
+            self.responders.update(self._load_script(config["script"]))
+
+        self._lock = threading.Lock()
+        self._llms: Dict[str, FakeChatModel] = {}
+        self.llm = self.get_llm()
+
+    def get_llm(self, node_name: Optional[str] = None) -> FakeChatModel:
+        node_name = node_name or DEFAULT_NODE
+        with self._lock:
+            if node_name not in self._llms:
+                self._llms[node_name] = FakeChatModel(
+                    model=f"fake-{model_registry.get_profile(node_name).model}",
+                    node_name=node_name,
+                    responder=self.responders.get(
+                        node_name, self.responders[DEFAULT_NODE]
+                    ),
+                    profile=self.profiles.get(
+                        node_name, self.profiles.get(DEFAULT_NODE, FakeNodeProfile())
+                    ),
+                    seed=self.seed,
+                    time_scale=self.time_scale,
+                    callbacks=[fake_llm_metrics],
+                )
+            return self._llms[node_name]
+
+    def get_llm_metrics(self) -> dict:
+        return fake_llm_metrics.get_stats()
+
+    def get_output_parser(self, pydantic_object: BaseModel) -> PydanticOutputParser:
+        return PydanticOutputParser(pydantic_object=pydantic_object)
+
+    def get_json_output_parser(self) -> ReActJsonSingleInputOutputParser:
+        return ReActJsonSingleInputOutputParser()
+
+    def _parse_profile(self, values: Dict[str, Any]) -> FakeNodeProfile:
+        return FakeNodeProfile(
+            latency=LatencyDistribution(**(values.get("latency") or {})),
+            tokens_per_second=float(values.get("tokens_per_second", 0.0)),
+            chunk_chars=int(values.get("chunk_chars", 4)),
+        )
+
+    def _load_script(self, path: str) -> Dict[str, Responder]:
+        """{"노드 이름": ["응답 템플릿", ...]} 형식의 JSON 스크립트"""
+        with open(path, "r", encoding="utf-8") as f:
+            script = json.load(f)
+        return {
+            node_name: script_responder(
+                templates if isinstance(templates, list) else [templates]
+            )
+            for node_name, templates in script.items()
+        }
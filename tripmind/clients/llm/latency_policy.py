@@ -0,0 +1,426 @@
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+import anthropic
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICY = "default"
+
+# 재시도할 일시적 오류 상태 코드 (529: Anthropic overloaded)
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class LLMTimeoutError(TimeoutError):
+    """노드의 LLM 호출 시간 제한 초과"""
+
+
+class AttemptAbandoned(Exception):
+    """헤지 경쟁에서 진 시도가 아직 시작 전이면 호출하지 않고 끝낸다"""
+
+
+class AttemptLease:
+    """
+    헤지된 동기 시도 하나가 잡은 자원 (llm_gateway 슬롯 등)
+
+    워커 스레드의 HTTP 호출은 중간에 취소할 수 없으므로, 경쟁에서 진 시도는 abandon() 으로
+    자원을 먼저 돌려준다. 호출 자체는 백그라운드에서 끝나고 결과는 버린다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self.abandoned = False
+
+    def on_abandon(self, callback: Callable[[], None]):
+        with self._lock:
+            if not self.abandoned:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def abandon(self):
+        with self._lock:
+            if self.abandoned:
+                return
+            self.abandoned = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+# 현재 스레드에서 실행 중인 헤지 시도 (없으면 None)
+current_attempt: contextvars.ContextVar[Optional[AttemptLease]] = (
+    contextvars.ContextVar("llm_attempt_lease", default=None)
+)
+
+
+@dataclass(frozen=True)
+class LatencyPolicy:
+    timeout: float = 60.0  # 시도당 시간 제한 (초)
+    max_retries: int = 2  # 일시적 오류 재시도 횟수
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    hedge: bool = False  # 비스트리밍 호출이 p95 를 넘으면 두 번째 요청 발사
+    hedge_after: float = 2.0  # p95 를 추정할 표본이 부족할 때의 헤지 시점 (초)
+    budget: Optional[float] = None  # 노드 전체(에이전트 실행) 시간 예산 (초)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    # asyncio.TimeoutError 는 TimeoutError 와 같으므로 LLMTimeoutError 와 함께 처리된다
+    if isinstance(
+        error, (TimeoutError, anthropic.APITimeoutError, anthropic.APIConnectionError)
+    ):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in TRANSIENT_STATUS_CODES
+    return False
+
+
+class LatencyMetrics:
+    """노드별 LLM 호출 결과(성공/타임아웃/재시도/헤지)와 지연 시간 집계"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {
+                "calls": 0,
+                "success": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "retries": 0,
+                "hedges": 0,
+                "hedge_wins": 0,
+            }
+        )
+
+    def incr(self, node_name: str, outcome: str):
+        with self._lock:
+            self._counts[node_name][outcome] += 1
+
+    def record_latency(self, node_name: str, seconds: float):
+        with self._lock:
+            self._latencies[node_name].append(seconds)
+
+    def percentile(self, node_name: str, q: float) -> Optional[float]:
+        with self._lock:
+            latencies = list(self._latencies[node_name])
+        if len(latencies) < self.min_samples:
+            return None
+        return float(np.percentile(latencies, q))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            nodes = {
+                node: (dict(counts), list(self._latencies[node]))
+                for node, counts in self._counts.items()
+            }
+
+        stats = {}
+        for node, (counts, latencies) in nodes.items():
+            if latencies:
+                counts["p50_ms"] = round(float(np.percentile(latencies, 50)) * 1000, 1)
+                counts["p95_ms"] = round(float(np.percentile(latencies, 95)) * 1000, 1)
+            stats[node] = counts
+        return stats
+
+
+class LatencyGuard:
+    """
+    노드별 지연 시간 정책(LatencyPolicy)으로 LLM 호출에 시간 제한,
+    지터 재시도, 헤지 요청을 적용하고 결과를 LatencyMetrics 에 기록한다.
+
+    - 시도 함수는 남은 시간(timeout, 초)을 인자로 받는다.
+    - 스트리밍 호출은 첫 청크를 받기 전에만 재시도한다 (중복 토큰 방지).
+    """
+
+    def __init__(
+        self,
+        policies: Dict[str, Dict[str, Any]],
+        metrics: Optional[LatencyMetrics] = None,
+    ):
+        self.default_policy = LatencyPolicy(**policies.get(DEFAULT_POLICY, {}))
+        self._policies = {
+            node_name: replace(self.default_policy, **policy)
+            for node_name, policy in policies.items()
+            if node_name != DEFAULT_POLICY
+        }
+        self.metrics = metrics or LatencyMetrics()
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="llm-hedge"
+        )
+
+    @classmethod
+    def from_settings(cls) -> "LatencyGuard":
+        return cls(settings.LLM_LATENCY_POLICIES)
+
+    def get_policy(self, node_name: Optional[str] = None) -> LatencyPolicy:
+        return self._policies.get(node_name, self.default_policy)
+
+    def call(self, node_name: str, attempt: Callable[[float], Any]) -> Any:
+        policy = self.get_policy(node_name)
+        for retry in range(policy.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                self.metrics.incr(node_name, "calls")
+                if policy.hedge:
+                    result = self._hedged_call(node_name, policy, attempt)
+                else:
+                    result = attempt(policy.timeout)
+            except Exception as e:
+                if not self._on_error(node_name, policy, retry, e):
+                    raise
+                time.sleep(self._backoff(policy, retry))
+                continue
+            self._on_success(node_name, started)
+            return result
+
+    async def acall(
+        self, node_name: str, attempt: Callable[[float], Awaitable[Any]]
+    ) -> Any:
+        policy = self.get_policy(node_name)
+        for retry in range(policy.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                self.metrics.incr(node_name, "calls")
+                if policy.hedge:
+                    result = await self._ahedged_call(node_name, policy, attempt)
+                else:
+                    result = await asyncio.wait_for(
+                        attempt(policy.timeout), policy.timeout
+                    )
+            except Exception as e:
+                if not self._on_error(node_name, policy, retry, e):
+                    raise
+                await asyncio.sleep(self._backoff(policy, retry))
+                continue
+            self._on_success(node_name, started)
+            return result
+
+    def stream(
+        self, node_name: str, producer: Callable[[float], Iterator[Any]]
+    ) -> Iterator[Any]:
+        policy = self.get_policy(node_name)
+        for retry in range(policy.max_retries + 1):
+            started = time.perf_counter()
+            deadline = started + policy.timeout
+            received = False
+            iterator = producer(policy.timeout)
+            try:
+                self.metrics.incr(node_name, "calls")
+                for chunk in iterator:
+                    # 동기 스트림의 읽기 대기는 SDK 요청 timeout 이 끊고, 전체 시간은 청크마다 확인
+                    if time.perf_counter() > deadline:
+                        raise LLMTimeoutError(
+                            f"{node_name} LLM 스트림 시간 초과 ({policy.timeout}s)"
+                        )
+                    received = True
+                    yield chunk
+            except Exception as e:
+                iterator.close()
+                if received or not self._on_error(node_name, policy, retry, e):
+                    if received:
+                        self._record_failure(node_name, e)
+                    raise
+                time.sleep(self._backoff(policy, retry))
+                continue
+            self._on_success(node_name, started)
+            return
+
+    async def astream(
+        self, node_name: str, producer: Callable[[float], AsyncIterator[Any]]
+    ) -> AsyncIterator[Any]:
+        policy = self.get_policy(node_name)
+        for retry in range(policy.max_retries + 1):
+            started = time.perf_counter()
+            deadline = started + policy.timeout
+            received = False
+            iterator = producer(policy.timeout).__aiter__()
+            try:
+                self.metrics.incr(node_name, "calls")
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    try:
+                        chunk = await asyncio.wait_for(
+                            iterator.__anext__(), max(remaining, 0)
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        raise LLMTimeoutError(
+                            f"{node_name} LLM 스트림 시간 초과 ({policy.timeout}s)"
+                        )
+                    received = True
+                    yield chunk
+            except Exception as e:
+                await self._aclose(iterator)
+                if received or not self._on_error(node_name, policy, retry, e):
+                    if received:
+                        self._record_failure(node_name, e)
+                    raise
+                await asyncio.sleep(self._backoff(policy, retry))
+                continue
+            except BaseException:
+                # 취소 / 연결 종료 시에도 진행 중인 스트림(게이트웨이 슬롯)을 정리
+                await self._aclose(iterator)
+                raise
+            self._on_success(node_name, started)
+            return
+
+    def hedge_delay(self, node_name: str, policy: LatencyPolicy) -> float:
+        p95 = self.metrics.percentile(node_name, 95)
+        return min(p95 if p95 is not None else policy.hedge_after, policy.timeout)
+
+    def _hedged_call(
+        self, node_name: str, policy: LatencyPolicy, attempt: Callable[[float], Any]
+    ) -> Any:
+        started = time.perf_counter()
+        primary = self._submit(attempt, policy.timeout)
+        done, _ = wait([primary], timeout=self.hedge_delay(node_name, policy))
+        if done:
+            return primary.result()
+
+        self.metrics.incr(node_name, "hedges")
+        remaining = max(policy.timeout - (time.perf_counter() - started), 0)
+        hedge = self._submit(attempt, remaining)
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=max(policy.timeout - (time.perf_counter() - started), 0),
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    raise LLMTimeoutError(
+                        f"{node_name} LLM 호출 시간 초과 ({policy.timeout}s)"
+                    )
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            self.metrics.incr(node_name, "hedge_wins")
+                        return future.result()
+            return primary.result()
+        finally:
+            # 늦게 끝나는 요청은 백그라운드에서 마저 끝나고 결과는 버리되, 슬롯은 바로 돌려준다
+            for future in (primary, hedge):
+                future.lease.abandon()
+
+    async def _ahedged_call(
+        self,
+        node_name: str,
+        policy: LatencyPolicy,
+        attempt: Callable[[float], Awaitable[Any]],
+    ) -> Any:
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(attempt(policy.timeout))
+        done, _ = await asyncio.wait(
+            {primary}, timeout=self.hedge_delay(node_name, policy)
+        )
+        if done:
+            return primary.result()
+
+        self.metrics.incr(node_name, "hedges")
+        remaining = max(policy.timeout - (time.perf_counter() - started), 0)
+        hedge = asyncio.ensure_future(attempt(remaining))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(policy.timeout - (time.perf_counter() - started), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    raise LLMTimeoutError(
+                        f"{node_name} LLM 호출 시간 초과 ({policy.timeout}s)"
+                    )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.metrics.incr(node_name, "hedge_wins")
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+
+    def _submit(self, attempt: Callable[[float], Any], timeout: float):
+        # 실행 중인 노드의 runnable config(contextvar)를 워커 스레드에 전달
+        context = contextvars.copy_context()
+        lease = AttemptLease()
+        future = self._hedge_executor.submit(
+            context.run, self._run_attempt, lease, attempt, timeout
+        )
+        future.lease = lease
+        return future
+
+    @staticmethod
+    def _run_attempt(
+        lease: AttemptLease, attempt: Callable[[float], Any], timeout: float
+    ) -> Any:
+        current_attempt.set(lease)
+        return attempt(timeout)
+
+    def _on_success(self, node_name: str, started: float):
+        self.metrics.incr(node_name, "success")
+        self.metrics.record_latency(node_name, time.perf_counter() - started)
+
+    def _on_error(
+        self, node_name: str, policy: LatencyPolicy, retry: int, error: Exception
+    ) -> bool:
+        """재시도하면 True"""
+        if retry < policy.max_retries and is_transient_error(error):
+            self.metrics.incr(node_name, "retries")
+            logger.warning(
+                f"[LLM 지연 정책] {node_name} 재시도 {retry + 1}/{policy.max_retries}: "
+                f"{type(error).__name__}"
+            )
+            return True
+        self._record_failure(node_name, error)
+        return False
+
+    def _record_failure(self, node_name: str, error: Exception):
+        timed_out = isinstance(error, (TimeoutError, anthropic.APITimeoutError))
+        self.metrics.incr(node_name, "timeouts" if timed_out else "errors")
+
+    def _backoff(self, policy: LatencyPolicy, retry: int) -> float:
+        # full jitter
+        return random.uniform(
+            0, min(policy.backoff_max, policy.backoff_base * 2**retry)
+        )
+
+    async def _aclose(self, iterator: AsyncIterator[Any]):
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
+
+
+latency_guard = LatencyGuard.from_settings()
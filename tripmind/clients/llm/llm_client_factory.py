@@ -0,0 +1,46 @@
+import threading
+from typing import Optional
+
+from django.conf import settings
+
+from tripmind.clients.llm.base_llm_client import BaseLLMClient
+from tripmind.utils.startup_report import startup_report
+
+_llm_client: Optional[BaseLLMClient] = None
+_llm_client_lock = threading.Lock()
+
+
+def create_llm_client(backend: Optional[str] = None) -> BaseLLMClient:
+    """LLM_BACKEND 설정에 따라 LLM 클라이언트를 만든다. 선택된 백엔드 모듈만 import 한다."""
+    backend = backend or settings.LLM_BACKEND
+    if backend == "claude":
+        from tripmind.clients.llm.claude_client import claude_client
+
+        return claude_client
+    if backend == "fake":
+        from tripmind.clients.llm.fake_llm_client import FakeLLMClient
+
+        return FakeLLMClient()
+    if backend == "ollama":
+        from tripmind.clients.llm.ollama_client import ollama_client
+
+        return ollama_client
+    raise ValueError(f"지원하지 않는 LLM_BACKEND 입니다: {backend}")
+
+
+def get_llm_client() -> BaseLLMClient:
+    """프로세스 공유 LLM 클라이언트. import 시점이 아니라 처음 사용할 때 만든다"""
+    global _llm_client
+    if _llm_client is None:
+        with _llm_client_lock:
+            if _llm_client is None:
+                with startup_report.measure(f"llm_client:{settings.LLM_BACKEND}"):
+                    _llm_client = create_llm_client()
+    return _llm_client
+
+
+def __getattr__(name):
+    # 하위 호환: from llm_client_factory import llm_client 는 그 시점에 클라이언트를 만든다
+    if name == "llm_client":
+        return get_llm_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,374 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from functools import cached_property
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+import anthropic
+import httpx
+from langchain_anthropic import ChatAnthropic
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.runnables.config import var_child_runnable_config
+
+from tripmind.clients.llm.latency_policy import (
+    AttemptAbandoned,
+    current_attempt,
+    latency_guard,
+)
+from tripmind.clients.llm.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_ID = "default"
+
+
+class _Waiter:
+    """대기 중인 LLM 호출. 동기 호출은 Event, 비동기 호출은 Future 로 깨운다."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.granted = False
+        if loop is None:
+            self.event = threading.Event()
+        else:
+            self.future = loop.create_future()
+
+    def wake(self):
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class FairLLMScheduler:
+    """
+    동시 실행 LLM 요청 수를 제한하고, 대기 요청은 세션별 큐를 라운드 로빈으로
+    꺼내 한 세션의 요청 폭주가 다른 세션을 굶기지 않도록 한다.
+
+    동기(스레드) 호출과 비동기(이벤트 루프) 호출이 같은 슬롯을 공유한다.
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max(1, max_in_flight)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queues: "OrderedDict[str, deque[_Waiter]]" = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def acquire(self, session_id: str):
+        waiter = self._enqueue(session_id, _Waiter())
+        if waiter is not None:
+            waiter.event.wait()
+
+    async def aacquire(self, session_id: str):
+        waiter = self._enqueue(session_id, _Waiter(asyncio.get_running_loop()))
+        if waiter is None:
+            return
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    self._remove(session_id, waiter)
+                    raise
+            # 슬롯을 넘겨받은 직후 취소된 경우 다음 대기자에게 양보
+            self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._queues:
+                session_id, queue = next(iter(self._queues.items()))
+                waiter = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(session_id)
+                else:
+                    del self._queues[session_id]
+                # 슬롯은 그대로 넘겨주므로 in_flight 는 유지
+                waiter.wake()
+                return
+            self._in_flight -= 1
+
+    def _enqueue(self, session_id: str, waiter: _Waiter) -> Optional[_Waiter]:
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._queues:
+                self._in_flight += 1
+                return None
+            self._queues.setdefault(session_id, deque()).append(waiter)
+            logger.debug(
+                f"LLM 요청 대기: session={session_id}, in_flight={self._in_flight}"
+            )
+            return waiter
+
+    def _remove(self, session_id: str, waiter: _Waiter):
+        queue = self._queues.get(session_id)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[session_id]
+
+
+class LLMGateway:
+    """
+    LLM 호출 게이트웨이
+    - 최대 동시 요청 수 제한 및 세션 간 공정 대기열
+    - 프로세스 전체가 공유하는 keep-alive HTTP 커넥션 풀
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        self.max_in_flight = max_in_flight or int(
+            os.getenv("LLM_GATEWAY_MAX_IN_FLIGHT", "8")
+        )
+        self.pool_size = pool_size or int(
+            os.getenv("LLM_GATEWAY_POOL_SIZE", str(self.max_in_flight * 2))
+        )
+        self.keepalive_expiry = keepalive_expiry or float(
+            os.getenv("LLM_GATEWAY_KEEPALIVE_EXPIRY", "30")
+        )
+        self.scheduler = FairLLMScheduler(self.max_in_flight)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @cached_property
+    def http_client(self) -> httpx.Client:
+        return anthropic.DefaultHttpxClient(limits=self.limits)
+
+    @cached_property
+    def async_http_client(self) -> httpx.AsyncClient:
+        return anthropic.DefaultAsyncHttpxClient(limits=self.limits)
+
+    @contextmanager
+    def slot(self, session_id: str = DEFAULT_SESSION_ID):
+        self.scheduler.acquire(session_id)
+        lock = threading.Lock()
+        released = False
+
+        def release():
+            nonlocal released
+            with lock:
+                if released:
+                    return
+                released = True
+            self.scheduler.release()
+
+        # 헤지 경쟁에서 진 동기 시도는 호출이 끝나기 전에 슬롯을 돌려준다
+        lease = current_attempt.get()
+        if lease is not None:
+            lease.on_abandon(release)
+        try:
+            if lease is not None and lease.abandoned:
+                raise AttemptAbandoned()
+            yield
+        finally:
+            release()
+
+    @asynccontextmanager
+    async def aslot(self, session_id: str = DEFAULT_SESSION_ID):
+        await self.scheduler.aacquire(session_id)
+        try:
+            yield
+        finally:
+            self.scheduler.release()
+
+
+llm_gateway = LLMGateway()
+
+
+def _run_metadata(run_manager) -> dict:
+    # LangGraph 는 configurable.thread_id, 노드 이름(langgraph_node)을 실행 메타데이터로 전달한다.
+    # 스트리밍 경로(_generate_with_cache -> _stream)는 run_manager 를 넘기지 않으므로
+    # 현재 실행 중인 runnable config 에서 찾는다.
+    metadata = getattr(run_manager, "metadata", None) or {}
+    if not metadata.get("thread_id"):
+        config = var_child_runnable_config.get() or {}
+        metadata = config.get("metadata") or {}
+    return metadata
+
+
+def _session_id(run_manager) -> str:
+    return str(_run_metadata(run_manager).get("thread_id") or DEFAULT_SESSION_ID)
+
+
+def _node_name(run_manager) -> str:
+    return _run_metadata(run_manager).get("langgraph_node", "")
+
+
+class GatewayChatAnthropic(ChatAnthropic):
+    """
+    모든 호출(동기/비동기, 일반/스트리밍)이 llm_gateway 를 거치는 ChatAnthropic.
+    streaming=True 인 경우 _generate 가 _stream 을 호출하므로 슬롯은 _stream 에서만 잡는다.
+    같은 세션 / 노드 / 프롬프트의 동시 요청은 single_flight 로 1건만 실제 호출한다.
+    실제 호출(선행 요청)에는 노드별 latency_guard 정책(시간 제한, 재시도, 헤지)을 적용한다.
+    """
+
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        return anthropic.Client(
+            **self._client_params, http_client=llm_gateway.http_client
+        )
+
+    @cached_property
+    def _async_client(self) -> anthropic.AsyncClient:
+        return anthropic.AsyncClient(
+            **self._client_params, http_client=llm_gateway.async_http_client
+        )
+
+    def _single_flight_key(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]],
+        run_manager,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        return single_flight.make_key(
+            session_id=_session_id(run_manager),
+            node_name=_node_name(run_manager),
+            messages=messages,
+            llm_string=self._get_llm_string(stop=stop, **kwargs),
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.streaming:
+            return super()._generate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        session_id = _session_id(run_manager)
+        node_name = _node_name(run_manager)
+
+        def attempt(timeout: float) -> ChatResult:
+            with llm_gateway.slot(session_id):
+                return super(GatewayChatAnthropic, self)._generate(
+                    messages,
+                    stop=stop,
+                    run_manager=run_manager,
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        key = self._single_flight_key(messages, stop, run_manager, **kwargs)
+        return single_flight.call(key, lambda: latency_guard.call(node_name, attempt))
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.streaming:
+            return await super()._agenerate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        session_id = _session_id(run_manager)
+        node_name = _node_name(run_manager)
+
+        async def attempt(timeout: float) -> ChatResult:
+            async with llm_gateway.aslot(session_id):
+                return await super(GatewayChatAnthropic, self)._agenerate(
+                    messages,
+                    stop=stop,
+                    run_manager=run_manager,
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        key = self._single_flight_key(messages, stop, run_manager, **kwargs)
+        return await single_flight.acall(
+            key, lambda: latency_guard.acall(node_name, attempt)
+        )
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        session_id = _session_id(run_manager)
+        node_name = _node_name(run_manager)
+
+        def attempt(timeout: float) -> Iterator[ChatGenerationChunk]:
+            with llm_gateway.slot(session_id):
+                yield from super(GatewayChatAnthropic, self)._stream(
+                    messages,
+                    stop=stop,
+                    run_manager=run_manager,
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        key = self._single_flight_key(messages, stop, run_manager, **kwargs)
+        yield from single_flight.stream(
+            key, lambda: latency_guard.stream(node_name, attempt)
+        )
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        session_id = _session_id(run_manager)
+        node_name = _node_name(run_manager)
+
+        async def attempt(timeout: float) -> AsyncIterator[ChatGenerationChunk]:
+            async with llm_gateway.aslot(session_id):
+                async for chunk in super(GatewayChatAnthropic, self)._astream(
+                    messages,
+                    stop=stop,
+                    run_manager=run_manager,
+                    timeout=timeout,
+                    **kwargs,
+                ):
+                    yield chunk
+
+        key = self._single_flight_key(messages, stop, run_manager, **kwargs)
+        async for chunk in single_flight.astream(
+            key, lambda: latency_guard.astream(node_name, attempt)
+        ):
+            yield chunk
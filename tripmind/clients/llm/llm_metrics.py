@@ -0,0 +1,311 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+logger = logging.getLogger(__name__)
+
+METRICS_LOG_DIR = Path(__file__).resolve().parents[2] / "logs" / "llm_metrics"
+
+# 모델별 USD / 1M 토큰 (입력, 출력). 캐시 기록은 입력의 1.25배, 캐시 읽기는 0.1배
+MODEL_PRICES_PER_MTOK: Dict[str, Tuple[float, float]] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-3-haiku": (0.25, 1.25),
+}
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+LABELS = ("node", "model", "prompt_version")
+COUNTER_FIELDS = (
+    "calls",
+    "errors",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_creation_tokens",
+    "cost_usd",
+    "latency_seconds",
+    "ttft_seconds",
+    "ttft_count",
+)
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read: int = 0,
+    cache_creation: int = 0,
+) -> float:
+    prices = next(
+        (
+            price
+            for prefix, price in MODEL_PRICES_PER_MTOK.items()
+            if model.startswith(prefix)
+        ),
+        None,
+    )
+    if prices is None:
+        return 0.0
+
+    input_price, output_price = prices
+    return (
+        input_tokens * input_price
+        + cache_creation * input_price * CACHE_WRITE_MULTIPLIER
+        + cache_read * input_price * CACHE_READ_MULTIPLIER
+        + output_tokens * output_price
+    ) / 1_000_000
+
+
+class LLMMetricsHandler(BaseCallbackHandler):
+    """
+    LLM 호출별 지연 시간, 첫 토큰까지의 시간(TTFT), 입력/출력/캐시 토큰, 추정 비용을
+    노드 / 세션 / 프롬프트 버전별로 집계하는 콜백
+
+    - 노드 x 모델 x 프롬프트 버전 집계는 Prometheus 텍스트 형식으로 노출 (render_prometheus)
+    - 세션별 집계는 최근 max_sessions 개만 유지
+    - 호출별 기록은 JSONL 로 남겨 Parquet 으로 내보낸다 (export_llm_metrics 명령)
+    - 노드별 프롬프트 캐시 적중/미스 토큰은 같은 집계에서 계산한다 (get_prompt_cache_stats)
+    """
+
+    def __init__(
+        self,
+        log_dir: Optional[Path] = None,
+        max_sessions: int = 1000,
+        persist: bool = True,
+    ):
+        self.log_dir = Path(log_dir or METRICS_LOG_DIR)
+        self.max_sessions = max_sessions
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+        self._totals: Dict[Tuple[str, str, str], Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(COUNTER_FIELDS, 0)
+        )
+        self._sessions: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = metadata or {}
+        invocation_params = kwargs.get("invocation_params") or {}
+        with self._lock:
+            self._runs[run_id] = {
+                "started": time.perf_counter(),
+                "first_token": None,
+                "node": metadata.get("langgraph_node") or "unknown",
+                "session_id": str(metadata.get("thread_id") or "default"),
+                "prompt_version": metadata.get("prompt_version") or "unknown",
+                "model": invocation_params.get("model")
+                or metadata.get("ls_model_name")
+                or "unknown",
+            }
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None and run["first_token"] is None:
+                run["first_token"] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        usage = self._get_usage(response) or {}
+        details = usage.get("input_token_details") or {}
+        cache_read = details.get("cache_read", 0) or 0
+        cache_creation = details.get("cache_creation", 0) or 0
+        input_tokens = (usage.get("input_tokens", 0) or 0) - cache_read - cache_creation
+        output_tokens = usage.get("output_tokens", 0) or 0
+
+        self._record(
+            run,
+            {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_tokens": cache_read,
+                "cache_creation_tokens": cache_creation,
+                "cost_usd": estimate_cost(
+                    run["model"],
+                    input_tokens,
+                    output_tokens,
+                    cache_read,
+                    cache_creation,
+                ),
+            },
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is not None:
+            self._record(run, {"errors": 1, "error": type(error).__name__})
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """노드별 합계"""
+        stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(COUNTER_FIELDS, 0)
+        )
+        with self._lock:
+            for (node, _, _), counters in self._totals.items():
+                for field, value in counters.items():
+                    stats[node][field] += value
+        return {node: self._rounded(counters) for node, counters in stats.items()}
+
+    def get_prompt_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        노드별 Anthropic 프롬프트 캐시 토큰
+        - cache_read: 캐시에서 읽은 입력 토큰 (적중)
+        - cache_creation: 캐시에 새로 기록한 입력 토큰 (미스)
+        - input: 캐시와 무관하게 처리된 입력 토큰
+        """
+        return {
+            node: {
+                "calls": stats["calls"] - stats["errors"],
+                "input": stats["input_tokens"],
+                "cache_read": stats["cache_read_tokens"],
+                "cache_creation": stats["cache_creation_tokens"],
+            }
+            for node, stats in self.get_stats().items()
+        }
+
+    def get_session_stats(self, session_id: str) -> Dict[str, float]:
+        with self._lock:
+            counters = self._sessions.get(session_id)
+            return self._rounded(counters) if counters else {}
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            totals = {labels: dict(c) for labels, c in self._totals.items()}
+
+        metrics = [
+            ("calls", "counter", "LLM 호출 수"),
+            ("errors", "counter", "LLM 호출 오류 수"),
+            ("input_tokens", "counter", "캐시를 제외한 입력 토큰"),
+            ("output_tokens", "counter", "출력 토큰"),
+            ("cache_read_tokens", "counter", "프롬프트 캐시 읽기 토큰"),
+            ("cache_creation_tokens", "counter", "프롬프트 캐시 기록 토큰"),
+            ("cost_usd", "counter", "추정 비용 (USD)"),
+            ("latency_seconds", "counter", "LLM 호출 시간 합계 (초)"),
+            ("ttft_seconds", "counter", "첫 토큰까지의 시간 합계 (초)"),
+            ("ttft_count", "counter", "TTFT 측정 호출 수"),
+        ]
+        lines = []
+        for field, metric_type, help_text in metrics:
+            name = f"tripmind_llm_{field}_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, counters in sorted(totals.items()):
+                label_str = ",".join(
+                    f'{key}="{_escape_label(value)}"'
+                    for key, value in zip(LABELS, labels)
+                )
+                lines.append(f"{name}{{{label_str}}} {counters[field]:g}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            self._sessions.clear()
+
+    def _record(self, run: Dict[str, Any], values: Dict[str, Any]):
+        now = time.perf_counter()
+        latency = now - run["started"]
+        ttft = run["first_token"] - run["started"] if run["first_token"] else None
+        counters = {
+            "calls": 1,
+            "latency_seconds": latency,
+            **{k: v for k, v in values.items() if k in COUNTER_FIELDS},
+        }
+        if ttft is not None:
+            counters.update(ttft_seconds=ttft, ttft_count=1)
+
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "node": run["node"],
+            "session_id": run["session_id"],
+            "prompt_version": run["prompt_version"],
+            "model": run["model"],
+            "latency_ms": round(latency * 1000, 1),
+            "ttft_ms": round(ttft * 1000, 1) if ttft is not None else None,
+            **values,
+        }
+
+        with self._lock:
+            totals = self._totals[(run["node"], run["model"], run["prompt_version"])]
+            session = self._sessions.setdefault(
+                run["session_id"], dict.fromkeys(COUNTER_FIELDS, 0)
+            )
+            self._sessions.move_to_end(run["session_id"])
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            for field, value in counters.items():
+                totals[field] += value
+                session[field] += value
+
+        logger.info(
+            f"[LLM 지표] node={record['node']} model={record['model']} "
+            f"latency={record['latency_ms']}ms ttft={record['ttft_ms']}ms "
+            f"in={values.get('input_tokens', 0)} out={values.get('output_tokens', 0)} "
+            f"cost=${values.get('cost_usd', 0):.5f}"
+        )
+        if self.persist:
+            self._write(record)
+
+    def _write(self, record: Dict[str, Any]):
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            today = datetime.now().strftime("%Y-%m-%d")
+            with self._lock:
+                with open(
+                    self.log_dir / f"llm-{today}.jsonl", "a", encoding="utf-8"
+                ) as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"LLM 지표 기록 실패: {str(e)}")
+
+    def _rounded(self, counters: Dict[str, float]) -> Dict[str, float]:
+        return {
+            field: round(value, 6) if isinstance(value, float) else value
+            for field, value in counters.items()
+        }
+
+    def _get_usage(self, response: LLMResult) -> Optional[Dict[str, Any]]:
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    return usage
+        return None
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+llm_metrics = LLMMetricsHandler(
+    persist=os.getenv("LLM_METRICS_PERSIST", "true").lower() == "true"
+)
@@ -0,0 +1,49 @@
+import logging
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    model: str
+    max_tokens: int = 3000
+    temperature: Optional[float] = None
+
+
+class ModelRegistry:
+    """
+    LangGraph 노드 이름 → 모델 프로필(model, max_tokens, temperature) 매핑
+
+    노드별 프로필에 없는 값은 default 프로필 값을 사용한다.
+    """
+
+    def __init__(self, profiles: Dict[str, Dict[str, Any]]):
+        default = profiles.get(DEFAULT_PROFILE) or {}
+        if not default.get("model"):
+            raise ValueError("LLM_MODEL_PROFILES 에 default 모델이 필요합니다.")
+
+        self.default_profile = ModelProfile(**default)
+        self._profiles = {
+            node_name: replace(self.default_profile, **profile)
+            for node_name, profile in profiles.items()
+            if node_name != DEFAULT_PROFILE
+        }
+
+    @classmethod
+    def from_settings(cls) -> "ModelRegistry":
+        return cls(settings.LLM_MODEL_PROFILES)
+
+    def get_profile(self, node_name: Optional[str] = None) -> ModelProfile:
+        return self._profiles.get(node_name, self.default_profile)
+
+    def get_profiles(self) -> Dict[str, ModelProfile]:
+        return {DEFAULT_PROFILE: self.default_profile, **self._profiles}
+
+
+model_registry = ModelRegistry.from_settings()
@@ -1,3 +1,4 @@
+from typing import Optional
 from langchain_ollama import ChatOllama
 from tripmind.clients.llm.base_llm_client import BaseLLMClient
 from langchain.agents.output_parsers import ReActJsonSingleInputOutputParser
@@ -8,7 +9,7 @@ class OllamaClient(BaseLLMClient):
     def __init__(self):
         self.llm = ChatOllama(model="llama3:latest")
 
-    def get_llm(self) -> ChatOllama:
+    def get_llm(self, node_name: Optional[str] = None) -> ChatOllama:
         return self.llm
 
     def get_output_parser(self) -> OpenAIFunctionsAgentOutputParser:
@@ -0,0 +1,193 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.runnables.config import var_child_runnable_config
+
+logger = logging.getLogger(__name__)
+
+# 런타임 데이터 디렉터리 (TRIPMIND_DATA_DIR), 저장소 파일은 캐시를 처음 사용할 때 만든다
+DATA_DIR = Path(
+    os.getenv("TRIPMIND_DATA_DIR", Path(__file__).resolve().parents[2] / "data")
+)
+DEFAULT_CACHE_PATH = DATA_DIR / "llm_response_cache.sqlite3"
+
+
+def _current_node_name() -> str:
+    # LangGraph 는 실행 중인 노드 이름을 runnable config metadata 로 전달한다
+    config = var_child_runnable_config.get() or {}
+    return (config.get("metadata") or {}).get("langgraph_node", "")
+
+
+class SQLiteResponseStore:
+    """TTL 이 있는 SQLite 응답 저장소 (파일은 처음 조회/저장할 때 연다)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # self._lock 을 잡은 상태에서만 호출
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, expires_at FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                self.conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key = ?", (key,)
+                )
+                self.conn.commit()
+                return None
+            return row[0]
+
+    def set(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self.conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM llm_response_cache")
+            self.conn.commit()
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LLM 응답 완전 일치 캐시 (in-memory LRU + SQLite TTL 저장소)
+
+    키는 모델/파라미터(llm_string)와 렌더링된 프롬프트의 해시이며,
+    enabled_nodes 에 포함된 LangGraph 노드에서 호출된 경우에만 사용한다.
+    """
+
+    def __init__(
+        self,
+        enabled_nodes: Iterable[str],
+        path: Optional[str] = None,
+        ttl: float = 86400,
+        max_memory_entries: int = 512,
+    ):
+        self.enabled_nodes = set(enabled_nodes)
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, Sequence]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = SQLiteResponseStore(str(path or DEFAULT_CACHE_PATH))
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "sqlite_hits": 0, "misses": 0}
+        )
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        node_name = _current_node_name()
+        if node_name not in self.enabled_nodes:
+            return None
+
+        key = self._make_key(prompt, llm_string)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._stats[node_name]["memory_hits"] += 1
+                return cached
+
+        value = self._store.get(key)
+        if value is None:
+            with self._lock:
+                self._stats[node_name]["misses"] += 1
+            return None
+
+        try:
+            generations = loads(value)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 역직렬화 실패: {str(e)}")
+            with self._lock:
+                self._stats[node_name]["misses"] += 1
+            return None
+
+        with self._lock:
+            self._remember(key, generations)
+            self._stats[node_name]["sqlite_hits"] += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        if _current_node_name() not in self.enabled_nodes:
+            return
+
+        key = self._make_key(prompt, llm_string)
+        with self._lock:
+            self._remember(key, return_val)
+        self._store.set(key, dumps(list(return_val)), self.ttl)
+
+    def clear(self, **kwargs: Any):
+        with self._lock:
+            self._memory.clear()
+        self._store.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            stats = {}
+            for node_name, counts in self._stats.items():
+                total = sum(counts.values())
+                hits = counts["memory_hits"] + counts["sqlite_hits"]
+                stats[node_name] = {
+                    **counts,
+                    "hit_rate": round(hits / total, 4) if total else 0.0,
+                }
+            return stats
+
+    def _remember(self, key: str, generations: Sequence):
+        self._memory[key] = generations
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _make_key(self, prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def create_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    LLM_RESPONSE_CACHE_NODES 에 지정된 노드(콤마 구분)에 대해서만 캐시를 켠다.
+    기본값(빈 값)이면 캐시를 사용하지 않는다. 예: LLM_RESPONSE_CACHE_NODES=classify_intent_node
+    """
+    node_names = os.getenv("LLM_RESPONSE_CACHE_NODES", "")
+    enabled_nodes = [node.strip() for node in node_names.split(",") if node.strip()]
+    if not enabled_nodes:
+        return None
+
+    return LLMResponseCache(
+        enabled_nodes=enabled_nodes,
+        path=os.getenv("LLM_RESPONSE_CACHE_PATH"),
+        ttl=float(os.getenv("LLM_RESPONSE_CACHE_TTL", "86400")),
+        max_memory_entries=int(os.getenv("LLM_RESPONSE_CACHE_MEMORY_SIZE", "512")),
+    )
+
+
+llm_response_cache = create_llm_response_cache()
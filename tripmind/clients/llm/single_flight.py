@@ -0,0 +1,320 @@
+import asyncio
+import contextvars
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from langchain_core.load import dumps
+from langchain_core.messages import BaseMessage
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightAborted(RuntimeError):
+    """선행 요청이 끝까지 생성하지 못하고 중단된 경우 합류한 요청에 전달되는 오류"""
+
+
+class FlightRecord:
+    """
+    노드 실행 1회 동안 진행 중인 생성에 합류(follower)한 적이 있는지 기록.
+    합류한 실행은 같은 턴의 중복 요청이므로 세션 메모리 저장을 건너뛴다.
+    """
+
+    def __init__(self):
+        self.followed = False
+
+
+# 워커 스레드로 컨텍스트가 복사되어도 같은 FlightRecord 객체를 가리킨다
+_current_record: contextvars.ContextVar[Optional[FlightRecord]] = (
+    contextvars.ContextVar("single_flight_record", default=None)
+)
+
+
+class _Flight:
+    """
+    진행 중인 LLM 생성 1건. 선행 요청이 청크/결과를 기록하고,
+    합류한 요청은 처음부터 다시 읽은 뒤 이후 청크를 이어서 받는다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self.chunks: List[Any] = []
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+    def publish(self, chunk: Any):
+        with self._cond:
+            # 호출자가 청크의 message.id 등을 수정하므로 복사본을 보관
+            self.chunks.append(copy.deepcopy(chunk))
+            self._notify()
+
+    def finish(self, result: Any = None, error: Optional[BaseException] = None):
+        with self._cond:
+            self.result = result
+            self.error = error
+            self.done = True
+            self._notify()
+
+    def _notify(self):
+        self._cond.notify_all()
+        for loop, event in self._async_waiters:
+            loop.call_soon_threadsafe(event.set)
+        self._async_waiters.clear()
+
+    def _read_from(self, index: int) -> Tuple[List[Any], bool]:
+        pending = self.chunks[index:]
+        return [copy.deepcopy(chunk) for chunk in pending], self.done
+
+    def iter_chunks(self) -> Iterator[Any]:
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self.chunks) and not self.done:
+                    self._cond.wait()
+                pending, done = self._read_from(index)
+            index += len(pending)
+            yield from pending
+            if done:
+                self._raise_error()
+                return
+
+    async def aiter_chunks(self) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        index = 0
+        while True:
+            event = asyncio.Event()
+            with self._cond:
+                pending, done = self._read_from(index)
+                if not pending and not done:
+                    self._async_waiters.append((loop, event))
+            index += len(pending)
+            for chunk in pending:
+                yield chunk
+            if done:
+                self._raise_error()
+                return
+            if not pending:
+                await event.wait()
+
+    def wait(self) -> Any:
+        with self._cond:
+            while not self.done:
+                self._cond.wait()
+        self._raise_error()
+        return copy.deepcopy(self.result)
+
+    async def await_result(self) -> Any:
+        event = asyncio.Event()
+        with self._cond:
+            waiting = not self.done
+            if waiting:
+                self._async_waiters.append((asyncio.get_running_loop(), event))
+        if waiting:
+            await event.wait()
+        self._raise_error()
+        return copy.deepcopy(self.result)
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+
+class SingleFlight:
+    """
+    같은 세션 / 노드 / 프롬프트의 LLM 요청이 동시에 들어오면 먼저 온 요청만 실제로
+    호출하고, 나머지는 진행 중인 생성에 합류해 같은 스트림(결과)을 받는다.
+
+    enabled_nodes 에 포함된 LangGraph 노드에서 호출된 경우에만 사용한다.
+    """
+
+    def __init__(self, enabled_nodes: Iterable[str]):
+        self.enabled_nodes = set(enabled_nodes)
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"leaders": 0, "coalesced": 0}
+        )
+
+    def make_key(
+        self,
+        session_id: str,
+        node_name: str,
+        messages: Sequence[BaseMessage],
+        llm_string: str,
+    ) -> Optional[str]:
+        """single-flight 대상이 아니면 None"""
+        if node_name not in self.enabled_nodes:
+            return None
+        prompt_hash = hashlib.sha256(
+            f"{llm_string}\n{dumps(list(messages))}".encode("utf-8")
+        ).hexdigest()
+        return f"{node_name}:{session_id}:{prompt_hash}"
+
+    def stream(
+        self, key: Optional[str], producer: Callable[[], Iterator[Any]]
+    ) -> Iterator[Any]:
+        if key is None:
+            yield from producer()
+            return
+
+        flight, is_leader = self._join(key)
+        if not is_leader:
+            yield from flight.iter_chunks()
+            return
+
+        try:
+            for chunk in producer():
+                flight.publish(chunk)
+                yield chunk
+        except BaseException as e:
+            flight.finish(error=self._follower_error(e))
+            raise
+        else:
+            flight.finish()
+        finally:
+            self._forget(key, flight)
+
+    async def astream(
+        self, key: Optional[str], producer: Callable[[], AsyncIterator[Any]]
+    ) -> AsyncIterator[Any]:
+        if key is None:
+            async for chunk in producer():
+                yield chunk
+            return
+
+        flight, is_leader = self._join(key)
+        if not is_leader:
+            async for chunk in flight.aiter_chunks():
+                yield chunk
+            return
+
+        try:
+            async for chunk in producer():
+                flight.publish(chunk)
+                yield chunk
+        except BaseException as e:
+            flight.finish(error=self._follower_error(e))
+            raise
+        else:
+            flight.finish()
+        finally:
+            self._forget(key, flight)
+
+    def call(self, key: Optional[str], fn: Callable[[], Any]) -> Any:
+        if key is None:
+            return fn()
+
+        flight, is_leader = self._join(key)
+        if not is_leader:
+            return flight.wait()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            flight.finish(error=self._follower_error(e))
+            raise
+        else:
+            flight.finish(result=result)
+            return result
+        finally:
+            self._forget(key, flight)
+
+    async def acall(self, key: Optional[str], fn: Callable[[], Awaitable[Any]]) -> Any:
+        if key is None:
+            return await fn()
+
+        flight, is_leader = self._join(key)
+        if not is_leader:
+            return await flight.await_result()
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            flight.finish(error=self._follower_error(e))
+            raise
+        else:
+            flight.finish(result=result)
+            return result
+        finally:
+            self._forget(key, flight)
+
+    @contextmanager
+    def track(self) -> Iterator[FlightRecord]:
+        """블록 안의 LLM 호출이 진행 중인 생성에 합류했는지 기록한다."""
+        record = FlightRecord()
+        token = _current_record.set(record)
+        try:
+            yield record
+        finally:
+            _current_record.reset(token)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {node: dict(stats) for node, stats in self._stats.items()}
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def _join(self, key: str) -> Tuple[_Flight, bool]:
+        node_name = key.split(":", 1)[0]
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._stats[node_name]["coalesced"] += 1
+                record = _current_record.get()
+                if record is not None:
+                    record.followed = True
+                logger.info(f"[single-flight] 진행 중인 생성에 합류: {key[:60]}")
+                return flight, False
+
+            flight = _Flight()
+            self._flights[key] = flight
+            self._stats[node_name]["leaders"] += 1
+            return flight, True
+
+    def _forget(self, key: str, flight: _Flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _follower_error(self, error: BaseException) -> Exception:
+        # 취소/연결 종료(GeneratorExit, CancelledError)는 합류한 요청에 그대로 전파하지 않음
+        if isinstance(error, Exception):
+            return error
+        return SingleFlightAborted(
+            f"선행 LLM 요청이 중단되었습니다: {type(error).__name__}"
+        )
+
+
+def create_single_flight() -> SingleFlight:
+    """LLM_SINGLE_FLIGHT_NODES 에 지정된 노드(콤마 구분)에 대해서만 켠다."""
+    node_names = os.getenv(
+        "LLM_SINGLE_FLIGHT_NODES", "itinerary_node,conversation_node"
+    )
+    return SingleFlight(
+        enabled_nodes=[node.strip() for node in node_names.split(",") if node.strip()]
+    )
+
+
+single_flight = create_single_flight()
@@ -0,0 +1,61 @@
+import hashlib
+from typing import Any, Dict
+
+from tripmind.clients.place_search.base_place_search_client import BasePlaceSearchClient
+
+# 검색어 해시로 좌표를 흩뿌릴 기준점 (서울 시청)
+BASE_X, BASE_Y = 126.9780, 37.5665
+
+
+class FakePlaceClient(BasePlaceSearchClient):
+    """
+    Kakao 로컬 API 대신 검색어로부터 결정적인 장소 목록을 만드는 클라이언트.
+    LLM_BACKEND=fake 부하 테스트가 API 키와 네트워크 없이 같은 결과를 내도록 한다.
+    """
+
+    def search_keyword(
+        self, keyword: str, page: int = 1, size: int = 10
+    ) -> Dict[str, Any]:
+        offset = (page - 1) * size
+        return {
+            "documents": [self._document(keyword, offset + i + 1) for i in range(size)]
+        }
+
+    def search_category(
+        self, category_group_code: str, x: str, y: str, radius: int = 1000
+    ) -> Dict[str, Any]:
+        return self.search_keyword(category_group_code)
+
+    def search_address(self, address: str) -> Dict[str, Any]:
+        return {"documents": [self._document(address, 1)]}
+
+    def get_place_detail(self, place_name: str, x: str, y: str) -> Dict[str, Any]:
+        return {"documents": [self._document(place_name, 1)]}
+
+    def close(self):
+        pass
+
+    def _document(self, keyword: str, rank: int) -> Dict[str, Any]:
+        digest = hashlib.sha256(f"{keyword}:{rank}".encode("utf-8")).digest()
+        place_id = str(int.from_bytes(digest[:4], "big"))
+        return {
+            "id": place_id,
+            "place_name": f"{keyword} {rank}",
+            "category_name": _category(keyword),
+            "address_name": f"{keyword} 주소 {rank}",
+            "road_address_name": f"{keyword}로 {rank}",
+            "phone": f"02-000-{rank:04d}",
+            "place_url": f"http://place.map.kakao.com/{place_id}",
+            "x": f"{BASE_X + digest[4] / 1000:.6f}",
+            "y": f"{BASE_Y + digest[5] / 1000:.6f}",
+        }
+
+
+def _category(keyword: str) -> str:
+    if "카페" in keyword:
+        return "음식점 > 카페"
+    if "맛집" in keyword or "음식" in keyword:
+        return "음식점"
+    if "숙소" in keyword or "호텔" in keyword:
+        return "여행 > 숙박"
+    return "여행 > 관광,명소"
@@ -11,11 +11,10 @@ KAKAO_BASE_URL = "https://dapi.kakao.com/v2/local"
 
 
 class KakaoPlaceClient(BasePlaceSearchClient):
-    def __init__(
-        self,
-        api_key: str,
-    ):
+    def __init__(self, api_key: str, timeout: float = 5.0):
         self.api_key = api_key
+        # 응답이 멈춘 요청이 SearchPlaces 도구와 선행 검색을 붙잡지 않도록 요청마다 시간 제한
+        self.timeout = timeout
         if self.api_key:
             masked_key = f"{self.api_key[:4]}...{self.api_key[-4:]}"
             logger.info(f"[DEBUG] Using Kakao API Key: {masked_key}")
@@ -24,6 +23,8 @@ class KakaoPlaceClient(BasePlaceSearchClient):
             raise ValueError("카카오 API 키가 설정되지 않았습니다.")
 
         self.headers = {"Authorization": f"KakaoAK {self.api_key}"}
+        # 공유 인스턴스로 재사용되므로 세션으로 커넥션을 유지
+        self.session = requests.Session()
 
     def search_keyword(
         self, keyword: str, page: int = 1, size: int = 10
@@ -32,7 +33,9 @@ class KakaoPlaceClient(BasePlaceSearchClient):
         params = {"query": keyword, "page": page, "size": size}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(
+                url, headers=self.headers, params=params, timeout=self.timeout
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -50,7 +53,9 @@ class KakaoPlaceClient(BasePlaceSearchClient):
             "radius": radius,
         }
 
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(
+            url, headers=self.headers, params=params, timeout=self.timeout
+        )
         response.raise_for_status()
 
         return response.json()
@@ -59,7 +64,9 @@ class KakaoPlaceClient(BasePlaceSearchClient):
         url = f"{KAKAO_BASE_URL}/search/address.json"
         params = {"query": address}
 
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(
+            url, headers=self.headers, params=params, timeout=self.timeout
+        )
         response.raise_for_status()
 
         return response.json()
@@ -72,6 +79,11 @@ class KakaoPlaceClient(BasePlaceSearchClient):
             "y": y,
         }
 
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(
+            url, headers=self.headers, params=params, timeout=self.timeout
+        )
         response.raise_for_status()
         return response.json()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,170 @@
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tripmind.agents.itinerary.nodes.itinerary_node import (
+    STRUCTURED_CHAT_AGENT,
+    TOOL_CALLING_AGENT,
+    create_itinerary_node_agent,
+    get_itinerary_tools,
+)
+from tripmind.agents.itinerary.tools.final_response_tool import FinalResponseTool
+
+DEFAULT_MESSAGES = [
+    "서울 1일 여행 일정 짜줘",
+    "제주도 3일 여행 일정 2025-07-01 출발로 짜줘",
+    "부산 2일 맛집 위주 여행 계획 세워줘",
+    "강릉 2일 바다 여행 코스 추천해줘",
+]
+
+
+class _AgentCallCounter(BaseCallbackHandler):
+    """에이전트 실행 1건 동안의 LLM 호출 / 도구 호출 / 파싱 오류 재시도 수"""
+
+    def __init__(self):
+        self.llm_calls = 0
+        self.tool_calls = 0
+        self.parse_retries = 0
+
+    def on_chat_model_start(self, serialized, messages, **kwargs: Any) -> None:
+        self.llm_calls += 1
+
+    def on_tool_start(self, serialized, input_str, **kwargs: Any) -> None:
+        # handle_parsing_errors 는 파싱 실패를 _Exception 도구 호출로 모델에 되돌려준다
+        if (serialized or {}).get("name") == "_Exception":
+            self.parse_retries += 1
+        else:
+            self.tool_calls += 1
+
+
+class Command(BaseCommand):
+    help = (
+        "structured chat agent 와 tool calling agent 의 일정 1건당 평균 LLM 호출 수, "
+        "파싱 오류 재시도 수, 지연 시간을 비교합니다. 저장된 일정은 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--messages",
+            help="일정 요청 메시지 파일 (한 줄에 하나), 없으면 기본 메시지 사용",
+        )
+        parser.add_argument(
+            "--agent-types",
+            default=f"{STRUCTURED_CHAT_AGENT},{TOOL_CALLING_AGENT}",
+        )
+        parser.add_argument(
+            "--allow-real",
+            action="store_true",
+            help="fake 가 아닌 LLM 백엔드로도 실행 (실제 API 비용 발생)",
+        )
+
+    def handle(self, *args, **options):
+        if settings.LLM_BACKEND != "fake" and not options["allow_real"]:
+            raise CommandError(
+                f"LLM_BACKEND={settings.LLM_BACKEND} 입니다. "
+                "LLM_BACKEND=fake 로 실행하거나 --allow-real 을 지정하세요."
+            )
+
+        messages = DEFAULT_MESSAGES
+        if options["messages"]:
+            messages = [
+                line.strip()
+                for line in Path(options["messages"]).read_text("utf-8").splitlines()
+                if line.strip()
+            ]
+
+        from tripmind.clients.llm.llm_client_factory import get_llm_client
+
+        llm_client = get_llm_client()
+        tools = self._get_tools()
+        for agent_type in options["agent_types"].split(","):
+            stats = self._run(llm_client, agent_type.strip(), tools, messages, options)
+            self._write_stats(agent_type.strip(), stats)
+
+    def _get_tools(self):
+        try:
+            return get_itinerary_tools()
+        except Exception as e:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"장소 검색 / 캘린더 도구를 만들 수 없어 FinalResponse 만 사용합니다: {e}"
+                )
+            )
+            return [FinalResponseTool]
+
+    def _run(self, llm_client, agent_type, tools, messages, options):
+        tool_descriptions = "\n".join(
+            f"Tool: {tool.name}\nDescription: {tool.description}\n" for tool in tools
+        )
+        tool_names = [tool.name for tool in tools]
+        results = []
+
+        # FinalResponse 도구가 저장하는 일정은 벤치마크가 끝나면 롤백
+        with transaction.atomic():
+            User.objects.get_or_create(id=1, defaults={"username": "tripmind"})
+            for repeat in range(options["repeat"]):
+                for index, message in enumerate(messages):
+                    state = {
+                        "config_data": {
+                            "thread_id": f"benchmark-{agent_type}-{repeat}-{index}"
+                        },
+                        "user_input": message,
+                    }
+                    agent_executor = create_itinerary_node_agent(
+                        llm_client,
+                        state,
+                        tools,
+                        tool_descriptions,
+                        tool_names,
+                        agent_type=agent_type,
+                    )
+                    counter = _AgentCallCounter()
+                    started = time.perf_counter()
+                    error = None
+                    try:
+                        agent_executor.invoke(
+                            {
+                                "input": f"현재 요청:\n{message}",
+                                "chat_history": [],
+                                "tools": tool_descriptions,
+                                "tool_names": ", ".join(tool_names),
+                                "agent_scratchpad": [],
+                            },
+                            config={"callbacks": [counter]},
+                        )
+                    except Exception as e:
+                        error = e
+                    results.append(
+                        {
+                            "llm_calls": counter.llm_calls,
+                            "tool_calls": counter.tool_calls,
+                            "parse_retries": counter.parse_retries,
+                            "latency": time.perf_counter() - started,
+                            "error": error,
+                        }
+                    )
+            transaction.set_rollback(True)
+        return results
+
+    def _write_stats(self, agent_type: str, results: list[Dict[str, Any]]):
+        def mean(key):
+            return np.mean([r[key] for r in results])
+
+        latencies = np.array([r["latency"] for r in results]) * 1000
+        self.stdout.write(
+            f"[{agent_type}] itineraries={len(results)} "
+            f"errors={sum(1 for r in results if r['error'])} "
+            f"llm_calls/itinerary={mean('llm_calls'):.2f} "
+            f"tool_calls/itinerary={mean('tool_calls'):.2f} "
+            f"parse_retries/itinerary={mean('parse_retries'):.2f} "
+            f"latency p50={np.percentile(latencies, 50):.0f}ms "
+            f"p95={np.percentile(latencies, 95):.0f}ms"
+        )
@@ -0,0 +1,268 @@
+import asyncio
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_MESSAGES = [
+    "안녕하세요",
+    "제주도 3일 여행 일정 짜줘",
+    "부산 2박 3일 코스 추천해줘",
+    "강릉 근처 맛집 알려줘",
+    "여행 갈 때 짐은 어떻게 싸는 게 좋아?",
+    "서울 1일 여행 계획 세워줘",
+]
+
+# 노드 / 실행기 오류는 "[<이름> 오류] ..." 응답으로 전달된다
+ERROR_RESPONSE_PATTERN = re.compile(r"^\[[^\]]+ 오류\]")
+
+
+class Command(BaseCommand):
+    help = (
+        "의도 분류부터 응답 스트리밍까지 전체 파이프라인의 처리량과 지연 시간을 측정합니다. "
+        "기본적으로 LLM_BACKEND=fake 에서만 실행되며, 이때 장소 검색 / 캘린더도 fake 를 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=60)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--sessions",
+            type=int,
+            default=10,
+            help="요청을 나눠 보낼 세션 수 (세션별 대화 기록이 쌓임)",
+        )
+        parser.add_argument(
+            "--messages",
+            help="요청 메시지 파일 (한 줄에 하나), 없으면 기본 메시지 사용",
+        )
+        parser.add_argument(
+            "--allow-real",
+            action="store_true",
+            help="fake 가 아닌 LLM 백엔드로도 실행 (실제 API 비용 발생)",
+        )
+
+    def handle(self, *args, **options):
+        if settings.LLM_BACKEND != "fake" and not options["allow_real"]:
+            raise CommandError(
+                f"LLM_BACKEND={settings.LLM_BACKEND} 입니다. "
+                "LLM_BACKEND=fake 로 실행하거나 --allow-real 을 지정하세요."
+            )
+
+        messages = DEFAULT_MESSAGES
+        if options["messages"]:
+            messages = [
+                line.strip()
+                for line in Path(options["messages"]).read_text("utf-8").splitlines()
+                if line.strip()
+            ]
+        if not messages:
+            raise CommandError("요청 메시지가 없습니다.")
+
+        # FinalResponse 툴은 id=1 사용자에게 일정을 저장한다
+        User.objects.get_or_create(id=1, defaults={"username": "tripmind"})
+        if settings.LLM_BACKEND == "fake":
+            self._use_fake_services()
+
+        started = time.perf_counter()
+        results = asyncio.run(self._run(messages, options))
+        elapsed = time.perf_counter() - started
+
+        self._write_report(results, elapsed)
+
+    def _use_fake_services(self):
+        """
+        장소 검색 / 캘린더도 fake 클라이언트로 바꿔 API 키와 네트워크 없이 결정적으로 실행한다.
+        서비스 어댑터(Kakao / Google 응답 변환)는 실제 것을 그대로 사용한다.
+        """
+        from tripmind.clients.calendar.fake_calendar_client import FakeCalendarClient
+        from tripmind.clients.place_search.fake_place_client import FakePlaceClient
+        from tripmind.services.calendar.google_calendar_service import (
+            GOOGLE_CALENDAR_SERVICE,
+            GoogleCalendarService,
+        )
+        from tripmind.services.place_search.kakao_place_search_service import (
+            KAKAO_PLACE_SEARCH_SERVICE,
+            KakaoPlaceSearchService,
+        )
+        from tripmind.utils.component_registry import component_registry
+
+        component_registry.register(
+            KAKAO_PLACE_SEARCH_SERVICE, KakaoPlaceSearchService(FakePlaceClient())
+        )
+        component_registry.register(
+            GOOGLE_CALENDAR_SERVICE, GoogleCalendarService(FakeCalendarClient())
+        )
+
+    async def _run(self, messages, options):
+        # 그래프가 LLM_BACKEND 에 맞는 클라이언트로 만들어지도록 실행 시점에 import
+        from tripmind.api.views.itinerary_api_view import ItineraryAPIView
+        from tripmind.utils.component_registry import component_registry
+
+        view = ItineraryAPIView()
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        run_turn = (
+            self._run_supergraph_turn
+            if settings.AGENT_SUPERGRAPH
+            else self._run_routed_turn
+        )
+
+        async def run_one(index: int):
+            session_id = f"benchmark-{index % options['sessions']}"
+            message = messages[index % len(messages)]
+            async with semaphore:
+                with component_registry.track_request(session_id) as builds:
+                    started = time.perf_counter()
+                    turn = await run_turn(view, message, session_id, started)
+                    return {
+                        **turn,
+                        "latency": time.perf_counter() - started,
+                        "builds": sum(builds.values()),
+                    }
+
+        return await asyncio.gather(
+            *(run_one(index) for index in range(options["requests"]))
+        )
+
+    async def _run_supergraph_turn(self, view, message, session_id, started):
+        from tripmind.agents.prompt_router.constants.intent_constants import Intent
+        from tripmind.agents.prompt_router.prompt_router_agent_executor import (
+            is_router_answer,
+        )
+        from tripmind.agents.supergraph.constants.supergraph_constants import (
+            PROMPT_ROUTER_AGENT,
+        )
+        from tripmind.agents.supergraph.supergraph_agent_executor import (
+            is_client_result,
+        )
+
+        first_event, error, routed = None, None, {}
+        executor = view._get_supergraph_executor()
+        async for subgraph, node_name, result in executor.astream_turn(
+            message, session_id
+        ):
+            if not subgraph and node_name == PROMPT_ROUTER_AGENT:
+                routed = result
+            if not is_client_result(subgraph, node_name, result):
+                continue
+            if first_event is None:
+                first_event = time.perf_counter() - started
+            error = self._find_error(result) or error
+
+        return {
+            "intent": routed.get("intent") or Intent.CONVERSATION.value,
+            "answered_by_router": is_router_answer(routed),
+            "first_event": first_event,
+            "error": error,
+        }
+
+    async def _run_routed_turn(self, view, message, session_id, started):
+        from tripmind.agents.prompt_router.constants.intent_constants import Intent
+        from tripmind.agents.prompt_router.prompt_router_agent_executor import (
+            is_router_answer,
+            is_router_token,
+        )
+        from tripmind.services.itinerary.itinerary_service import ItineraryService
+
+        first_event, error = None, None
+
+        # ROUTER_COMBINED_RESPONSE 이면 라우터가 대화 답변 토큰을 바로 흘려보낸다
+        router = view._get_agent_executor(Intent.CLASSIFY_INTENT.value)
+        routed = {}
+        async for result in router.astream_prompt(
+            prompt=message, session_id=session_id
+        ):
+            if is_router_token(result):
+                first_event = first_event or time.perf_counter() - started
+            else:
+                routed = result
+        intent = routed.get("intent", Intent.CONVERSATION.value)
+        answered = is_router_answer(routed)
+
+        if answered:
+            first_event = first_event or time.perf_counter() - started
+            error = self._find_error(routed)
+        else:
+            service = ItineraryService(view._get_agent_executor(intent))
+            async for result in service.aprocess_message(
+                session_id=session_id,
+                message=message,
+                start_node=routed.get("next_node"),
+            ):
+                if first_event is None:
+                    first_event = time.perf_counter() - started
+                if not isinstance(result, dict):
+                    continue
+                error = self._find_error(result) or error
+
+        return {
+            "intent": intent,
+            "answered_by_router": answered,
+            "first_event": first_event,
+            "error": error,
+        }
+
+    def _find_error(self, result):
+        if result.get("error"):
+            return result["error"]
+        # 상태 스키마에 response 가 없는 그래프는 오류를 assistant 메시지로만 전달
+        messages = result.get("messages") or []
+        texts = [result.get("response") or ""] + [
+            message.get("content", "")
+            for message in messages[-1:]
+            if isinstance(message, dict) and message.get("role") == "assistant"
+        ]
+        return next(
+            (text for text in texts if ERROR_RESPONSE_PATTERN.match(str(text))), None
+        )
+
+    def _write_report(self, results, elapsed):
+        from tripmind.clients.llm.llm_client_factory import get_llm_client
+
+        latencies = np.array([r["latency"] for r in results]) * 1000
+        first_events = (
+            np.array([r["first_event"] for r in results if r["first_event"]]) * 1000
+        )
+        errors = [r for r in results if r["error"]]
+
+        self.stdout.write(
+            f"backend={settings.LLM_BACKEND} supergraph={settings.AGENT_SUPERGRAPH} "
+            f"requests={len(results)} "
+            f"errors={len(errors)} elapsed={elapsed:.2f}s "
+            f"throughput={len(results) / elapsed:.2f} req/s"
+        )
+        self.stdout.write(
+            "latency(ms): "
+            f"mean={latencies.mean():.0f} p50={np.percentile(latencies, 50):.0f} "
+            f"p95={np.percentile(latencies, 95):.0f} "
+            f"p99={np.percentile(latencies, 99):.0f}"
+        )
+        if len(first_events):
+            self.stdout.write(
+                "first event(ms): "
+                f"p50={np.percentile(first_events, 50):.0f} "
+                f"p95={np.percentile(first_events, 95):.0f}"
+            )
+        self.stdout.write(
+            f"intents: {dict(Counter(r['intent'] for r in results))} "
+            f"answered_by_router={sum(1 for r in results if r['answered_by_router'])}"
+        )
+        # 실행기 / 도구 / 클라이언트는 공유되므로 워밍업 이후 요청은 0 이어야 한다
+        builds = [r["builds"] for r in results]
+        self.stdout.write(
+            f"component builds: total={sum(builds)} "
+            f"requests_with_builds={sum(1 for b in builds if b)}"
+        )
+        for node, stats in sorted(get_llm_client().get_llm_metrics().items()):
+            self.stdout.write(
+                f"  {node}: calls={stats['calls']} errors={stats['errors']} "
+                f"in={stats['input_tokens']} out={stats['output_tokens']} "
+                f"latency_sum={stats['latency_seconds']:.2f}s"
+            )
+        for error in errors[:5]:
+            self.stdout.write(self.style.WARNING(f"error: {error['error']}"))
@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from tripmind.clients.llm.llm_metrics import METRICS_LOG_DIR
+
+
+class Command(BaseCommand):
+    help = "LLM 호출 지표 JSONL 기록을 Parquet 파일로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--log-dir",
+            default=str(METRICS_LOG_DIR),
+            help="LLM 지표 JSONL 디렉터리",
+        )
+        parser.add_argument(
+            "--since",
+            help="이 날짜(YYYY-MM-DD) 이후의 기록만 포함",
+        )
+        parser.add_argument(
+            "--output",
+            default="llm_metrics.parquet",
+            help="저장할 Parquet 파일 경로",
+        )
+
+    def handle(self, *args, **options):
+        records = []
+        for path in sorted(Path(options["log_dir"]).glob("llm-*.jsonl")):
+            if options["since"] and path.stem[len("llm-") :] < options["since"]:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+
+        if not records:
+            raise CommandError("내보낼 LLM 지표 기록이 없습니다.")
+
+        df = pd.DataFrame.from_records(records)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        # 오류만 기록된 경우 비용 컬럼이 없을 수 있음
+        df["cost_usd"] = df.get("cost_usd", pd.Series(0.0, index=df.index)).fillna(0.0)
+        df.to_parquet(options["output"], index=False)
+        self.stdout.write(f"{len(df)}건 저장: {options['output']}")
+
+        summary = (
+            df.groupby("node")
+            .agg(
+                calls=("node", "size"),
+                cost_usd=("cost_usd", "sum"),
+                p95_latency_ms=("latency_ms", lambda s: s.quantile(0.95)),
+            )
+            .sort_values("cost_usd", ascending=False)
+        )
+        self.stdout.write(summary.to_string())
@@ -0,0 +1,113 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.agents.prompt_router.intent.shadow import SHADOW_LOG_DIR
+
+
+class Command(BaseCommand):
+    help = "의도 분류 섀도 모드 기록으로 규칙 기반 의도별 precision 을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--log-dir",
+            default=str(SHADOW_LOG_DIR),
+            help="섀도 모드 JSONL 디렉터리",
+        )
+        parser.add_argument(
+            "--min-confidence",
+            type=float,
+            default=0.0,
+            help="이 신뢰도 이상인 규칙 기반 결과만 집계 (임계값 튜닝용)",
+        )
+        parser.add_argument(
+            "--disagreements",
+            type=int,
+            default=10,
+            help="출력할 불일치 입력 개수",
+        )
+        parser.add_argument(
+            "--export-parquet",
+            default=None,
+            help="집계에 사용한 기록을 Parquet 파일로 저장",
+        )
+
+    def handle(self, *args, **options):
+        records = [
+            record
+            for record in self._load_records(Path(options["log_dir"]))
+            if record["rule_confidence"] >= options["min_confidence"]
+        ]
+        if not records:
+            raise CommandError("집계할 섀도 모드 기록이 없습니다.")
+
+        if options["export_parquet"]:
+            import pandas as pd
+
+            pd.DataFrame(records).to_parquet(options["export_parquet"], index=False)
+            self.stdout.write(f"Parquet 저장: {options['export_parquet']}")
+
+        # 규칙 기반에서 매칭되지 않은 입력은 precision 이 아니라 커버리지 문제
+        matched = [r for r in records if r["rule_intent"] != Intent.UNKNOWN.value]
+        self._write_precision(matched)
+        self.stdout.write(f"규칙 미매칭: {len(records) - len(matched)}건")
+        self._write_latency(records)
+        self._write_disagreements(matched, options["disagreements"])
+
+    def _load_records(self, log_dir: Path):
+        for path in sorted(log_dir.glob("shadow-*.jsonl")):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def _write_precision(self, records):
+        if not records:
+            return
+
+        by_intent = defaultdict(list)
+        for record in records:
+            by_intent[record["rule_intent"]].append(record)
+
+        self.stdout.write(
+            f"{'rule_intent':<15}{'count':>8}{'agree':>8}{'precision':>11}"
+            f"{'fast_path':>11}{'fp_precision':>14}"
+        )
+        for intent, rows in sorted(by_intent.items()):
+            agree = sum(1 for row in rows if row["agree"])
+            fast_rows = [row for row in rows if row["fast_path"]]
+            fast_agree = sum(1 for row in fast_rows if row["agree"])
+            fast_precision = f"{fast_agree / len(fast_rows):.2%}" if fast_rows else "-"
+            self.stdout.write(
+                f"{intent:<15}{len(rows):>8}{agree:>8}{agree / len(rows):>11.2%}"
+                f"{len(fast_rows):>11}{fast_precision:>14}"
+            )
+
+        total_agree = sum(1 for record in records if record["agree"])
+        self.stdout.write(
+            f"\n전체 일치율: {total_agree / len(records):.2%} ({len(records)}건)"
+        )
+
+    def _write_latency(self, records):
+        rule_latency = [record["rule_latency_ms"] for record in records]
+        llm_latency = [record["llm_latency_ms"] for record in records]
+        self.stdout.write(
+            f"지연 시간 중앙값: rule={median(rule_latency):.3f}ms "
+            f"llm={median(llm_latency):.1f}ms"
+        )
+
+    def _write_disagreements(self, records, limit):
+        disagreements = [record for record in records if not record["agree"]]
+        if not disagreements or limit <= 0:
+            return
+
+        self.stdout.write(f"\n불일치 입력 (최대 {limit}건):")
+        for record in disagreements[-limit:]:
+            self.stdout.write(
+                f"- rule={record['rule_intent']}({record['rule_confidence']:.2f}) "
+                f"llm={record['llm_intent']}: {record['user_input']}"
+            )
@@ -0,0 +1,109 @@
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.agents.prompt_router.intent.local_classifier import (
+    DEFAULT_MODEL_PATH,
+    LocalIntentClassifier,
+    split_train_test,
+)
+from tripmind.agents.prompt_router.intent.shadow import (
+    SHADOW_LOG_DIR,
+    normalize_intent,
+)
+
+
+class Command(BaseCommand):
+    help = "기록된 (user_input, intent) 쌍으로 로컬 의도 분류기를 학습합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--log-dir",
+            default=str(SHADOW_LOG_DIR),
+            help="섀도 모드 JSONL 디렉터리 (LLM 분류 결과를 정답으로 사용)",
+        )
+        parser.add_argument(
+            "--data",
+            action="append",
+            default=[],
+            help="추가 학습 데이터 JSONL ({'user_input', 'intent'}), 여러 번 지정 가능",
+        )
+        parser.add_argument(
+            "--output",
+            default=str(DEFAULT_MODEL_PATH),
+            help="학습된 모델 저장 경로 (.npz)",
+        )
+        parser.add_argument("--test-ratio", type=float, default=0.2)
+        parser.add_argument("--epochs", type=int, default=200)
+        parser.add_argument("--learning-rate", type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        texts, intents = self._load_pairs(Path(options["log_dir"]), options["data"])
+        if len(texts) < 2:
+            raise CommandError("학습할 (user_input, intent) 기록이 없습니다.")
+
+        train_x, train_y, test_x, test_y = split_train_test(
+            texts, intents, options["test_ratio"]
+        )
+        started = time.perf_counter()
+        classifier = LocalIntentClassifier.fit(
+            train_x,
+            train_y,
+            epochs=options["epochs"],
+            learning_rate=options["learning_rate"],
+        )
+        self.stdout.write(
+            f"학습 완료: {len(train_x)}건, labels={classifier.labels} "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+        if test_x:
+            self.stdout.write(
+                f"held-out 정확도: {classifier.evaluate(test_x, test_y):.2%} "
+                f"({len(test_x)}건)"
+            )
+        self._write_latency(classifier, test_x or train_x)
+
+        classifier.save(options["output"])
+        self.stdout.write(f"모델 저장: {options['output']}")
+
+    def _load_pairs(self, log_dir: Path, data_paths):
+        texts, intents = [], []
+
+        def add(user_input, intent):
+            intent = normalize_intent(intent or "")
+            if user_input and intent and intent != Intent.UNKNOWN.value:
+                texts.append(user_input)
+                intents.append(intent)
+
+        for path in sorted(log_dir.glob("shadow-*.jsonl")):
+            for record in self._read_jsonl(path):
+                add(record.get("user_input"), record.get("llm_intent"))
+
+        for path in data_paths:
+            for record in self._read_jsonl(Path(path)):
+                add(record.get("user_input"), record.get("intent"))
+
+        return texts, intents
+
+    def _read_jsonl(self, path: Path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _write_latency(self, classifier, texts):
+        latencies = []
+        for text in texts:
+            started = time.perf_counter()
+            classifier.predict(text)
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+
+        self.stdout.write(
+            f"예측 지연 시간: mean={np.mean(latencies):.0f}µs "
+            f"p95={np.percentile(latencies, 95):.0f}µs"
+        )
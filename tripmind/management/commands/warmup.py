@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tripmind.utils.startup_report import startup_report
+from tripmind.utils.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "워밍업(tripmind.utils.warmup)을 실행하고 구성 요소별 소요 시간을 출력합니다. "
+        "서빙 워커에서는 WARMUP_ON_STARTUP=true 로 워커 시작 시 같은 워밍업을 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--graphs",
+            help="미리 만들 그래프 이름 (콤마 구분), 없으면 AGENT_SUPERGRAPH 설정에 맞는 그래프",
+        )
+        parser.add_argument(
+            "--skip-llm",
+            action="store_true",
+            help="LLM 클라이언트 / HTTP 커넥션 풀을 만들지 않음",
+        )
+
+    def handle(self, *args, **options):
+        graphs = None
+        if options["graphs"]:
+            graphs = [
+                name.strip() for name in options["graphs"].split(",") if name.strip()
+            ]
+        try:
+            result = warmup(graphs=graphs, skip_llm=options["skip_llm"])
+        except KeyError as e:
+            raise CommandError(e.args[0])
+
+        for warning in result["warnings"]:
+            self.stdout.write(self.style.WARNING(warning))
+        for step in startup_report.get_steps():
+            self.stdout.write(
+                f"{step['component']:<64} {step['seconds'] * 1000:8.0f}ms"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"warmup 완료: templates={result['templates']} "
+                f"total={result['seconds'] * 1000:.0f}ms"
+            )
+        )
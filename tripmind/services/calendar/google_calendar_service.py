@@ -1,9 +1,13 @@
+import os
 from datetime import datetime
 from typing import Dict, Any, List
 from datetime import timedelta
 from tripmind.clients.calendar.google_calendar_client import GoogleCalendarClient
 from tripmind.services.calendar.base_calendar_service import BaseCalendarService
 from tripmind.models.itinerary import Itinerary
+from tripmind.utils.component_registry import component_registry
+
+GOOGLE_CALENDAR_SERVICE = "google_calendar_service"
 
 
 class GoogleCalendarService(BaseCalendarService):
@@ -83,3 +87,16 @@ class GoogleCalendarService(BaseCalendarService):
                 )
 
         return events
+
+
+def get_google_calendar_service() -> GoogleCalendarService:
+    """프로세스 공유 인스턴스 (component_registry 소유). 인증 정보 로드와 API discovery 는 한 번만, HTTP 전송은 스레드별"""
+    return component_registry.get(
+        GOOGLE_CALENDAR_SERVICE,
+        lambda: GoogleCalendarService(
+            GoogleCalendarClient(
+                os.getenv("GOOGLE_CALENDAR_ID"),
+                os.getenv("GOOGLE_CREDENTIALS_PATH"),
+            )
+        ),
+    )
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Generator
+from typing import Dict, Any, AsyncGenerator, Generator
 from tripmind.agents.common.types.agent_executor_type import BaseAgentExcutor
 
 
@@ -24,3 +24,22 @@ class ItineraryService:
                 "messages": [],
                 "context": {},
             }
+
+    async def aprocess_message(
+        self, session_id: str, message: str, start_node: str = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        try:
+            async for result in self.agent_executor.aprocess_prompt(
+                prompt=message,
+                session_id=session_id,
+                start_node=start_node,
+            ):
+                if result:
+                    yield result
+        except Exception as e:
+            yield {
+                "error": str(e),
+                "response": f"[대화 오류] {str(e)}",
+                "messages": [],
+                "context": {},
+            }
@@ -1,8 +1,12 @@
+import os
 from typing import List, Optional
 
 from tripmind.services.place_search.base_place_search_service import PlaceSearchService
 from tripmind.clients.place_search.kakao_place_client import KakaoPlaceClient
 from tripmind.types.place_search_type import PlaceSearchResult
+from tripmind.utils.component_registry import component_registry
+
+KAKAO_PLACE_SEARCH_SERVICE = "kakao_place_search_service"
 
 
 class KakaoPlaceSearchService(PlaceSearchService):
@@ -97,3 +101,19 @@ class KakaoPlaceSearchService(PlaceSearchService):
             )
 
         return None
+
+    def close(self):
+        self.client.close()
+
+
+def get_kakao_place_search_service() -> KakaoPlaceSearchService:
+    """프로세스 공유 인스턴스 (component_registry 소유, 키가 없으면 ValueError)"""
+    return component_registry.get(
+        KAKAO_PLACE_SEARCH_SERVICE,
+        lambda: KakaoPlaceSearchService(
+            KakaoPlaceClient(
+                os.getenv("KAKAO_REST_KEY"),
+                timeout=float(os.getenv("KAKAO_API_TIMEOUT", "5")),
+            )
+        ),
+    )
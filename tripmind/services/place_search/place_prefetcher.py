@@ -0,0 +1,94 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+
+from tripmind.services.place_search.base_place_search_service import PlaceSearchService
+from tripmind.services.place_search.kakao_place_search_service import (
+    get_kakao_place_search_service,
+)
+from tripmind.services.place_search.place_search_cache import (
+    PlaceSearchCache,
+    place_search_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PlacePrefetcher:
+    """
+    여행지가 정해지는 즉시 주요 카테고리("<여행지> 맛집" 등) 장소 검색을 백그라운드로 실행해
+    place_search_cache 에 채워 둔다. 일정 에이전트의 SearchPlaces 호출은 캐시 적중이 되거나
+    진행 중인 검색 결과를 기다린다.
+    """
+
+    def __init__(
+        self,
+        cache: PlaceSearchCache,
+        categories: List[str],
+        max_workers: int = 4,
+        enabled: bool = True,
+        place_search_service: Optional[PlaceSearchService] = None,
+    ):
+        self.cache = cache
+        self.categories = categories
+        self.max_workers = max_workers
+        self.enabled = enabled
+        self._place_search_service = place_search_service
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_keyword(destination: str, category: str) -> str:
+        return f"{destination} {category}"
+
+    def prefetch(self, destination: Optional[str]) -> List[Future]:
+        if not self.enabled or not destination:
+            return []
+
+        service = self._get_place_search_service()
+        if service is None:
+            return []
+
+        futures = []
+        for category in self.categories:
+            keyword = self.make_keyword(destination, category)
+            if self.cache.contains(keyword):
+                continue
+            futures.append(self._get_pool().submit(self._fetch, service, keyword))
+        if futures:
+            logger.info(f"[장소 선검색] {destination}: {len(futures)}건")
+        return futures
+
+    def _fetch(self, service: PlaceSearchService, keyword: str):
+        try:
+            self.cache.get_or_fetch(keyword, lambda: service.search_places(keyword))
+        except Exception as e:
+            logger.warning(f"[장소 선검색] '{keyword}' 실패: {str(e)}")
+
+    def _get_place_search_service(self) -> Optional[PlaceSearchService]:
+        if self._place_search_service is not None:
+            return self._place_search_service
+        if not os.getenv("KAKAO_REST_KEY"):
+            return None
+        return get_kakao_place_search_service()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="place-prefetch",
+                )
+            return self._pool
+
+
+place_prefetcher = PlacePrefetcher(
+    place_search_cache,
+    categories=settings.PLACE_SEARCH_PREFETCH["categories"],
+    max_workers=settings.PLACE_SEARCH_PREFETCH["max_workers"],
+    enabled=settings.PLACE_SEARCH_PREFETCH["enabled"],
+)
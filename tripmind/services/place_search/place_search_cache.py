@@ -0,0 +1,129 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from tripmind.types.place_search_type import PlaceSearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class PlaceSearchCache:
+    """
+    장소 검색 결과 캐시 (TTL + LRU)
+
+    - 같은 키워드 검색이 진행 중이면 새로 호출하지 않고 그 결과를 기다린다
+      (선행 검색 결과를 에이전트의 SearchPlaces 호출이 이어받음).
+      join_timeout 초 안에 끝나지 않으면 기다리지 않고 직접 검색한다
+    - 빈 결과는 API 오류일 수 있으므로 캐시하지 않는다
+    - KakaoPlaceSearchService.search_places 는 location 을 검색에 사용하지 않으므로
+      정규화한 키워드로만 캐시한다
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 1000,
+        join_timeout: float = 5.0,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.join_timeout = join_timeout
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, List[PlaceSearchResult]]]" = (
+            OrderedDict()
+        )
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "joined": 0, "join_timeouts": 0}
+
+    @staticmethod
+    def make_key(keyword: str) -> str:
+        return " ".join(keyword.lower().split())
+
+    def contains(self, keyword: str) -> bool:
+        key = self.make_key(keyword)
+        with self._lock:
+            return self._get_valid(key) is not None or key in self._in_flight
+
+    def get_or_fetch(
+        self, keyword: str, fetch: Callable[[], List[PlaceSearchResult]]
+    ) -> List[PlaceSearchResult]:
+        key = self.make_key(keyword)
+        with self._lock:
+            places = self._get_valid(key)
+            if places is not None:
+                self._stats["hits"] += 1
+                return list(places)
+
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                self._stats["misses"] += 1
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self._stats["joined"] += 1
+
+        if not is_owner:
+            try:
+                return list(future.result(timeout=self.join_timeout))
+            except FutureTimeoutError:
+                # 선행 검색(백그라운드 prefetch 등)이 멈춘 경우 직접 검색
+                logger.warning(f"[장소 검색 캐시] 진행 중 검색 대기 시간 초과: {key}")
+                with self._lock:
+                    self._stats["join_timeouts"] += 1
+                places = fetch()
+                if places:
+                    self._put(key, places)
+                return list(places)
+
+        try:
+            places = fetch()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            if places:
+                self._put(key, places)
+            future.set_result(places)
+            return list(places)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get_valid(self, key: str) -> Optional[List[PlaceSearchResult]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, places = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return places
+
+    def _put(self, key: str, places: List[PlaceSearchResult]):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(places))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+place_search_cache = PlaceSearchCache(
+    ttl_seconds=settings.PLACE_SEARCH_PREFETCH["ttl_seconds"],
+    max_entries=settings.PLACE_SEARCH_PREFETCH["max_entries"],
+    join_timeout=settings.PLACE_SEARCH_PREFETCH["join_timeout_seconds"],
+)
@@ -1,23 +1,147 @@
+import os
+import threading
+import time
 import yaml
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from langchain_core.prompts import (
     ChatPromptTemplate,
     MessagesPlaceholder,
     PromptTemplate,
 )
 
+PROMPT_VERSION_KEY = "prompt_version"
+
 
 class PromptService:
-    def get_system_prompt(self, template_path: str) -> ChatPromptTemplate:
-        prompt_template = self._load_prompt_template_from_yaml(template_path)
+    """
+    YAML 프롬프트 템플릿 로더
+
+    파싱한 YAML 과 정적 partial 을 적용한 ChatPromptTemplate 을 캐시해 요청마다 파일을 읽지 않는다.
+    파일 mtime 은 check_interval 초마다 한 번만 확인하며, 바뀌면 다시 읽는다 (프롬프트 수정 즉시 반영).
+    """
+
+    def __init__(self, check_interval: float = 1.0, max_prompts: int = 128):
+        self.check_interval = check_interval
+        self.max_prompts = max_prompts
+        self._lock = threading.Lock()
+        # 경로 -> (mtime_ns, 마지막 mtime 확인 시각, 파싱한 YAML)
+        self._templates: Dict[str, Tuple[int, float, dict]] = {}
+        # (종류, 경로, partial) -> (mtime_ns, 프롬프트)
+        self._prompts: "OrderedDict[tuple, Tuple[int, ChatPromptTemplate]]" = (
+            OrderedDict()
+        )
+        self._stats = {"hits": 0, "misses": 0, "file_loads": 0}
+
+    def get_system_prompt(
+        self,
+        template_path: str,
+        partial_variables: Optional[Dict[str, Any]] = None,
+    ) -> ChatPromptTemplate:
+        """
+        시스템 프롬프트 + chat_history + 사용자 입력 형식의 프롬프트.
+        partial_variables 는 요청마다 바뀌지 않는 값(모델 이름, 도구 설명 등)만 넘긴다 (캐시 키에 포함).
+        """
+        return self._get_cached_prompt(
+            "system", template_path, partial_variables, self._build_system_prompt
+        )
+
+    def get_tool_calling_prompt(
+        self,
+        template_path: str,
+        partial_variables: Optional[Dict[str, Any]] = None,
+    ) -> ChatPromptTemplate:
+        """tool calling agent 용 프롬프트 (도구 호출 / 결과 메시지가 agent_scratchpad 로 이어짐)"""
+        return self._get_cached_prompt(
+            "tool_calling",
+            template_path,
+            partial_variables,
+            self._build_tool_calling_prompt,
+        )
+
+    def get_template_version(self, template_path: Union[str, Path]) -> int:
+        """템플릿 파일 버전(mtime_ns). 프롬프트를 붙잡아 두는 공유 객체의 재생성 기준으로 쓴다"""
+        return self._get_template_data(str(template_path))[0]
+
+    def preload(self, template_dir: Union[str, Path]) -> int:
+        """template_dir 아래 YAML 템플릿을 모두 파싱해 캐시 (manage.py warmup)"""
+        paths = sorted(Path(template_dir).rglob("*.yaml"))
+        for path in paths:
+            self._get_template_data(str(path))
+        return len(paths)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "prompts": len(self._prompts)}
+
+    def clear_cache(self):
+        with self._lock:
+            self._templates.clear()
+            self._prompts.clear()
+
+    def _get_cached_prompt(
+        self,
+        kind: str,
+        template_path: str,
+        partial_variables: Optional[Dict[str, Any]],
+        build,
+    ) -> ChatPromptTemplate:
+        template_path = str(template_path)
+        version, template_data = self._get_template_data(template_path)
+        key = (kind, template_path, tuple(sorted((partial_variables or {}).items())))
+
+        with self._lock:
+            cached = self._prompts.get(key)
+            if cached is not None and cached[0] == version:
+                self._prompts.move_to_end(key)
+                self._stats["hits"] += 1
+                return cached[1]
+            self._stats["misses"] += 1
+
+        prompt = build(template_path, template_data)
+        if partial_variables:
+            # partial 은 metadata 를 복사한 새 템플릿을 만든다
+            prompt = prompt.partial(**partial_variables)
+
+        with self._lock:
+            self._prompts[key] = (version, prompt)
+            self._prompts.move_to_end(key)
+            while len(self._prompts) > self.max_prompts:
+                self._prompts.popitem(last=False)
+        return prompt
+
+    def _build_system_prompt(
+        self, template_path: str, template_data: dict
+    ) -> ChatPromptTemplate:
         system_prompt = ChatPromptTemplate.from_messages(
             [
-                ("system", prompt_template),
+                ("system", self._get_system_content(template_data)),
                 MessagesPlaceholder(variable_name="chat_history"),
                 ("human", "{input}"),
             ]
         )
+        # LLM 지표를 프롬프트 버전별로 집계할 수 있도록 실행 metadata 로 전달 (get_run_metadata)
+        system_prompt.metadata = {
+            PROMPT_VERSION_KEY: template_data.get("id") or Path(template_path).stem
+        }
         return system_prompt
 
+    def _build_tool_calling_prompt(
+        self, template_path: str, template_data: dict
+    ) -> ChatPromptTemplate:
+        system_prompt = self._build_system_prompt(template_path, template_data)
+        tool_calling_prompt = ChatPromptTemplate.from_messages(
+            list(system_prompt.messages)
+            + [MessagesPlaceholder(variable_name="agent_scratchpad")]
+        )
+        tool_calling_prompt.metadata = system_prompt.metadata
+        return tool_calling_prompt
+
+    def get_run_metadata(self, prompt: ChatPromptTemplate) -> dict:
+        """체인 실행 config 의 metadata (하위 LLM 실행 콜백까지 전달됨)"""
+        return dict(prompt.metadata or {})
+
     def get_prompt_template(self, template_path: str, partial_variables: dict) -> str:
         prompt_template = self._load_prompt_template_from_yaml(template_path)
         return PromptTemplate.from_template(
@@ -38,14 +162,57 @@ class PromptService:
         prompt_template = self._load_prompt_template_from_yaml(template_path)
         return prompt_template
 
+    def _get_system_content(self, template_data: dict) -> Union[str, List[dict]]:
+        """
+        YAML 에 cache_control 이 지정되어 있으면 정적인 template 을 프롬프트 캐시 블록으로,
+        dynamic_template 을 캐시하지 않는 블록으로 나눈 시스템 메시지를 만든다.
+        """
+        cache_control = template_data.get("cache_control")
+        if not cache_control:
+            return template_data["template"]
+
+        content = [
+            {
+                "type": "text",
+                "text": template_data["template"],
+                "cache_control": {"type": cache_control},
+            }
+        ]
+        if template_data.get("dynamic_template"):
+            content.append({"type": "text", "text": template_data["dynamic_template"]})
+        return content
+
     def _load_prompt_template_from_yaml(self, template_path: str) -> str:
         """YAML 파일을 읽어서 프롬프트 템플릿을 문자열로 반환"""
 
+        return self._get_template_data(str(template_path))[1]["template"]
+
+    def _get_template_data(self, template_path: str) -> Tuple[int, dict]:
+        """(mtime_ns, 파싱한 YAML). check_interval 이내에는 파일 시스템을 확인하지 않는다"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._templates.get(template_path)
+            if cached is not None and now - cached[1] < self.check_interval:
+                return cached[0], cached[2]
+
+        mtime = os.stat(template_path).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            template_data = cached[2]
+        else:
+            template_data = self._load_template_data_from_yaml(template_path)
+            with self._lock:
+                self._stats["file_loads"] += 1
+
+        with self._lock:
+            self._templates[template_path] = (mtime, now, template_data)
+        return mtime, template_data
+
+    def _load_template_data_from_yaml(self, template_path: str) -> dict:
         with open(template_path, "r", encoding="utf-8") as f:
-            template_data = yaml.safe_load(f)
-            prompt_str = template_data["template"]
-            return prompt_str
+            return yaml.safe_load(f)
 
 
 # 싱글톤 패턴 적용
-prompt_service = PromptService()
+prompt_service = PromptService(
+    check_interval=float(os.getenv("PROMPT_TEMPLATE_CHECK_INTERVAL", "1.0"))
+)
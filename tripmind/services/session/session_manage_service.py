@@ -1,13 +1,33 @@
 from tripmind.models.session import ConversationSession
-from langchain.memory import ConversationBufferMemory
-from typing import Dict, Any
+from tripmind.services.session.token_budgeted_memory import (
+    SessionChatHistory,
+    Summarizer,
+    TokenBudgetedChatMemory,
+    create_llm_summarizer,
+)
+from django.conf import settings
+from typing import Dict, Optional
 from langgraph.graph import StateGraph
 from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
 
+DEFAULT_MEMORY_NODE = "default"
+
 
 class SessionManageService:
-    def __init__(self):
-        self.memories = {}
+    def __init__(
+        self,
+        token_budgets: Optional[Dict[str, int]] = None,
+        summarizer: Optional[Summarizer] = None,
+        retrieval: Optional[Dict[str, Dict[str, int]]] = None,
+    ):
+        # 세션별 대화 기록은 노드 간 공유, 메모리(토큰 예산 / 요약)는 세션 + 노드별
+        self.histories: Dict[str, SessionChatHistory] = {}
+        self.memories: Dict[str, Dict[str, TokenBudgetedChatMemory]] = {}
+        self.token_budgets = token_budgets or settings.CHAT_MEMORY_TOKEN_BUDGETS
+        self.summarizer = summarizer
+        self.retrieval = (
+            settings.CHAT_MEMORY_RETRIEVAL if retrieval is None else retrieval
+        )
 
     # 추후 세션 / 사용자 별 session을 저장하여 과거 대화 목록 등을 조회할 수 있도록 할 예정
     def get_or_create_session(self, session_id: str) -> ConversationSession:
@@ -20,17 +40,41 @@ class SessionManageService:
         memory_key: str = "chat_history",
         input_key: str = "input",
         output_key: str = "output",
-    ) -> Dict[str, Any]:
-        if session_id not in self.memories:
-            self.memories[session_id] = ConversationBufferMemory(
+        node_name: str = DEFAULT_MEMORY_NODE,
+    ) -> TokenBudgetedChatMemory:
+        node_memories = self.memories.setdefault(session_id, {})
+        if node_name not in node_memories:
+            history = self.histories.setdefault(session_id, SessionChatHistory())
+            retrieval = self.retrieval.get(node_name, {})
+            node_memories[node_name] = TokenBudgetedChatMemory(
+                history=history,
+                max_token_limit=self.get_token_budget(node_name),
+                summarizer=self._get_summarizer(),
                 memory_key=memory_key,
                 return_messages=True,
                 input_key=input_key,
                 output_key=output_key,
+                retrieval_top_k=retrieval.get("top_k", 0),
+                recent_turns=retrieval.get("recent_turns", 2),
+            )
+        return node_memories[node_name]
+
+    def get_token_budget(self, node_name: str) -> int:
+        return self.token_budgets.get(
+            node_name, self.token_budgets[DEFAULT_MEMORY_NODE]
+        )
+
+    def _get_summarizer(self) -> Summarizer:
+        if self.summarizer is None:
+            from tripmind.clients.llm.llm_client_factory import get_llm_client
+
+            self.summarizer = create_llm_summarizer(
+                get_llm_client().get_llm("memory_summary")
             )
-        return self.memories[session_id]
+        return self.summarizer
 
     def clear_memory(self, session_id: str = "default") -> bool:
+        self.histories.pop(session_id, None)
         if session_id in self.memories:
             del self.memories[session_id]
             return True
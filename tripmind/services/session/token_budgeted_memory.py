@@ -0,0 +1,278 @@
+import bisect
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.memory import BaseMemory
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from tripmind.services.session.turn_index import TurnIndex
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "[이전 대화 요약]"
+
+# (기존 요약, 새로 밀려난 메시지) -> 새 요약
+Summarizer = Callable[[str, List[BaseMessage]], str]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 호출 없이 토큰 수를 추정한다.
+    한글 등 비 ASCII 문자는 글자당 1토큰, ASCII 는 4글자당 1토큰으로 계산.
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def _message_text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+def format_messages(messages: List[BaseMessage]) -> str:
+    lines = []
+    for message in messages:
+        role = "사용자" if isinstance(message, HumanMessage) else "어시스턴트"
+        lines.append(f"{role}: {_message_text(message)}")
+    return "\n".join(lines)
+
+
+def truncate_summary(summary: str, messages: List[BaseMessage], max_tokens: int) -> str:
+    """LLM 요약을 사용할 수 없을 때의 추출식 요약 (최근 내용 위주로 max_tokens 이내 유지)"""
+    lines = [line for line in summary.split("\n") if line]
+    for message in messages:
+        role = "사용자" if isinstance(message, HumanMessage) else "어시스턴트"
+        lines.append(f"- {role}: {_message_text(message)[:120]}")
+
+    kept, used = [], 0
+    for line in reversed(lines):
+        tokens = estimate_tokens(line)
+        if used + tokens > max_tokens:
+            break
+        kept.append(line)
+        used += tokens
+    return "\n".join(reversed(kept))
+
+
+class SessionChatHistory:
+    """
+    세션의 전체 대화 기록. 노드별 메모리가 공유하며,
+    메시지별 토큰 수를 누적 합으로 보관해 전체 기록을 다시 세지 않는다.
+    add_turn 으로 저장한 턴은 관련 턴 검색을 위해 TurnIndex 에도 추가한다.
+    """
+
+    def __init__(self):
+        self.messages: List[BaseMessage] = []
+        self._cumulative_tokens: List[int] = []
+        self.turn_starts: List[int] = []
+        self.index = TurnIndex()
+        self.lock = threading.RLock()
+
+    @property
+    def total_tokens(self) -> int:
+        return self._cumulative_tokens[-1] if self._cumulative_tokens else 0
+
+    def add_messages(self, messages: List[BaseMessage]):
+        with self.lock:
+            for message in messages:
+                self.messages.append(message)
+                self._cumulative_tokens.append(
+                    self.total_tokens + estimate_tokens(_message_text(message))
+                )
+
+    def add_turn(self, user_input: str, output: str):
+        with self.lock:
+            self.turn_starts.append(len(self.messages))
+            self.add_messages(
+                [HumanMessage(content=user_input), AIMessage(content=output)]
+            )
+            self.index.add(f"{user_input}\n{output}")
+
+    @property
+    def turn_count(self) -> int:
+        return len(self.turn_starts)
+
+    def turn_range(self, turn: int) -> Tuple[int, int]:
+        start = self.turn_starts[turn]
+        end = (
+            self.turn_starts[turn + 1]
+            if turn + 1 < len(self.turn_starts)
+            else len(self.messages)
+        )
+        return start, end
+
+    def tokens_between(self, start: int, end: int) -> int:
+        if end <= start:
+            return 0
+        before = self._cumulative_tokens[start - 1] if start > 0 else 0
+        return self._cumulative_tokens[end - 1] - before
+
+    def window_start(self, budget: int, lower_bound: int = 0) -> int:
+        """마지막 메시지부터 budget 토큰 이내로 담을 수 있는 첫 인덱스 (사용자 턴에서 시작)"""
+        with self.lock:
+            # messages[i:] 의 토큰 합 <= budget  <=>  cumulative[i - 1] >= total - budget
+            threshold = self.total_tokens - budget
+            start = bisect.bisect_left(self._cumulative_tokens, threshold)
+            start = max(start + (1 if threshold > 0 else 0), lower_bound)
+            while start < len(self.messages) and not isinstance(
+                self.messages[start], HumanMessage
+            ):
+                start += 1
+            return start
+
+    def clear(self):
+        with self.lock:
+            self.messages.clear()
+            self._cumulative_tokens.clear()
+            self.turn_starts.clear()
+            self.index.clear()
+
+
+class TokenBudgetedChatMemory(BaseMemory):
+    """
+    노드별 토큰 예산이 있는 대화 메모리
+
+    - 최근 턴은 원문 그대로, 예산을 넘는 이전 턴은 롤링 요약으로 합친다.
+    - 요약은 새로 밀려난 메시지에 대해서만 갱신한다 (summarized_upto 이후).
+    - 대화 기록(SessionChatHistory)은 같은 세션의 다른 노드 메모리와 공유한다.
+    - retrieval_top_k > 0 이고 현재 입력이 주어지면 현재 입력과 관련된 과거 턴 top-k +
+      최근 recent_turns 턴만 원문으로 보낸다. 최근 턴보다 오래된 턴은 롤링 요약에 합쳐
+      요약 + 원문 턴이 예산 이내가 되도록 한다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    history: SessionChatHistory = Field(default_factory=SessionChatHistory)
+    max_token_limit: int = 2000
+    summarizer: Optional[Summarizer] = None
+    memory_key: str = "chat_history"
+    input_key: str = "input"
+    output_key: str = "output"
+    return_messages: bool = True
+    retrieval_top_k: int = 0
+    recent_turns: int = 2
+
+    moving_summary_buffer: str = ""
+    summarized_upto: int = 0
+    _summary_tokens: int = PrivateAttr(default=0)
+
+    @property
+    def memory_variables(self) -> List[str]:
+        return [self.memory_key]
+
+    @property
+    def max_summary_tokens(self) -> int:
+        return self.max_token_limit // 4
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        query = str(inputs.get(self.input_key) or "")
+        if self.retrieval_top_k > 0 and query:
+            messages = self.get_relevant_messages(query)
+        else:
+            messages = self.get_budgeted_messages()
+        if self.return_messages:
+            return {self.memory_key: messages}
+        return {self.memory_key: format_messages(messages)}
+
+    def get_budgeted_messages(self) -> List[BaseMessage]:
+        with self.history.lock:
+            budget = max(self.max_token_limit - self._summary_tokens, 0)
+            start = self.history.window_start(budget, self.summarized_upto)
+            self._summarize_until(start)
+            recent = list(self.history.messages[start:])
+        return self._with_summary(recent)
+
+    def get_relevant_messages(self, query: str) -> List[BaseMessage]:
+        with self.history.lock:
+            turn_count = self.history.turn_count
+            recent_start = max(turn_count - self.recent_turns, 0)
+            # 최근 턴보다 오래된 턴은 요약에 합친다 (관련 턴으로 원문이 다시 선택될 수 있음)
+            if recent_start > 0:
+                self._summarize_until(self.history.turn_range(recent_start)[0])
+            budget = max(self.max_token_limit - self._summary_tokens, 0)
+            relevant = self.history.index.search(
+                query, self.retrieval_top_k, limit=recent_start
+            )
+
+            # 최근 턴(최신 순) → 관련 턴(유사도 순) 우선순위로 예산 안에 담는다
+            selected, used = [], 0
+            for turn in list(range(turn_count - 1, recent_start - 1, -1)) + relevant:
+                start, end = self.history.turn_range(turn)
+                tokens = self.history.tokens_between(start, end)
+                if used + tokens > budget:
+                    continue
+                selected.append(turn)
+                used += tokens
+
+            messages = []
+            for turn in sorted(selected):
+                start, end = self.history.turn_range(turn)
+                messages.extend(self.history.messages[start:end])
+        return self._with_summary(messages)
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        self.history.add_turn(
+            str(inputs.get(self.input_key, "")), str(outputs.get(self.output_key, ""))
+        )
+
+    def clear(self) -> None:
+        self.history.clear()
+        self.moving_summary_buffer = ""
+        self.summarized_upto = 0
+        self._summary_tokens = 0
+
+    def _summarize_until(self, end: int):
+        """summarized_upto 부터 end 이전까지 새로 밀려난 메시지를 요약에 합친다"""
+        if end > self.summarized_upto:
+            self._fold_into_summary(self.history.messages[self.summarized_upto : end])
+            self.summarized_upto = end
+
+    def _with_summary(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        if not self.moving_summary_buffer:
+            return messages
+        # Anthropic 은 대화 중간의 system 메시지를 허용하지 않으므로 사용자 메시지로 전달
+        summary = HumanMessage(
+            content=f"{SUMMARY_PREFIX}\n{self.moving_summary_buffer}"
+        )
+        return [summary] + messages
+
+    def _fold_into_summary(self, evicted: List[BaseMessage]):
+        summary = None
+        if self.summarizer is not None:
+            try:
+                summary = self.summarizer(self.moving_summary_buffer, evicted)
+            except Exception as e:
+                logger.warning(f"대화 요약 실패, 추출식 요약 사용: {str(e)}")
+
+        if not summary or estimate_tokens(summary) > self.max_summary_tokens:
+            summary = truncate_summary(
+                summary or self.moving_summary_buffer,
+                [] if summary else evicted,
+                self.max_summary_tokens,
+            )
+
+        self.moving_summary_buffer = summary
+        self._summary_tokens = estimate_tokens(summary)
+        logger.info(
+            f"[대화 메모리] 메시지 {len(evicted)}개 요약 "
+            f"(summary_tokens={self._summary_tokens}, limit={self.max_token_limit})"
+        )
+
+
+def create_llm_summarizer(llm) -> Summarizer:
+    """기존 요약에 새로 밀려난 대화를 합쳐 요약하는 LLM 요약기"""
+
+    def summarize(summary: str, messages: List[BaseMessage]) -> str:
+        prompt = (
+            "다음은 여행 상담 대화의 기존 요약과 새로 추가된 대화입니다.\n"
+            "여행지, 날짜, 인원, 예산, 선호, 확정된 일정처럼 이후 대화에 필요한 정보만 남겨 "
+            "5문장 이내의 한국어 요약으로 갱신하세요.\n\n"
+            f"기존 요약:\n{summary or '(없음)'}\n\n"
+            f"새 대화:\n{format_messages(messages)}\n\n"
+            "갱신된 요약:"
+        )
+        response = llm.invoke([HumanMessage(content=prompt)])
+        return _message_text(response).strip()
+
+    return summarize
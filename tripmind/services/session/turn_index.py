@@ -0,0 +1,51 @@
+from typing import List
+
+import numpy as np
+
+from tripmind.utils.text_featurizer import HashedNgramFeaturizer
+
+
+class TurnIndex:
+    """
+    세션 내 과거 턴의 로컬 벡터 인덱스 (해시 문자 n-gram 임베딩, 외부 서비스 없음)
+
+    임베딩은 턴이 추가될 때 한 번만 계산하고, 행렬은 용량을 두 배씩 늘려 재할당을 줄인다.
+    """
+
+    def __init__(self, n_features: int = 1024, initial_capacity: int = 16):
+        self.featurizer = HashedNgramFeaturizer(
+            n_features=n_features, ngram_range=(2, 3)
+        )
+        self._embeddings = np.zeros((initial_capacity, n_features), dtype=np.float32)
+        self.size = 0
+
+    def add(self, text: str):
+        if self.size == len(self._embeddings):
+            grown = np.zeros(
+                (len(self._embeddings) * 2, self.featurizer.n_features),
+                dtype=np.float32,
+            )
+            grown[: self.size] = self._embeddings[: self.size]
+            self._embeddings = grown
+
+        indices, values = self.featurizer.transform_one(text)
+        self._embeddings[self.size, indices] = values
+        self.size += 1
+
+    def search(self, query: str, k: int, limit: int) -> List[int]:
+        """turns[0:limit] 중 query 와 코사인 유사도가 높은 턴 번호 (유사도 0 초과, 높은 순)"""
+        limit = min(limit, self.size)
+        if k <= 0 or limit <= 0:
+            return []
+
+        indices, values = self.featurizer.transform_one(query)
+        if len(indices) == 0:
+            return []
+
+        scores = self._embeddings[:limit, indices] @ values
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [int(turn) for turn in top if scores[turn] > 0]
+
+    def clear(self):
+        self._embeddings[: self.size] = 0
+        self.size = 0
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from tripmind.agents.conversation import (
+    conversation_agent_executor,
+    conversation_agent_graph,
+)
+from tripmind.agents.conversation.conversation_agent_executor import (
+    ConversationAgentExecutor,
+)
+from tripmind.agents.prompt_router.nodes.classify_intent_node import (
+    aclassify_intent_node,
+    classify_intent_node,
+)
+from tripmind.clients.llm.fake_llm_client import FakeLLMClient
+from tripmind.services.session.session_manage_service import session_manage_service
+
+
+class TestAsyncNodes(unittest.TestCase):
+    """graph.astream 에서 LLM 노드의 비동기 버전(ainvoke) 실행 테스트"""
+
+    def setUp(self):
+        self.llm_client = FakeLLMClient({"seed": 1, "time_scale": 0})
+        patcher = patch.object(
+            conversation_agent_graph, "get_llm_client", return_value=self.llm_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        graph = conversation_agent_graph.build_conversation_agent_graph().compile(
+            checkpointer=MemorySaver()
+        )
+        patcher = patch.object(
+            conversation_agent_executor,
+            "graph_registry",
+            MagicMock(get=MagicMock(return_value=graph)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session_id = "async-nodes-session"
+        self.addCleanup(session_manage_service.clear_memory, self.session_id)
+
+    def test_astream_does_not_run_sync_conversation_node(self):
+        async def collect():
+            return [
+                result
+                async for result in ConversationAgentExecutor().aprocess_prompt(
+                    "여행 갈 때 짐은 어떻게 싸는 게 좋아?",
+                    session_id=self.session_id,
+                    start_node="conversation_node",
+                )
+            ]
+
+        with patch.object(
+            conversation_agent_graph,
+            "conversation_node",
+            side_effect=AssertionError("sync node"),
+        ) as sync_node:
+            results = asyncio.run(collect())
+
+        sync_node.assert_not_called()
+        self.assertTrue(results)
+        self.assertNotIn("오류", results[-1]["response"])
+        self.assertTrue(results[-1]["streaming"]["is_complete"])
+
+    def test_stream_still_runs_sync_conversation_node(self):
+        with patch.object(
+            conversation_agent_graph,
+            "conversation_node",
+            wraps=conversation_agent_graph.conversation_node,
+        ) as sync_node:
+            results = list(
+                ConversationAgentExecutor().process_prompt(
+                    "여행 갈 때 짐은 어떻게 싸는 게 좋아?",
+                    session_id=self.session_id,
+                    start_node="conversation_node",
+                )
+            )
+
+        sync_node.assert_called_once()
+        self.assertNotIn("오류", results[-1]["response"])
+
+    def test_async_classify_matches_sync(self):
+        def state():
+            return {
+                "user_input": "제주도 3박 4일 일정 짜줘",
+                "messages": [],
+                "config_data": {"thread_id": self.session_id},
+            }
+
+        sync_result = classify_intent_node(self.llm_client, state())
+        async_result = asyncio.run(aclassify_intent_node(self.llm_client, state()))
+
+        self.assertEqual(async_result["intent"], sync_result["intent"])
+        self.assertEqual(async_result["next_node"], sync_result["next_node"])
+
+
+if __name__ == "__main__":
+    unittest.main()
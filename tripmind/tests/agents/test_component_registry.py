@@ -0,0 +1,95 @@
+import contextvars
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.api.views.itinerary_api_view import ItineraryAPIView
+from tripmind.utils.component_registry import ComponentRegistry
+
+
+class TestComponentRegistry(unittest.TestCase):
+    """프로세스 공유 구성 요소 레지스트리 테스트"""
+
+    def setUp(self):
+        self.registry = ComponentRegistry()
+
+    def test_component_is_built_once(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        component = self.registry.get("client", factory)
+
+        self.assertIs(self.registry.get("client", factory), component)
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(self.registry.get_stats()["builds"], {"client": 1})
+
+    def test_failed_build_is_not_cached(self):
+        def missing_key():
+            raise ValueError("키 없음")
+
+        with self.assertRaises(ValueError):
+            self.registry.get("client", missing_key)
+
+        self.assertEqual(self.registry.get("client", lambda: "client"), "client")
+
+    def test_component_is_rebuilt_when_version_changes(self):
+        first = self.registry.get("agent", object, version=1)
+
+        self.assertIs(self.registry.get("agent", object, version=1), first)
+        self.assertIsNot(self.registry.get("agent", object, version=2), first)
+        self.assertEqual(self.registry.get_stats()["builds"], {"agent": 2})
+
+    def test_registered_component_replaces_factory(self):
+        self.registry.register("client", "fake")
+
+        self.assertEqual(self.registry.get("client", lambda: "real"), "fake")
+
+    def test_reload_closes_and_rebuilds(self):
+        component = MagicMock()
+        hook = MagicMock()
+        self.registry.add_reload_hook(hook)
+        self.registry.get("client", lambda: component)
+
+        self.registry.reload()
+
+        component.close.assert_called_once()
+        hook.assert_called_once()
+        self.assertIsNot(self.registry.get("client", MagicMock), component)
+
+    def test_track_request_counts_builds_in_worker_threads(self):
+        self.registry.get("shared", object)
+
+        with self.registry.track_request() as builds:
+            self.registry.get("shared", object)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.registry.get,
+                    "per_request",
+                    object,
+                ).result()
+
+        self.assertEqual(dict(builds), {"per_request": 1})
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["requests_with_builds"], 1)
+        self.assertIn(
+            'tripmind_component_builds_total{component="per_request"} 1',
+            self.registry.render_prometheus(),
+        )
+
+    def test_view_reuses_agent_executors(self):
+        view = ItineraryAPIView()
+
+        self.assertIs(
+            view._get_agent_executor(Intent.ITINERARY.value),
+            ItineraryAPIView()._get_agent_executor(Intent.ITINERARY.value),
+        )
+        self.assertIs(
+            view._get_agent_executor(Intent.GREETING.value),
+            view._get_agent_executor(Intent.CONVERSATION.value),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
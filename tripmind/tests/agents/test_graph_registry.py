@@ -0,0 +1,35 @@
+import unittest
+
+from tripmind.agents.common.graph_registry import AgentGraphRegistry
+from tripmind.utils.startup_report import startup_report
+
+
+class TestAgentGraphRegistry(unittest.TestCase):
+    """에이전트 그래프 lazy 레지스트리 테스트"""
+
+    def setUp(self):
+        self.registry = AgentGraphRegistry()
+        self.registry.register(
+            "sharing",
+            "tripmind.agents.sharing.sharing_agent_graph:create_sharing_agent_graph",
+        )
+
+    def test_graph_is_built_once_on_first_use(self):
+        self.assertFalse(self.registry.is_built("sharing"))
+
+        graph = self.registry.get("sharing")
+
+        self.assertTrue(self.registry.is_built("sharing"))
+        self.assertIs(self.registry.get("sharing"), graph)
+        self.assertIn(
+            "graph:sharing",
+            [step["component"] for step in startup_report.get_steps()],
+        )
+
+    def test_unknown_graph(self):
+        with self.assertRaises(KeyError):
+            self.registry.get("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from tripmind.agents.prompt_router.intent.manager import IntentPatternManager
+from tripmind.agents.prompt_router.nodes.input_node import input_node
+
+
+class TestIntentPatternManager(unittest.TestCase):
+    """규칙 기반 의도 분류 신뢰도 테스트"""
+
+    def setUp(self):
+        self.manager = IntentPatternManager()
+
+    def test_more_evidence_means_higher_confidence(self):
+        """매칭된 패턴/키워드가 많을수록 신뢰도가 높음"""
+        weak = self.manager.match_intent("여행")
+        strong = self.manager.match_intent("서울 3박4일 여행 일정 짜줘")
+
+        self.assertEqual(weak.intent, "itinerary")
+        self.assertEqual(strong.intent, "itinerary")
+        self.assertGreater(strong.confidence, weak.confidence)
+
+    def test_ambiguous_match_lowers_confidence(self):
+        """다른 의도와 함께 매칭되면 신뢰도가 낮아짐"""
+        match = self.manager.match_intent("캘린더에 일정 추가해줘")
+
+        self.assertEqual(match.intent, "calendar")
+        self.assertEqual(match.runner_up, "itinerary")
+        self.assertLess(match.confidence, 0.6)
+
+    def test_no_match_is_unknown(self):
+        """매칭이 없으면 unknown"""
+        match = self.manager.match_intent("오늘 기분이 좋아")
+
+        self.assertEqual(match.intent, "unknown")
+        self.assertEqual(match.confidence, 0.0)
+
+    def test_input_node_routes_by_confidence(self):
+        """신뢰도가 높으면 바로 라우팅, 낮으면 LLM 의도 분류로 보냄"""
+        fast = input_node({"user_input": "강남역 근처 카페 찾아줘", "messages": []})
+        slow = input_node({"user_input": "여행", "messages": []})
+
+        self.assertEqual(fast["intent"], "place_search")
+        self.assertEqual(fast["next_node"], "ask_info_node")
+        self.assertEqual(slow["intent"], "unknown")
+        self.assertEqual(slow["next_node"], "classify_intent_node")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.agents.prompt_router.intent.shadow import IntentShadowRecorder
+
+
+class TestIntentShadowRecorder(unittest.TestCase):
+    """의도 분류 섀도 모드 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = IntentShadowRecorder(
+            llm_classifier=lambda text: Intent.ITINERARY,
+            sample_rate=1.0,
+            log_dir=self.temp_dir.name,
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_records_agreement_and_latency(self):
+        """규칙 기반/LLM 결과 일치 여부와 지연 시간 기록"""
+        self.recorder.maybe_submit("서울 여행 일정 짜줘").result()
+        self.recorder.maybe_submit("강남역 근처 카페 찾아줘").result()
+
+        lines = next(Path(self.temp_dir.name).glob("shadow-*.jsonl")).read_text()
+        records = [json.loads(line) for line in lines.splitlines()]
+
+        self.assertEqual([r["agree"] for r in records], [True, False])
+        self.assertEqual(records[1]["rule_intent"], "place_search")
+        self.assertIn("llm_latency_ms", records[0])
+
+    def test_report_prints_precision_per_intent(self):
+        """리포트 명령은 규칙 기반 의도별 precision 출력"""
+        self.recorder.maybe_submit("서울 여행 일정 짜줘").result()
+        self.recorder.maybe_submit("강남역 근처 카페 찾아줘").result()
+
+        out = StringIO()
+        call_command("intent_shadow_report", log_dir=self.temp_dir.name, stdout=out)
+
+        self.assertIn("itinerary", out.getvalue())
+        self.assertIn("전체 일치율: 50.00%", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from tripmind.agents.itinerary.nodes.itinerary_node import (
+    STRUCTURED_CHAT_AGENT,
+    TOOL_CALLING_AGENT,
+    create_itinerary_node_agent,
+    get_itinerary_agent_executor,
+)
+from tripmind.agents.itinerary.tools.final_response_tool import FinalResponseTool
+from tripmind.clients.llm.fake_llm_client import FakeLLMClient
+from tripmind.models.itinerary import Itinerary
+from tripmind.services.prompt.prompt_service import prompt_service
+from tripmind.utils.component_registry import component_registry
+
+
+class TestItineraryToolCallingAgent(TestCase):
+    """네이티브 tool use 일정 에이전트 테스트"""
+
+    def setUp(self):
+        User.objects.create(id=1, username="tripmind")
+        self.llm_client = FakeLLMClient({"seed": 1})
+        self.tools = [FinalResponseTool]
+
+    def _invoke(self, agent_type: str, session_id: str):
+        agent_executor = create_itinerary_node_agent(
+            self.llm_client,
+            {"config_data": {"thread_id": session_id}},
+            self.tools,
+            "Tool: FinalResponse",
+            ["FinalResponse"],
+            agent_type=agent_type,
+        )
+        return agent_executor.invoke(
+            {
+                "input": "현재 요청:\n부산 2일 여행 일정 짜줘",
+                "chat_history": [],
+                "tools": "Tool: FinalResponse",
+                "tool_names": "FinalResponse",
+                "agent_scratchpad": [],
+            }
+        )
+
+    def test_final_response_is_called_as_native_tool(self):
+        result = self._invoke(TOOL_CALLING_AGENT, "tool-calling-session")
+
+        self.assertIn("2일차", result["output"])
+        self.assertEqual(Itinerary.objects.filter(destination="부산").count(), 2)
+
+    def test_matches_structured_chat_agent_output(self):
+        tool_calling = self._invoke(TOOL_CALLING_AGENT, "tool-calling-session")
+        structured_chat = self._invoke(STRUCTURED_CHAT_AGENT, "structured-session")
+
+        self.assertEqual(tool_calling["output"], structured_chat["output"])
+
+    def test_unknown_agent_type(self):
+        with self.assertRaises(ValueError):
+            self._invoke("react", "unknown-session")
+
+    def test_shared_executor_is_rebuilt_when_prompt_changes(self):
+        """프롬프트 파일이 수정되면 공유 실행기를 다시 만듦"""
+        self.addCleanup(component_registry.reload)
+        tools = patch(
+            "tripmind.agents.itinerary.nodes.itinerary_node.get_itinerary_tools",
+            return_value=self.tools,
+        )
+        tools.start()
+        self.addCleanup(tools.stop)
+
+        with patch.object(prompt_service, "get_template_version", return_value=1):
+            executor = get_itinerary_agent_executor(self.llm_client, TOOL_CALLING_AGENT)
+            self.assertIs(
+                get_itinerary_agent_executor(self.llm_client, TOOL_CALLING_AGENT),
+                executor,
+            )
+        with patch.object(prompt_service, "get_template_version", return_value=2):
+            self.assertIsNot(
+                get_itinerary_agent_executor(self.llm_client, TOOL_CALLING_AGENT),
+                executor,
+            )
@@ -0,0 +1,103 @@
+import json
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from tripmind.agents.prompt_router.intent import local_classifier
+from tripmind.agents.prompt_router.intent.local_classifier import (
+    LocalIntentClassifier,
+    get_local_intent_classifier,
+    load_local_intent_classifier,
+)
+from tripmind.utils.component_registry import component_registry
+
+TRAINING_DATA = [
+    ("부산 2박 3일 코스 만들어줘", "itinerary"),
+    ("제주도 여행 계획 세워줘", "itinerary"),
+    ("도쿄 3일 동선 짜줘", "itinerary"),
+    ("강릉 당일치기 코스 추천", "itinerary"),
+    ("홍대 근처 맛집 알려줘", "place_search"),
+    ("성수동 카페 어디가 좋아", "place_search"),
+    ("해운대 근처 숙소 찾아줘", "place_search"),
+    ("명동 근처 식당 알려줘", "place_search"),
+]
+
+
+class TestLocalIntentClassifier(unittest.TestCase):
+    """로컬 의도 분류기 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        texts, intents = zip(*TRAINING_DATA)
+        self.classifier = LocalIntentClassifier.fit(list(texts), list(intents))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_predicts_trained_intents(self):
+        """학습한 의도를 확률과 함께 예측"""
+        intent, probability = self.classifier.predict("경주 2박 3일 여행 코스 짜줘")
+        self.assertEqual(intent, "itinerary")
+        self.assertGreater(probability, 0.5)
+
+        intent, _ = self.classifier.predict("종로 근처 맛집 찾아줘")
+        self.assertEqual(intent, "place_search")
+
+    def test_save_and_load(self):
+        """저장한 모델을 다시 로드해도 같은 확률을 반환"""
+        path = str(Path(self.temp_dir.name) / "model.npz")
+        self.classifier.save(path)
+        loaded = load_local_intent_classifier(path)
+
+        self.assertEqual(loaded.labels, self.classifier.labels)
+        self.assertAlmostEqual(
+            loaded.predict("제주 여행 계획")[1],
+            self.classifier.predict("제주 여행 계획")[1],
+            places=5,
+        )
+        self.assertIsNone(load_local_intent_classifier(path + ".missing"))
+
+    def test_classifier_is_loaded_once_on_first_use(self):
+        """모델은 import 시점이 아니라 처음 사용할 때 한 번만 로드"""
+        component_registry.reload()
+        self.addCleanup(component_registry.reload)
+
+        with patch.object(
+            local_classifier, "load_local_intent_classifier", return_value=None
+        ) as load:
+            self.assertIsNone(get_local_intent_classifier())
+            self.assertIsNone(get_local_intent_classifier())
+
+        load.assert_called_once()
+
+    def test_train_command_reports_accuracy(self):
+        """학습 명령은 held-out 정확도와 지연 시간을 출력하고 모델 저장"""
+        data_path = Path(self.temp_dir.name) / "labeled.jsonl"
+        data_path.write_text(
+            "\n".join(
+                json.dumps({"user_input": text, "intent": intent}, ensure_ascii=False)
+                for text, intent in TRAINING_DATA * 3
+            ),
+            encoding="utf-8",
+        )
+        output = Path(self.temp_dir.name) / "model.npz"
+        out = StringIO()
+        call_command(
+            "train_intent_classifier",
+            log_dir=self.temp_dir.name,
+            data=[str(data_path)],
+            output=str(output),
+            stdout=out,
+        )
+
+        self.assertIn("held-out 정확도", out.getvalue())
+        self.assertIn("예측 지연 시간", out.getvalue())
+        self.assertTrue(output.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
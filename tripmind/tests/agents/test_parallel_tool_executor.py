@@ -0,0 +1,71 @@
+import threading
+import time
+import unittest
+
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import StructuredTool
+
+from tripmind.agents.common.utils.parallel_tool_executor import (
+    ParallelToolAgentExecutor,
+)
+
+
+def _search_places(keyword: str) -> str:
+    """장소 검색"""
+    time.sleep(0.2)
+    return f"{keyword} 결과 ({threading.current_thread().name})"
+
+
+class TestParallelToolAgentExecutor(unittest.TestCase):
+    """한 턴의 여러 도구 호출 병렬 실행 테스트"""
+
+    def setUp(self):
+        self.keywords = ["경복궁", "남산타워", "광장시장", "북촌", "한강공원"]
+        self.tool = StructuredTool.from_function(
+            _search_places, name="SearchPlaces", description="장소 검색"
+        )
+
+    def _agent(self, actions_per_turn):
+        def plan(inputs):
+            steps = inputs["intermediate_steps"]
+            if len(steps) >= len(self.keywords):
+                return AgentFinish({"output": "\n".join(o for _, o in steps)}, "")
+            keywords = self.keywords[len(steps) : len(steps) + actions_per_turn]
+            return [AgentAction("SearchPlaces", {"keyword": k}, "") for k in keywords]
+
+        return RunnableLambda(plan)
+
+    def test_runs_tool_calls_of_one_turn_concurrently(self):
+        executor = ParallelToolAgentExecutor(
+            agent=self._agent(actions_per_turn=5),
+            tools=[self.tool],
+            return_intermediate_steps=True,
+        )
+
+        started = time.perf_counter()
+        result = executor.invoke({"input": "서울 일정"})
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.6)
+        observations = [o for _, o in result["intermediate_steps"]]
+        self.assertEqual([o.split(" 결과")[0] for o in observations], self.keywords)
+        self.assertTrue(all("agent-tool" in o for o in observations))
+
+    def test_single_tool_call_runs_inline(self):
+        executor = ParallelToolAgentExecutor(
+            agent=self._agent(actions_per_turn=1),
+            tools=[self.tool],
+            return_intermediate_steps=True,
+        )
+
+        result = executor.invoke({"input": "서울 일정"})
+
+        self.assertEqual(len(result["intermediate_steps"]), 5)
+        self.assertFalse(
+            any("agent-tool" in o for _, o in result["intermediate_steps"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
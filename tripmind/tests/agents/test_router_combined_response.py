@@ -0,0 +1,80 @@
+import unittest
+
+from django.test import override_settings
+
+from tripmind.agents.prompt_router.constants.intent_constants import (
+    ROUTER_ANSWERED_KEY,
+    Intent,
+)
+from tripmind.agents.prompt_router.nodes import classify_intent_node as node_module
+from tripmind.agents.prompt_router.prompt_router_agent_executor import (
+    get_token_stream_nodes,
+)
+from tripmind.clients.llm.fake_llm_client import FakeLLMClient
+from tripmind.services.session.session_manage_service import session_manage_service
+
+
+class TestRouterCombinedResponse(unittest.TestCase):
+    """의도 분류 + 일반 대화 답변 결합 모드 테스트"""
+
+    def setUp(self):
+        self.llm_client = FakeLLMClient({"seed": 1, "time_scale": 0})
+        combined = override_settings(ROUTER_COMBINED_RESPONSE=True)
+        combined.enable()
+        self.addCleanup(combined.disable)
+
+    def _classify(self, user_input: str, session_id: str):
+        return node_module.classify_intent_node(
+            self.llm_client,
+            {
+                "user_input": user_input,
+                "messages": [{"role": "user", "content": user_input}],
+                "config_data": {"thread_id": session_id},
+            },
+        )
+
+    def test_conversation_is_answered_by_router(self):
+        """일반 대화는 라우터가 답변하고 대화 노드 메모리에 저장"""
+        session_id = "combined-conversation"
+        self.addCleanup(session_manage_service.clear_memory, session_id)
+
+        result = self._classify("여행 갈 때 짐은 어떻게 싸는 게 좋아?", session_id)
+
+        self.assertEqual(result["intent"], Intent.CONVERSATION.value)
+        self.assertTrue(result["context"][ROUTER_ANSWERED_KEY])
+        self.assertTrue(result["streaming"]["is_complete"])
+        self.assertEqual(result["messages"][-1]["content"], result["response"])
+
+        memory = session_manage_service.get_session_memory(
+            session_id,
+            memory_key="chat_history",
+            input_key="input",
+            output_key="output",
+            node_name="conversation_node",
+        )
+        history = memory.load_memory_variables({"input": ""})["chat_history"]
+        self.assertEqual(history[-1].content, result["response"])
+
+    def test_other_intents_are_routed(self):
+        """일정 요청은 답변 없이 기존과 같이 라우팅"""
+        result = self._classify("부산 2박 3일 코스 짜줘", "combined-itinerary")
+
+        self.assertEqual(result["intent"], Intent.ITINERARY.value)
+        self.assertEqual(result["next_node"], "router_node")
+        self.assertNotIn(ROUTER_ANSWERED_KEY, result["context"])
+
+    def test_response_is_streamed_only_for_answerable_intents(self):
+        """모델이 일정 요청에 response 를 붙여도 토큰으로 흘려보내지 않음"""
+        make_filter = get_token_stream_nodes()["classify_intent_node"]
+
+        routed = make_filter().feed('{"intent": "itinerary", "response": "부산 코스"}')
+        answered = make_filter().feed(
+            '{"intent": "conversation", "response": "가볍게 싸세요"}'
+        )
+
+        self.assertEqual(routed, "")
+        self.assertEqual(answered, "가볍게 싸세요")
+
+
+if __name__ == "__main__":
+    unittest.main()
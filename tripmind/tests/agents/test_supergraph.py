@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from tripmind.agents.conversation import conversation_agent_graph
+from tripmind.agents.prompt_router import prompt_router_agent_graph
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.agents.supergraph import supergraph_agent_executor
+from tripmind.agents.supergraph.constants.supergraph_constants import (
+    CONVERSATION_AGENT,
+    PROMPT_ROUTER_AGENT,
+)
+from tripmind.agents.supergraph.supergraph_agent_executor import (
+    SupergraphAgentExecutor,
+)
+from tripmind.agents.supergraph.supergraph_agent_graph import (
+    build_supergraph_agent_graph,
+)
+from tripmind.clients.llm.fake_llm_client import FakeLLMClient
+from tripmind.services.session.session_manage_service import session_manage_service
+
+
+class _CountingSaver(MemorySaver):
+    def __init__(self):
+        super().__init__()
+        self.puts = 0
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self.puts += 1
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
+class TestSupergraph(unittest.TestCase):
+    """라우터 + 전문 에이전트 supergraph 테스트"""
+
+    def setUp(self):
+        llm_client = FakeLLMClient({"seed": 1, "time_scale": 0})
+        for module in (prompt_router_agent_graph, conversation_agent_graph):
+            patcher = patch.object(module, "get_llm_client", return_value=llm_client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.checkpointer = _CountingSaver()
+        self.graph = build_supergraph_agent_graph().compile(
+            checkpointer=self.checkpointer
+        )
+        patcher = patch.object(
+            supergraph_agent_executor,
+            "graph_registry",
+            MagicMock(get=MagicMock(return_value=self.graph)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session_id = "supergraph-session"
+        self.addCleanup(session_manage_service.clear_memory, self.session_id)
+        self.executor = SupergraphAgentExecutor()
+
+    def test_turn_is_one_stream_with_one_checkpoint(self):
+        for prompt in ["안녕하세요", "여행 갈 때 짐은 어떻게 싸는 게 좋아?"]:
+            puts = self.checkpointer.puts
+            results = list(
+                self.executor.process_prompt(prompt, session_id=self.session_id)
+            )
+
+            self.assertEqual(self.checkpointer.puts - puts, 1)
+            self.assertTrue(results)
+            self.assertNotIn("[대화 오류]", results[-1]["response"])
+
+        state = self.graph.get_state(
+            {"configurable": {"thread_id": self.session_id}}
+        ).values
+        self.assertEqual(state["intent"], Intent.CONVERSATION.value)
+        self.assertEqual(state["agent"], CONVERSATION_AGENT)
+        self.assertEqual(
+            set(state["agent_states"]), {PROMPT_ROUTER_AGENT, CONVERSATION_AGENT}
+        )
+
+    def test_router_updates_are_not_sent_to_client(self):
+        items = list(self.executor.stream_turn("안녕하세요", self.session_id))
+        results = list(
+            self.executor.process_prompt("안녕하세요", session_id=self.session_id)
+        )
+
+        self.assertIn((PROMPT_ROUTER_AGENT, "input_node"), [i[:2] for i in items])
+        self.assertEqual(
+            len(results),
+            len([i for i in items if i[0] == CONVERSATION_AGENT]),
+        )
+
+    def test_sessions_have_separate_memories(self):
+        """서브그래프 노드가 세션별 대화 기록을 사용"""
+        other_session_id = "supergraph-other-session"
+        self.addCleanup(session_manage_service.clear_memory, other_session_id)
+
+        prompt = "여행 갈 때 짐은 어떻게 싸는 게 좋아?"
+        for session_id in (self.session_id, other_session_id):
+            list(self.executor.process_prompt(prompt, session_id=session_id))
+
+        for session_id in (self.session_id, other_session_id):
+            history = session_manage_service.histories.get(session_id)
+            self.assertIsNotNone(history)
+            # 사용자 입력 + 응답 한 턴만 기록
+            self.assertEqual(len(history.messages), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from tripmind.agents.itinerary.itinerary_agent_executor import TOKEN_STREAM_NODES
+from tripmind.agents.common.utils.token_stream import (
+    JsonStringFieldTokenFilter,
+    PlainTextTokenFilter,
+)
+from tripmind.api.streaming.sse_protocol import format_sse
+
+
+class TestTokenStream(unittest.TestCase):
+    """LLM 토큰 스트림 필터 테스트"""
+
+    def _feed_by_char(self, token_filter, text):
+        return "".join(token_filter.feed(char) for char in text)
+
+    def test_plain_text_filter(self):
+        """일반 대화 토큰은 그대로 전달"""
+        token_filter = PlainTextTokenFilter()
+        self.assertEqual(token_filter.feed("안녕하세요"), "안녕하세요")
+
+    def test_final_response_natural_text(self):
+        """FinalResponse action blob 에서 natural_text 만 추출"""
+        blob = (
+            'Thought: "서울" 일정을 만듭니다\n```json\n'
+            '{"action": "FinalResponse", "action_input": {"items": ['
+            '{"title": "서울 \\"1일\\"", "natural_text": "첫째 날\\n경복궁"},'
+            '{"title": "서울", "natural_text": "둘째 날 \\uc11c\\uc6b8"}]}}\n```'
+        )
+        token_filter = TOKEN_STREAM_NODES["itinerary_node"]()
+
+        result = self._feed_by_char(token_filter, blob)
+
+        self.assertEqual(result, "첫째 날\n경복궁\n\n둘째 날 서울")
+
+    def test_final_answer_action_input(self):
+        """Final Answer 의 문자열 action_input 추출"""
+        token_filter = TOKEN_STREAM_NODES["itinerary_node"]()
+
+        result = token_filter.feed(
+            '{"action": "Final Answer", "action_input": "최종 답변입니다"}'
+        )
+
+        self.assertEqual(result, "최종 답변입니다")
+
+    def test_tool_call_is_not_streamed(self):
+        """도구 호출 JSON 은 사용자에게 흘려보내지 않음"""
+        token_filter = TOKEN_STREAM_NODES["itinerary_node"]()
+
+        result = self._feed_by_char(
+            token_filter,
+            '{"action": "SearchPlaces", "action_input": {"keyword": "카페"}}',
+        )
+
+        self.assertEqual(result, "")
+
+    def test_string_tool_input_is_not_streamed(self):
+        """문자열 action_input 이라도 Final Answer 가 아니면 흘려보내지 않음"""
+        token_filter = TOKEN_STREAM_NODES["itinerary_node"]()
+
+        tool_call = self._feed_by_char(
+            token_filter, '{"action": "SearchPlaces", "action_input": "제주 카페"}'
+        )
+        final_answer = self._feed_by_char(
+            token_filter,
+            '\nThought: 답변\n{"action": "Final Answer", "action_input": "제주 일정"}',
+        )
+
+        self.assertEqual(tool_call, "")
+        self.assertEqual(final_answer, "제주 일정")
+
+    def test_conditional_field_without_condition_key(self):
+        """조건 키가 없으면 조건부 필드는 흘려보내지 않음"""
+        token_filter = JsonStringFieldTokenFilter(
+            ["answer"], conditions={"answer": ("type", "final")}
+        )
+
+        self.assertEqual(token_filter.feed('{"answer": "검색어"}'), "")
+
+    def test_invalid_unicode_escape_is_passed_through(self):
+        """잘못된 \\uXXXX 는 오류 없이 원문 그대로 전달"""
+        token_filter = JsonStringFieldTokenFilter(["answer"])
+
+        result = self._feed_by_char(token_filter, '{"answer": "a\\uZZ12 b \\u12"}')
+
+        self.assertEqual(result, "a\\uZZ12 b \\u12")
+
+    def test_surrogate_pair_is_combined(self):
+        """서로게이트 쌍은 한 글자로 합치고, 짝이 없으면 대체 문자로 바꿈"""
+        token_filter = JsonStringFieldTokenFilter(["answer"])
+
+        result = self._feed_by_char(
+            token_filter, '{"answer": "\\ud83d\\ude00 \\ud83d! \\ude00"}'
+        )
+
+        self.assertEqual(result, "\U0001f600 \ufffd! \ufffd")
+        format_sse({"text": result}, event="delta").encode("utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
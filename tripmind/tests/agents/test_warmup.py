@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from tripmind.utils.warmup import warmup_on_startup
+
+
+class TestWarmupOnStartup(unittest.TestCase):
+    """워커 진입점 워밍업 테스트"""
+
+    @override_settings(WARMUP_ON_STARTUP=False)
+    @patch("tripmind.utils.warmup.warmup")
+    def test_disabled_by_default(self, mock_warmup):
+        warmup_on_startup()
+
+        mock_warmup.assert_not_called()
+
+    @override_settings(WARMUP_ON_STARTUP=True)
+    @patch("tripmind.utils.warmup.warmup")
+    def test_runs_when_enabled(self, mock_warmup):
+        mock_warmup.return_value = {"templates": 3, "seconds": 0.1, "warnings": []}
+
+        warmup_on_startup()
+
+        mock_warmup.assert_called_once_with()
+
+    @override_settings(WARMUP_ON_STARTUP=True)
+    @patch("tripmind.utils.warmup.warmup", side_effect=RuntimeError("boom"))
+    def test_failure_does_not_stop_worker(self, mock_warmup):
+        with self.assertLogs("tripmind.utils.warmup", level="ERROR"):
+            warmup_on_startup()
+
+
+if __name__ == "__main__":
+    unittest.main()
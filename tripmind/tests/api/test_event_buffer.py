@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+
+from django.test import RequestFactory
+
+from tripmind.api.streaming.event_buffer import (
+    StreamEventStore,
+    get_last_event_id,
+)
+from tripmind.api.streaming.sse_protocol import SSEEncoderV2
+from tripmind.tests.api.test_sse_protocol import _parse_frames, _result
+
+
+def _event_ids(frames):
+    return [int(frame.split("\n", 1)[0][4:]) for frame in frames]
+
+
+async def _results(messages, gate=None):
+    for i, message in enumerate(messages):
+        if gate is not None and i == 2:
+            await gate.wait()
+        yield _result(message)
+    yield _result(messages[-1], is_complete=True)
+
+
+class TestEventBuffer(unittest.TestCase):
+    """재연결 가능한 SSE 이벤트 버퍼 테스트"""
+
+    def _start_turn(self, store, messages, gate=None):
+        encoder = SSEEncoderV2(session_id="session")
+        return store.start_turn(
+            "session", encoder.aencode(_results(messages, gate)), encoder
+        )
+
+    def test_last_event_id_from_header_or_query(self):
+        factory = RequestFactory()
+
+        self.assertEqual(get_last_event_id(factory.get("/", HTTP_LAST_EVENT_ID="7")), 7)
+        self.assertEqual(get_last_event_id(factory.get("/?last_event_id=3")), 3)
+        self.assertIsNone(get_last_event_id(factory.get("/")))
+
+    def test_reconnect_replays_missed_events_then_continues_live(self):
+        async def scenario():
+            store = StreamEventStore(max_events=100, max_sessions=10, ttl_seconds=60)
+            gate = asyncio.Event()
+            turn = self._start_turn(
+                store, ["부산", "부산 1일차", "부산 1일차 해운대"], gate
+            )
+
+            # 첫 연결은 두 이벤트만 받고 끊김
+            first = []
+            async for frame in turn.subscribe():
+                first.append(frame)
+                if len(first) == 2:
+                    break
+
+            resumed = turn.subscribe(_event_ids(first)[-1])
+            gate.set()
+            rest = [frame async for frame in resumed]
+            return first, rest, store.get("session")
+
+        first, rest, stored = asyncio.run(scenario())
+
+        ids = _event_ids(first + rest)
+        self.assertEqual(ids, sorted(set(ids)))
+        events = _parse_frames(first + rest)
+        self.assertEqual(events[0][0], "start")
+        self.assertEqual(events[-1][0], "done")
+        text = "".join(data["text"] for event, data in events if event == "delta")
+        self.assertEqual(text, "부산 1일차 해운대")
+        self.assertTrue(stored.is_finished)
+
+    def test_generation_continues_without_subscriber(self):
+        async def scenario():
+            store = StreamEventStore(max_events=100, max_sessions=10, ttl_seconds=60)
+            turn = self._start_turn(store, ["제주", "제주 여행"])
+            while not turn.is_finished:
+                await asyncio.sleep(0)
+            return [frame async for frame in turn.subscribe(0)]
+
+        events = _parse_frames(asyncio.run(scenario()))
+
+        self.assertEqual(events[0][0], "start")
+        self.assertEqual(events[-1][0], "done")
+
+    def test_ids_from_previous_turn_are_not_resumed(self):
+        async def scenario():
+            store = StreamEventStore(max_events=100, max_sessions=10, ttl_seconds=60)
+            previous = self._start_turn(store, ["제주"])
+            while not previous.is_finished:
+                await asyncio.sleep(0)
+            current = self._start_turn(store, ["부산"])
+            while not current.is_finished:
+                await asyncio.sleep(0)
+            return previous, current
+
+        previous, current = asyncio.run(scenario())
+
+        self.assertFalse(current.has_event(previous.last_event_id))
+        self.assertTrue(current.has_event(current.last_event_id))
+        self.assertFalse(current.has_event(current.last_event_id + 1))
+
+    def test_dropped_events_are_replaced_by_snapshot(self):
+        async def scenario():
+            store = StreamEventStore(max_events=2, max_sessions=10, ttl_seconds=60)
+            turn = self._start_turn(store, ["도쿄", "도쿄 3박", "도쿄 3박 4일"])
+            while not turn.is_finished:
+                await asyncio.sleep(0)
+            return [frame async for frame in turn.subscribe(1)], turn.last_event_id
+
+        frames, last_event_id = asyncio.run(scenario())
+
+        events = _parse_frames(frames)
+        self.assertEqual(events[0][0], "start")
+        self.assertEqual(events[1], ("delta", {"text": "도쿄 3박 4일", "reset": True}))
+        self.assertEqual(events[-1][0], "done")
+        self.assertEqual(_event_ids(frames[-1:]), [last_event_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import unittest
+
+from django.test import RequestFactory
+
+from tripmind.api.streaming.sse_protocol import (
+    SSEEncoderV2,
+    negotiate_stream_version,
+)
+
+
+def _parse_frames(frames):
+    events = []
+    for frame in frames:
+        event, data = "message", None
+        for line in frame.strip().split("\n"):
+            if line.startswith("event: "):
+                event = line[7:]
+            elif line.startswith("data: "):
+                data = json.loads(line[6:])
+        events.append((event, data))
+    return events
+
+
+def _result(message, context=None, is_complete=False):
+    return {
+        "response": message if is_complete else "",
+        "messages": [{"role": "assistant", "content": message}],
+        "context": context or {},
+        "intent": "itinerary",
+        "next_node": "itinerary_node",
+        "streaming": {
+            "message": message,
+            "current_position": len(message),
+            "is_complete": is_complete,
+        },
+    }
+
+
+class TestSSEProtocol(unittest.TestCase):
+    """SSE 이벤트 프로토콜 테스트"""
+
+    def test_negotiate_stream_version(self):
+        """헤더 기반 버전 협상, 기본값은 v1"""
+        factory = RequestFactory()
+
+        self.assertEqual(negotiate_stream_version(factory.post("/")), 1)
+        self.assertEqual(
+            negotiate_stream_version(
+                factory.post("/", HTTP_ACCEPT="text/event-stream; version=2")
+            ),
+            2,
+        )
+        self.assertEqual(
+            negotiate_stream_version(
+                factory.post("/", HTTP_X_TRIPMIND_STREAM_VERSION="2")
+            ),
+            2,
+        )
+        self.assertEqual(
+            negotiate_stream_version(
+                factory.post("/", HTTP_X_TRIPMIND_STREAM_VERSION="9")
+            ),
+            1,
+        )
+
+    def test_v2_sends_only_deltas(self):
+        """v2 는 누적 메시지 대신 추가된 텍스트만 전송"""
+        encoder = SSEEncoderV2(session_id="s1")
+        results = [
+            _result("서울"),
+            _result("서울 여행"),
+            _result("서울 여행 일정", context={"destination": "서울"}),
+            _result(
+                "서울 여행 일정", context={"destination": "서울"}, is_complete=True
+            ),
+        ]
+
+        events = _parse_frames(encoder.encode(results))
+
+        self.assertEqual(
+            events,
+            [
+                ("start", {"version": 2, "session_id": "s1"}),
+                ("delta", {"text": "서울"}),
+                ("delta", {"text": " 여행"}),
+                ("delta", {"text": " 일정"}),
+                ("context", {"destination": "서울"}),
+                ("done", {"intent": "itinerary", "next_node": "itinerary_node"}),
+            ],
+        )
+
+    def test_v2_resets_when_prefix_changes(self):
+        """검증으로 앞부분이 바뀐 완료 메시지는 reset 으로 전체 교체"""
+        encoder = SSEEncoderV2()
+        results = [_result("초안"), _result("검증된 답변", is_complete=True)]
+
+        events = _parse_frames(encoder.encode(results))
+
+        self.assertIn(("delta", {"text": "검증된 답변", "reset": True}), events)
+
+    def test_v2_response_without_streaming(self):
+        """스트리밍 상태가 없는 에이전트는 마지막 response 를 한 번 전송"""
+        encoder = SSEEncoderV2()
+        results = [
+            {"response": "공유 완료", "context": {}, "intent": "sharing"},
+        ]
+
+        events = _parse_frames(encoder.encode(results))
+
+        self.assertEqual(events[1], ("delta", {"text": "공유 완료"}))
+        self.assertEqual(events[-1][0], "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
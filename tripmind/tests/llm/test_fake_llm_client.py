@@ -0,0 +1,111 @@
+import asyncio
+import json
+import random
+import time
+import unittest
+from unittest.mock import patch
+
+from langchain.agents.output_parsers import JSONAgentOutputParser
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from tripmind.agents.itinerary.types.final_response_tool_type import (
+    FinalResponseListInput,
+)
+from tripmind.agents.prompt_router.nodes.classify_intent_node import get_intent
+from tripmind.agents.prompt_router.constants.intent_constants import Intent
+from tripmind.clients.llm.fake_llm_client import (
+    FakeLLMClient,
+    LatencyDistribution,
+    fake_llm_metrics,
+)
+
+
+class TestFakeLLMClient(unittest.TestCase):
+    """부하 테스트용 fake LLM 백엔드 테스트"""
+
+    def setUp(self):
+        self.client = FakeLLMClient(
+            {
+                "seed": 7,
+                "nodes": {
+                    "default": {
+                        "latency": {"distribution": "fixed", "mean": 0.05},
+                        "tokens_per_second": 1000,
+                    }
+                },
+            }
+        )
+
+    def test_classify_intent_returns_valid_json(self):
+        llm = self.client.get_llm("classify_intent_node")
+        response = llm.invoke([HumanMessage(content="제주도 3일 여행 일정 짜줘")])
+
+        self.assertEqual(get_intent({"output": response.content}), Intent.ITINERARY)
+
+    def test_calls_are_measured_without_writing_logs(self):
+        """fake 백엔드 호출은 메모리에서만 집계하고 JSONL 기록을 남기지 않음"""
+        llm = self.client.get_llm("conversation_node")
+        with patch.object(fake_llm_metrics, "_write") as write:
+            llm.invoke([HumanMessage(content="안녕")])
+
+        write.assert_not_called()
+        # 그래프 밖에서 직접 호출하면 노드 이름이 없으므로 unknown 으로 집계
+        self.assertGreaterEqual(self.client.get_llm_metrics()["unknown"]["calls"], 1)
+
+    def test_itinerary_returns_final_response_tool_call(self):
+        llm = self.client.get_llm("itinerary_node")
+        response = llm.invoke(
+            [
+                SystemMessage(content="system"),
+                HumanMessage(content="현재 요청:\n부산 2일 여행 2025-07-01 출발"),
+            ]
+        )
+
+        action = JSONAgentOutputParser().parse(response.content)
+        self.assertEqual(action.tool, "FinalResponse")
+        items = FinalResponseListInput(**action.tool_input).items
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0].destination, "부산")
+        self.assertEqual(items[1].date, "2025-07-02")
+
+    def test_responses_and_streams_are_deterministic(self):
+        llm = self.client.get_llm("conversation_node")
+        messages = [HumanMessage(content="여행 준비물 알려줘")]
+
+        chunks = [chunk.content for chunk in llm.stream(messages)]
+        again = FakeLLMClient({"seed": 7}).get_llm("conversation_node")
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), again.invoke(messages).content)
+        self.assertGreater(llm.invoke(messages).usage_metadata["output_tokens"], 0)
+
+    def test_latency_profile_is_applied(self):
+        llm = self.client.get_llm("conversation_node")
+        started = time.perf_counter()
+        asyncio.run(llm.ainvoke([HumanMessage(content="안녕")]))
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    def test_latency_distribution_sampling(self):
+        distribution = LatencyDistribution("lognormal", mean=1.0, spread=0.5)
+        samples = [distribution.sample(random.Random(i)) for i in range(200)]
+
+        self.assertEqual(samples[0], distribution.sample(random.Random(0)))
+        self.assertTrue(all(sample > 0 for sample in samples))
+        self.assertAlmostEqual(sorted(samples)[100], 1.0, delta=0.2)
+
+    def test_script_overrides_node_responses(self):
+        import tempfile
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"conversation_node": ["스크립트 응답: {input}"]}, f)
+
+        client = FakeLLMClient({"script": f.name})
+        response = client.get_llm("conversation_node").invoke(
+            [HumanMessage(content="질문")]
+        )
+        self.assertEqual(response.content, "스크립트 응답: 질문")
+
+
+if __name__ == "__main__":
+    unittest.main()
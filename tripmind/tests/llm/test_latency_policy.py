@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from tripmind.clients.llm.latency_policy import LatencyGuard, LLMTimeoutError
+from tripmind.clients.llm.llm_gateway import LLMGateway
+
+
+class TestLatencyGuard(unittest.TestCase):
+    """노드별 LLM 지연 시간 정책 테스트"""
+
+    def setUp(self):
+        self.guard = LatencyGuard(
+            {
+                "default": {"timeout": 1.0, "max_retries": 2, "backoff_base": 0.001},
+                "classify_intent_node": {"hedge": True, "hedge_after": 0.05},
+                "itinerary_node": {"timeout": 0.05, "max_retries": 0},
+            }
+        )
+
+    def test_retries_transient_errors(self):
+        """일시적 오류는 지터 백오프 후 재시도"""
+        attempts = []
+
+        def attempt(timeout):
+            attempts.append(timeout)
+            if len(attempts) < 3:
+                raise TimeoutError("stalled")
+            return "ok"
+
+        self.assertEqual(self.guard.call("conversation_node", attempt), "ok")
+        self.assertEqual(attempts, [1.0, 1.0, 1.0])
+        stats = self.guard.metrics.get_stats()["conversation_node"]
+        self.assertEqual((stats["retries"], stats["success"]), (2, 1))
+
+    def test_non_transient_error_is_not_retried(self):
+        """일시적 오류가 아니면 바로 실패"""
+
+        def attempt(timeout):
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            self.guard.call("conversation_node", attempt)
+        self.assertEqual(
+            self.guard.metrics.get_stats()["conversation_node"]["errors"], 1
+        )
+
+    def test_async_stream_times_out(self):
+        """멈춘 스트림은 시간 제한에서 끊고 타임아웃으로 기록"""
+
+        async def stalled(timeout):
+            await asyncio.sleep(1)
+            yield "never"
+
+        async def run():
+            with self.assertRaises(LLMTimeoutError):
+                async for _ in self.guard.astream("itinerary_node", stalled):
+                    pass
+
+        asyncio.run(run())
+        self.assertEqual(
+            self.guard.metrics.get_stats()["itinerary_node"]["timeouts"], 1
+        )
+
+    def test_hedge_fires_second_request(self):
+        """헤지 시점을 넘기면 두 번째 요청을 보내고 먼저 끝난 결과 사용"""
+        calls = []
+        release = threading.Event()
+
+        def attempt(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                release.wait(1)
+                return "slow"
+            return "fast"
+
+        started = time.perf_counter()
+        result = self.guard.call("classify_intent_node", attempt)
+        release.set()
+
+        self.assertEqual(result, "fast")
+        self.assertLess(time.perf_counter() - started, 0.5)
+        stats = self.guard.metrics.get_stats()["classify_intent_node"]
+        self.assertEqual((stats["hedges"], stats["hedge_wins"]), (1, 1))
+
+    def test_hedge_loser_releases_gateway_slot(self):
+        """경쟁에서 진 동기 요청은 끝나기 전에 게이트웨이 슬롯을 반환"""
+        gateway = LLMGateway(max_in_flight=2, pool_size=2, keepalive_expiry=1)
+        release = threading.Event()
+        calls = []
+
+        def attempt(timeout):
+            with gateway.slot("session"):
+                calls.append(timeout)
+                if len(calls) == 1:
+                    release.wait(1)
+                    return "slow"
+                return "fast"
+
+        self.assertEqual(self.guard.call("classify_intent_node", attempt), "fast")
+        self.assertEqual(gateway.scheduler.in_flight, 0)
+        release.set()
+
+    def test_async_hedge_fires_second_request(self):
+        """비동기 호출도 헤지 요청 중 먼저 끝난 결과 사용"""
+        calls = []
+
+        async def attempt(timeout):
+            calls.append(timeout)
+            await asyncio.sleep(0.5 if len(calls) == 1 else 0)
+            return len(calls)
+
+        result = asyncio.run(self.guard.acall("classify_intent_node", attempt))
+        self.assertEqual(result, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import unittest
+
+from tripmind.clients.llm.llm_gateway import FairLLMScheduler
+
+
+class TestFairLLMScheduler(unittest.TestCase):
+    """LLM 게이트웨이 스케줄러 테스트"""
+
+    def test_round_robin_across_sessions(self):
+        """대기 요청은 세션 간 라운드 로빈으로 처리"""
+        scheduler = FairLLMScheduler(max_in_flight=1)
+        scheduler.acquire("holder")
+
+        woken = []
+        threads = []
+        for session_id in ["a", "a", "a", "b"]:
+            thread = threading.Thread(
+                target=lambda s=session_id: (scheduler.acquire(s), woken.append(s))
+            )
+            thread.start()
+            threads.append(thread)
+            # 대기열 순서를 고정하기 위해 앞 요청이 큐에 들어갈 때까지 대기
+            while scheduler.queued < len(threads):
+                pass
+
+        for expected in [["a"], ["a", "b"], ["a", "b", "a"], ["a", "b", "a", "a"]]:
+            scheduler.release()
+            while len(woken) < len(expected):
+                pass
+            self.assertEqual(woken, expected)
+
+        for thread in threads:
+            thread.join()
+        scheduler.release()
+        self.assertEqual(scheduler.in_flight, 0)
+
+    def test_async_acquire_waits_for_release(self):
+        """비동기 요청도 동기 요청과 같은 슬롯을 공유"""
+        scheduler = FairLLMScheduler(max_in_flight=1)
+        scheduler.acquire("sync")
+
+        async def run():
+            task = asyncio.create_task(scheduler.aacquire("async"))
+            await asyncio.sleep(0)
+            self.assertFalse(task.done())
+
+            scheduler.release()
+            await asyncio.wait_for(task, timeout=1)
+            self.assertEqual(scheduler.in_flight, 1)
+
+            scheduler.release()
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.in_flight, 0)
+
+    def test_cancelled_waiter_leaves_queue(self):
+        """취소된 비동기 대기 요청은 대기열에서 제거"""
+        scheduler = FairLLMScheduler(max_in_flight=1)
+        scheduler.acquire("sync")
+
+        async def run():
+            task = asyncio.create_task(scheduler.aacquire("async"))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.queued, 0)
+        scheduler.release()
+        self.assertEqual(scheduler.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from tripmind.clients.llm.llm_metrics import LLMMetricsHandler, estimate_cost
+
+
+class TestLLMMetricsHandler(unittest.TestCase):
+    """LLM 호출 지표 콜백 테스트"""
+
+    def setUp(self):
+        self.handler = LLMMetricsHandler(persist=False)
+
+    def _run(self, node="itinerary_node", session="session-1", usage=None):
+        run_id = uuid4()
+        self.handler.on_chat_model_start(
+            {},
+            [[]],
+            run_id=run_id,
+            metadata={
+                "langgraph_node": node,
+                "thread_id": session,
+                "prompt_version": "itinerary_v1",
+            },
+            invocation_params={"model": "claude-3-5-haiku-20241022"},
+        )
+        self.handler.on_llm_new_token("안", run_id=run_id)
+        message = AIMessage(
+            content="안녕하세요",
+            usage_metadata=usage
+            or {
+                "input_tokens": 1200,
+                "output_tokens": 100,
+                "total_tokens": 1300,
+                "input_token_details": {"cache_read": 1000, "cache_creation": 0},
+            },
+        )
+        self.handler.on_llm_end(
+            LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id
+        )
+
+    def test_aggregates_tokens_and_cost_per_node(self):
+        """노드별로 토큰과 추정 비용을 집계하고 캐시 읽기 토큰은 분리"""
+        self._run()
+        self._run(session="session-2")
+
+        stats = self.handler.get_stats()["itinerary_node"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["input_tokens"], 400)
+        self.assertEqual(stats["cache_read_tokens"], 2000)
+        self.assertEqual(stats["output_tokens"], 200)
+        self.assertEqual(stats["ttft_count"], 2)
+        self.assertAlmostEqual(
+            stats["cost_usd"],
+            2 * estimate_cost("claude-3-5-haiku-20241022", 200, 100, cache_read=1000),
+        )
+        self.assertEqual(self.handler.get_session_stats("session-1")["calls"], 1)
+
+    def test_prompt_cache_stats_per_node(self):
+        """노드별 캐시 적중/미스 토큰을 같은 집계에서 계산"""
+        self._run()
+        self._run(
+            node="conversation_node",
+            usage={
+                "input_tokens": 900,
+                "output_tokens": 10,
+                "total_tokens": 910,
+                "input_token_details": {"cache_read": 0, "cache_creation": 800},
+            },
+        )
+
+        self.assertEqual(
+            self.handler.get_prompt_cache_stats(),
+            {
+                "itinerary_node": {
+                    "calls": 1,
+                    "input": 200,
+                    "cache_read": 1000,
+                    "cache_creation": 0,
+                },
+                "conversation_node": {
+                    "calls": 1,
+                    "input": 100,
+                    "cache_read": 0,
+                    "cache_creation": 800,
+                },
+            },
+        )
+
+    def test_errors_are_counted(self):
+        run_id = uuid4()
+        self.handler.on_chat_model_start(
+            {}, [[]], run_id=run_id, metadata={"langgraph_node": "conversation_node"}
+        )
+        self.handler.on_llm_error(TimeoutError("stalled"), run_id=run_id)
+
+        stats = self.handler.get_stats()["conversation_node"]
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["input_tokens"], 0)
+
+    def test_render_prometheus(self):
+        self._run()
+        text = self.handler.render_prometheus()
+
+        self.assertIn("# TYPE tripmind_llm_calls_total counter", text)
+        self.assertIn(
+            'tripmind_llm_calls_total{node="itinerary_node",'
+            'model="claude-3-5-haiku-20241022",prompt_version="itinerary_v1"} 1',
+            text,
+        )
+
+    def test_persists_jsonl_records(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            self.handler = LLMMetricsHandler(log_dir=Path(log_dir))
+            self._run()
+
+            files = list(Path(log_dir).glob("llm-*.jsonl"))
+            self.assertEqual(len(files), 1)
+            self.assertIn('"session_id": "session-1"', files[0].read_text("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
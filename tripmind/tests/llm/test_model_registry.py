@@ -0,0 +1,46 @@
+import unittest
+
+from tripmind.clients.llm.model_registry import ModelProfile, ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+    """노드별 모델 프로필 레지스트리 테스트"""
+
+    def setUp(self):
+        self.registry = ModelRegistry(
+            {
+                "default": {"model": "large-model", "max_tokens": 3000},
+                "classify_intent_node": {
+                    "model": "small-model",
+                    "max_tokens": 256,
+                    "temperature": 0.0,
+                },
+                "conversation_node": {"max_tokens": 1500},
+            }
+        )
+
+    def test_node_profile(self):
+        """노드 프로필 반환"""
+        self.assertEqual(
+            self.registry.get_profile("classify_intent_node"),
+            ModelProfile(model="small-model", max_tokens=256, temperature=0.0),
+        )
+
+    def test_missing_values_fall_back_to_default(self):
+        """노드 프로필에 없는 값과 미등록 노드는 default 프로필 사용"""
+        conversation = self.registry.get_profile("conversation_node")
+        self.assertEqual(conversation.model, "large-model")
+        self.assertEqual(conversation.max_tokens, 1500)
+        self.assertEqual(
+            self.registry.get_profile("unknown_node"), self.registry.default_profile
+        )
+        self.assertEqual(self.registry.get_profile(), self.registry.default_profile)
+
+    def test_default_model_required(self):
+        """default 모델이 없으면 설정 오류"""
+        with self.assertRaises(ValueError):
+            ModelRegistry({"classify_intent_node": {"model": "small-model"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
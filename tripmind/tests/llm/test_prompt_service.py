@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tripmind.services.prompt.prompt_service import PROMPT_VERSION_KEY, PromptService
+
+
+class TestPromptServiceCache(unittest.TestCase):
+    """프롬프트 템플릿 캐시 / mtime 무효화 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = str(Path(self.tmp_dir.name) / "v1.yaml")
+        self._write("안녕하세요 {name} ({model})", mtime=1_000_000)
+
+    def _write(self, template: str, mtime: int):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(f"id: test-v1\ntemplate: |\n  {template}\n")
+        os.utime(self.path, (mtime, mtime))
+
+    def test_cached_prompt_reads_file_once(self):
+        """같은 경로 / partial 은 파일을 다시 읽지 않고 같은 프롬프트를 반환"""
+        service = PromptService(check_interval=60)
+        with patch.object(
+            service,
+            "_load_template_data_from_yaml",
+            wraps=service._load_template_data_from_yaml,
+        ) as load, patch("os.stat", wraps=os.stat) as stat:
+            first = service.get_system_prompt(
+                self.path, partial_variables={"model": "m"}
+            )
+            second = service.get_system_prompt(
+                self.path, partial_variables={"model": "m"}
+            )
+            other = service.get_system_prompt(
+                self.path, partial_variables={"model": "other"}
+            )
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(stat.call_count, 1)
+        self.assertEqual(first.metadata[PROMPT_VERSION_KEY], "test-v1")
+        self.assertEqual(first.input_variables, ["chat_history", "input", "name"])
+
+    def test_modified_file_is_reloaded(self):
+        """파일 mtime 이 바뀌면 다시 읽는다"""
+        service = PromptService(check_interval=0)
+        first = service.get_system_prompt(self.path, partial_variables={"model": "m"})
+
+        self._write("반갑습니다 {model}", mtime=2_000_000)
+        second = service.get_system_prompt(self.path, partial_variables={"model": "m"})
+
+        self.assertIsNot(first, second)
+        self.assertIn(
+            "반갑습니다", second.format_messages(input="", chat_history=[])[0].content
+        )
+        self.assertEqual(service.get_cache_stats()["file_loads"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.runnables import RunnableLambda
+
+from tripmind.clients.llm.response_cache import (
+    LLMResponseCache,
+    create_llm_response_cache,
+)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """LLM 응답 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _invoke(self, llm, node_name, text):
+        # 노드 안에서 호출되는 것처럼 langgraph_node 메타데이터를 전달
+        return RunnableLambda(lambda x: llm.invoke(x).content).invoke(
+            text, config={"metadata": {"langgraph_node": node_name}}
+        )
+
+    def test_repeat_call_is_served_from_cache(self):
+        """활성화된 노드의 동일 요청은 LLM 을 다시 호출하지 않음"""
+        cache = LLMResponseCache(["classify_intent_node"], path=self.path)
+        llm = FakeListChatModel(responses=["첫 응답", "두번째 응답"], cache=cache)
+
+        first = self._invoke(llm, "classify_intent_node", "안녕")
+        second = self._invoke(llm, "classify_intent_node", "안녕")
+
+        self.assertEqual(first, "첫 응답")
+        self.assertEqual(second, "첫 응답")
+        self.assertEqual(
+            cache.get_stats()["classify_intent_node"],
+            {"memory_hits": 1, "sqlite_hits": 0, "misses": 1, "hit_rate": 0.5},
+        )
+
+    def test_disabled_node_bypasses_cache(self):
+        """활성화되지 않은 노드는 캐시를 사용하지 않음"""
+        cache = LLMResponseCache(["classify_intent_node"], path=self.path)
+        llm = FakeListChatModel(responses=["첫 응답", "두번째 응답"], cache=cache)
+
+        self._invoke(llm, "conversation_node", "안녕")
+        second = self._invoke(llm, "conversation_node", "안녕")
+
+        self.assertEqual(second, "두번째 응답")
+        self.assertEqual(cache.get_stats(), {})
+
+    def test_sqlite_store_survives_restart_and_expires(self):
+        """SQLite 저장소는 프로세스 재시작 후에도 유지되고 TTL 이 지나면 만료"""
+        responses = ["저장된 응답", "새 응답"]
+        cache = LLMResponseCache(["classify_intent_node"], path=self.path)
+        llm = FakeListChatModel(responses=responses, cache=cache)
+        self._invoke(llm, "classify_intent_node", "안녕")
+
+        restarted = LLMResponseCache(["classify_intent_node"], path=self.path)
+        llm = FakeListChatModel(responses=responses, cache=restarted)
+
+        self.assertEqual(
+            self._invoke(llm, "classify_intent_node", "안녕"), "저장된 응답"
+        )
+        self.assertEqual(llm.i, 0)
+        self.assertEqual(
+            restarted.get_stats()["classify_intent_node"]["sqlite_hits"], 1
+        )
+
+        restarted._store.set("expired", "[]", ttl=-1)
+        self.assertIsNone(restarted._store.get("expired"))
+
+    def test_cache_is_opt_in_and_opens_store_lazily(self):
+        """노드를 지정하지 않으면 캐시 없음, SQLite 파일은 처음 사용할 때 생성"""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("LLM_RESPONSE_CACHE_NODES", None)
+            self.assertIsNone(create_llm_response_cache())
+
+        path = os.path.join(self.temp_dir.name, "data", "cache.sqlite3")
+        cache = LLMResponseCache(["classify_intent_node"], path=path)
+        self.assertFalse(os.path.exists(path))
+
+        self.assertIsNone(cache._store.get("missing"))
+        self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from langchain_core.messages import HumanMessage
+
+from tripmind.clients.llm.single_flight import SingleFlight, SingleFlightAborted
+
+
+class TestSingleFlight(unittest.TestCase):
+    """동일 LLM 요청 single-flight 테스트"""
+
+    def setUp(self):
+        self.single_flight = SingleFlight(enabled_nodes=["itinerary_node"])
+        self.messages = [HumanMessage(content="서울 일정 짜줘")]
+        self.calls = 0
+
+    def _slow_stream(self):
+        self.calls += 1
+        for token in ["서울", " 1일차", " 경복궁"]:
+            time.sleep(0.02)
+            yield token
+
+    def test_key_only_for_enabled_nodes(self):
+        """대상 노드가 아니면 키를 만들지 않음"""
+        key = self.single_flight.make_key("s1", "itinerary_node", self.messages, "m")
+        self.assertIsNotNone(key)
+        self.assertNotEqual(
+            key, self.single_flight.make_key("s2", "itinerary_node", self.messages, "m")
+        )
+        self.assertIsNone(
+            self.single_flight.make_key("s1", "conversation_node", self.messages, "m")
+        )
+
+    def test_duplicate_stream_attaches_to_leader(self):
+        """진행 중인 동일 요청은 새 호출 없이 같은 스트림을 받음"""
+        key = self.single_flight.make_key("s1", "itinerary_node", self.messages, "m")
+        results = {}
+
+        def consume(name):
+            results[name] = list(self.single_flight.stream(key, self._slow_stream))
+
+        leader = threading.Thread(target=consume, args=("leader",))
+        leader.start()
+        while self.single_flight.in_flight == 0:
+            time.sleep(0.001)
+        consume("follower")
+        leader.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results["leader"], results["follower"])
+        self.assertEqual(
+            self.single_flight.get_stats()["itinerary_node"],
+            {"leaders": 1, "coalesced": 1},
+        )
+        self.assertEqual(self.single_flight.in_flight, 0)
+
+    def test_only_follower_is_recorded_as_followed(self):
+        """합류한 실행만 followed 로 기록 (메모리 중복 저장 방지용)"""
+        key = self.single_flight.make_key("s1", "itinerary_node", self.messages, "m")
+        records = {}
+
+        def consume(name):
+            with self.single_flight.track() as record:
+                list(self.single_flight.stream(key, self._slow_stream))
+            records[name] = record
+
+        leader = threading.Thread(target=consume, args=("leader",))
+        leader.start()
+        while self.single_flight.in_flight == 0:
+            time.sleep(0.001)
+        consume("follower")
+        leader.join()
+
+        self.assertFalse(records["leader"].followed)
+        self.assertTrue(records["follower"].followed)
+
+    def test_async_call_shares_result_and_error(self):
+        """비동기 호출도 결과와 오류를 공유"""
+        key = self.single_flight.make_key("s1", "itinerary_node", self.messages, "m")
+
+        async def generate():
+            self.calls += 1
+            await asyncio.sleep(0.02)
+            return {"output": "ok"}
+
+        async def fail():
+            await asyncio.sleep(0.02)
+            raise ValueError("LLM 오류")
+
+        async def run():
+            results = await asyncio.gather(
+                self.single_flight.acall(key, generate),
+                self.single_flight.acall(key, generate),
+            )
+            self.assertEqual(results, [{"output": "ok"}, {"output": "ok"}])
+
+            errors = await asyncio.gather(
+                self.single_flight.acall(key, fail),
+                self.single_flight.acall(key, fail),
+                return_exceptions=True,
+            )
+            self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+
+    def test_aborted_leader_releases_followers(self):
+        """선행 스트림이 중간에 닫히면 합류한 요청은 중단 오류를 받음"""
+        key = self.single_flight.make_key("s1", "itinerary_node", self.messages, "m")
+        leader = self.single_flight.stream(key, self._slow_stream)
+        next(leader)
+
+        follower = self.single_flight.stream(key, self._slow_stream)
+        self.assertEqual(next(follower), "서울")
+        leader.close()
+
+        with self.assertRaises(SingleFlightAborted):
+            list(follower)
+        self.assertEqual(self.single_flight.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from tripmind.clients.calendar.fake_calendar_client import FakeCalendarClient
+from tripmind.clients.place_search.fake_place_client import FakePlaceClient
+from tripmind.services.calendar.google_calendar_service import GoogleCalendarService
+from tripmind.services.place_search.kakao_place_search_service import (
+    KakaoPlaceSearchService,
+)
+
+
+class TestFakeClients(unittest.TestCase):
+    """부하 테스트용 장소 검색 / 캘린더 fake 클라이언트 테스트"""
+
+    def test_place_search_is_deterministic(self):
+        service = KakaoPlaceSearchService(FakePlaceClient())
+
+        places = service.search_places("제주 카페")
+
+        self.assertEqual(len(places), 5)
+        self.assertEqual(places[0].name, "제주 카페 1")
+        self.assertEqual(places[0].category, "음식점 > 카페")
+        self.assertEqual(
+            [p.id for p in places],
+            [
+                p.id
+                for p in KakaoPlaceSearchService(FakePlaceClient()).search_places(
+                    "제주 카페"
+                )
+            ],
+        )
+
+    def test_calendar_events_are_kept_in_memory(self):
+        service = GoogleCalendarService(FakeCalendarClient())
+
+        added = service.add_event(
+            "2025-06-01", "09:00", "11:00", "성산일출봉", "제주", "일출 보기"
+        )
+        events = service.list_events("2025-06-01", "2025-06-02")
+
+        self.assertTrue(added["link"])
+        self.assertEqual([event["title"] for event in events], ["성산일출봉"])
+        self.assertEqual(events[0]["start_time"], "09:00")
+        self.assertEqual(service.list_events("2025-07-01", "2025-07-02"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
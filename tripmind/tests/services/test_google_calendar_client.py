@@ -0,0 +1,35 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from tripmind.clients.calendar import google_calendar_client
+from tripmind.clients.calendar.google_calendar_client import GoogleCalendarClient
+
+
+class TestGoogleCalendarClient(unittest.TestCase):
+    """공유 구글 캘린더 클라이언트의 스레드별 HTTP 전송 테스트"""
+
+    def setUp(self):
+        for name in ("service_account", "build"):
+            patcher = patch.object(google_calendar_client, name, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = GoogleCalendarClient("calendar-id", "credentials.json")
+
+    def test_http_transport_is_per_thread(self):
+        http = self.client._http()
+
+        self.assertIs(self.client._http(), http)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(self.client._http).result()
+        self.assertIsNot(other, http)
+
+    def test_requests_execute_with_thread_http(self):
+        self.client.get_events("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z")
+
+        execute = self.client.service.events.return_value.list.return_value.execute
+        execute.assert_called_once_with(http=self.client._http())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from tripmind.services.place_search.place_prefetcher import PlacePrefetcher
+from tripmind.services.place_search.place_search_cache import PlaceSearchCache
+from tripmind.types.place_search_type import PlaceSearchResult
+
+
+def _place(name):
+    return PlaceSearchResult(id=name, name=name, address="주소", category="카테고리")
+
+
+class _SlowPlaceSearchService:
+    """release 되기 전까지 검색이 끝나지 않는 장소 검색 서비스"""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def search_places(self, query, location=None):
+        self.calls.append(query)
+        self.release.wait(timeout=5)
+        return [_place(query)]
+
+    def get_place_details(self, place_name, x, y):
+        raise NotImplementedError
+
+
+class TestPlaceSearchCache(unittest.TestCase):
+    """장소 검색 캐시 / 선검색 테스트"""
+
+    def test_tool_search_joins_in_flight_prefetch(self):
+        """선검색 중인 키워드는 다시 호출하지 않고 결과를 기다린다"""
+        cache = PlaceSearchCache()
+        service = _SlowPlaceSearchService()
+        prefetcher = PlacePrefetcher(
+            cache, categories=["맛집", "카페"], place_search_service=service
+        )
+
+        futures = prefetcher.prefetch("제주")
+        result = {}
+        waiter = threading.Thread(
+            target=lambda: result.update(
+                places=cache.get_or_fetch(
+                    "제주  맛집", lambda: service.search_places("제주 맛집")
+                )
+            )
+        )
+        waiter.start()
+        service.release.set()
+        waiter.join(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertEqual(sorted(service.calls), ["제주 맛집", "제주 카페"])
+        self.assertEqual(result["places"][0].name, "제주 맛집")
+        self.assertEqual(prefetcher.prefetch("제주"), [])
+
+    def test_stalled_in_flight_search_falls_back_to_direct_fetch(self):
+        """선행 검색이 멈추면 join_timeout 후 직접 검색"""
+        cache = PlaceSearchCache(join_timeout=0.05)
+        release = threading.Event()
+        owner = threading.Thread(
+            target=cache.get_or_fetch,
+            args=("제주 맛집", lambda: release.wait(5) and [_place("멈춘 검색")]),
+        )
+        owner.start()
+        while not cache.contains("제주 맛집"):
+            pass
+
+        places = cache.get_or_fetch("제주 맛집", lambda: [_place("직접 검색")])
+        release.set()
+        owner.join(timeout=5)
+
+        self.assertEqual(places[0].name, "직접 검색")
+        self.assertEqual(cache.get_stats()["join_timeouts"], 1)
+
+    def test_expired_and_empty_results_are_fetched_again(self):
+        """TTL 이 지난 결과와 빈 결과는 다시 검색"""
+        cache = PlaceSearchCache(ttl_seconds=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return [_place("경복궁")] if len(calls) > 1 else []
+
+        self.assertEqual(cache.get_or_fetch("경복궁", fetch), [])
+        self.assertEqual(len(cache.get_or_fetch("경복궁", fetch)), 1)
+        cache.get_or_fetch("경복궁", fetch)
+        self.assertEqual(len(calls), 2)
+
+        with patch(
+            "tripmind.services.place_search.place_search_cache.time.monotonic",
+            return_value=10**9,
+        ):
+            cache.get_or_fetch("경복궁", fetch)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
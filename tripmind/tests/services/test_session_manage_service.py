@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from tripmind.services.session.session_manage_service import SessionManageService
+from tripmind.services.session.token_budgeted_memory import TokenBudgetedChatMemory
 from tripmind.models.session import ConversationSession
 
 
@@ -22,21 +23,15 @@ class TestSessionManageService(unittest.TestCase):
         # get_or_create가 (session, created) 튜플 반환하도록 설정
         self.mock_get_or_create.return_value = (self.mock_session, False)
 
-        # ConversationBufferMemory 패치
-        self.memory_patch = patch(
-            "tripmind.services.session_manage_service.ConversationBufferMemory"
+        # 서비스 초기화 (요약은 LLM 대신 고정 요약기 사용)
+        self.service = SessionManageService(
+            token_budgets={"default": 2000, "itinerary_node": 4000},
+            summarizer=lambda summary, messages: "요약",
         )
-        self.mock_memory_class = self.memory_patch.start()
-        self.mock_memory = MagicMock()
-        self.mock_memory_class.return_value = self.mock_memory
-
-        # 서비스 초기화
-        self.service = SessionManageService()
 
     def tearDown(self):
         # 패치 종료
         self.get_or_create_patch.stop()
-        self.memory_patch.stop()
 
     def test_get_or_create_session(self):
         """세션 가져오기 또는 생성 테스트"""
@@ -54,29 +49,31 @@ class TestSessionManageService(unittest.TestCase):
         # 서비스 호출
         memory = self.service.get_session_memory("new_session")
 
-        # 메모리 생성 검증
-        self.mock_memory_class.assert_called_once_with(
-            memory_key="chat_history", return_messages=True
-        )
-
         # 결과 검증
-        self.assertEqual(memory, self.mock_memory)
+        self.assertIsInstance(memory, TokenBudgetedChatMemory)
+        self.assertEqual(memory.memory_key, "chat_history")
+        self.assertEqual(memory.max_token_limit, 2000)
         self.assertIn("new_session", self.service.memories)
 
     def test_get_session_memory_existing(self):
         """기존 세션 메모리 가져오기 테스트"""
-        # 메모리 캐시에 세션 추가
-        existing_memory = MagicMock()
-        self.service.memories["existing_session"] = existing_memory
-
-        # 서비스 호출
         memory = self.service.get_session_memory("existing_session")
 
-        # 메모리 생성 호출 안 됨 검증
-        self.mock_memory_class.assert_not_called()
+        # 같은 세션 / 노드는 같은 메모리 반환
+        self.assertIs(self.service.get_session_memory("existing_session"), memory)
 
-        # 결과 검증
-        self.assertEqual(memory, existing_memory)
+    def test_node_memories_share_history(self):
+        """노드별 메모리는 예산이 다르지만 대화 기록은 공유"""
+        conversation = self.service.get_session_memory(
+            "shared_session", node_name="conversation_node"
+        )
+        itinerary = self.service.get_session_memory(
+            "shared_session", node_name="itinerary_node"
+        )
+        conversation.save_context({"input": "부산 가고 싶어"}, {"output": "좋아요"})
+
+        self.assertEqual(itinerary.max_token_limit, 4000)
+        self.assertEqual(len(itinerary.load_memory_variables({})["chat_history"]), 2)
 
     def test_clear_memory_existing(self):
         """기존 세션 메모리 삭제 테스트"""
@@ -0,0 +1,148 @@
+import unittest
+
+from langchain_core.messages import HumanMessage
+
+from tripmind.services.session.token_budgeted_memory import (
+    SUMMARY_PREFIX,
+    SessionChatHistory,
+    TokenBudgetedChatMemory,
+    estimate_tokens,
+)
+
+
+class TestTokenBudgetedChatMemory(unittest.TestCase):
+    """토큰 예산 대화 메모리 테스트"""
+
+    def setUp(self):
+        self.summaries = []
+
+        def summarizer(summary, messages):
+            self.summaries.append([m.content for m in messages])
+            return f"{summary} 요약{len(self.summaries)}".strip()
+
+        self.memory = TokenBudgetedChatMemory(max_token_limit=40, summarizer=summarizer)
+
+    def _save_turns(self, count):
+        for i in range(count):
+            self.memory.save_context(
+                {"input": f"질문{i} 서울 여행"}, {"output": f"답변{i} 일정 안내"}
+            )
+
+    def test_keeps_recent_turns_within_budget(self):
+        """예산 이내 최근 턴만 원문 유지, 이전 턴은 요약으로 전달"""
+        self._save_turns(10)
+        messages = self.memory.load_memory_variables({})["chat_history"]
+
+        self.assertTrue(messages[0].content.startswith(SUMMARY_PREFIX))
+        recent = messages[1:]
+        self.assertIsInstance(recent[0], HumanMessage)
+        self.assertEqual(recent[-1].content, "답변9 일정 안내")
+        self.assertLessEqual(
+            sum(estimate_tokens(m.content) for m in messages),
+            self.memory.max_token_limit,
+        )
+
+    def test_summarizes_only_newly_evicted_messages(self):
+        """요약은 새로 밀려난 메시지에 대해서만 갱신"""
+        self._save_turns(10)
+        self.memory.load_memory_variables({})
+        self.memory.load_memory_variables({})
+        self.assertEqual(len(self.summaries), 1)
+
+        self._save_turns(1)
+        self.memory.load_memory_variables({})
+        self.assertEqual(len(self.summaries), 2)
+        self.assertNotIn("질문0 서울 여행", self.summaries[1])
+
+    def test_falls_back_to_extractive_summary(self):
+        """요약기 실패 시 추출식 요약 사용"""
+
+        def failing(summary, messages):
+            raise RuntimeError("LLM 오류")
+
+        memory = TokenBudgetedChatMemory(max_token_limit=40, summarizer=failing)
+        for i in range(10):
+            memory.save_context({"input": f"질문{i}"}, {"output": f"답변{i}"})
+
+        summary = memory.load_memory_variables({})["chat_history"][0].content
+        self.assertIn("- 어시스턴트: 답변", summary)
+
+    def test_history_counts_tokens_incrementally(self):
+        """누적 토큰 수로 예산 구간 계산"""
+        history = SessionChatHistory()
+        history.add_messages([HumanMessage(content="가" * 10)] * 3)
+
+        self.assertEqual(history.total_tokens, 30)
+        self.assertEqual(history.window_start(20), 1)
+        self.assertEqual(history.window_start(100), 0)
+
+
+class TestRetrievalChatMemory(unittest.TestCase):
+    """관련 턴 검색 기반 대화 메모리 테스트"""
+
+    def setUp(self):
+        self.summaries = []
+
+        def summarizer(summary, messages):
+            self.summaries.append([m.content for m in messages])
+            return f"{summary} 요약{len(self.summaries)}".strip()
+
+        self.memory = TokenBudgetedChatMemory(
+            max_token_limit=500,
+            retrieval_top_k=1,
+            recent_turns=2,
+            summarizer=summarizer,
+        )
+        turns = [
+            ("제주도 렌터카 예약 방법", "제주공항 근처 렌터카 하우스를 이용하세요"),
+            ("부산 해운대 숙소 추천", "해운대 해변 근처 호텔을 추천합니다"),
+            ("서울 경복궁 관람 시간", "경복궁은 09시부터 관람 가능합니다"),
+            ("강릉 커피거리 위치", "안목해변에 커피거리가 있습니다"),
+            ("여수 밤바다 산책 코스", "돌산공원에서 야경을 볼 수 있습니다"),
+        ]
+        for user_input, output in turns:
+            self.memory.save_context({"input": user_input}, {"output": output})
+
+    def test_selects_relevant_and_recent_turns(self):
+        """현재 입력과 관련된 과거 턴 + 최근 턴만 시간 순으로 선택"""
+        messages = self.memory.load_memory_variables({"input": "제주도 렌터카 반납"})[
+            "chat_history"
+        ]
+        contents = [m.content for m in messages[1:] if isinstance(m, HumanMessage)]
+        self.assertEqual(
+            contents,
+            ["제주도 렌터카 예약 방법", "강릉 커피거리 위치", "여수 밤바다 산책 코스"],
+        )
+
+    def test_older_turns_are_kept_in_rolling_summary(self):
+        """최근 턴보다 오래된 턴은 관련 턴이 아니어도 요약으로 전달"""
+        messages = self.memory.load_memory_variables({"input": "제주도 렌터카 반납"})[
+            "chat_history"
+        ]
+
+        self.assertEqual(messages[0].content, f"{SUMMARY_PREFIX}\n요약1")
+        self.assertIn("부산 해운대 숙소 추천", self.summaries[0])
+        self.assertNotIn("강릉 커피거리 위치", self.summaries[0])
+
+        self.memory.load_memory_variables({"input": "제주도 렌터카 반납"})
+        self.assertEqual(len(self.summaries), 1)
+
+    def test_prompt_size_stays_flat(self):
+        """세션이 길어져도 선택되는 턴 수는 top_k + recent_turns 이하"""
+        for i in range(50):
+            self.memory.save_context({"input": f"질문 {i}"}, {"output": f"답변 {i}"})
+
+        messages = self.memory.load_memory_variables({"input": "부산 해운대 숙소"})[
+            "chat_history"
+        ]
+        self.assertTrue(messages[0].content.startswith(SUMMARY_PREFIX))
+        self.assertLessEqual(len(messages[1:]), 2 * 3)
+        self.assertEqual(messages[1].content, "부산 해운대 숙소 추천")
+        self.assertLessEqual(
+            sum(estimate_tokens(m.content) for m in messages),
+            self.memory.max_token_limit,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
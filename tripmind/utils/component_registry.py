@@ -0,0 +1,149 @@
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from django.core.signals import setting_changed
+
+from tripmind.utils.startup_report import startup_report
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# 현재 요청 중에 만들어진 구성 요소 수 (track_request 안에서만 집계)
+_request_builds: ContextVar[Optional[Counter]] = ContextVar(
+    "component_request_builds", default=None
+)
+
+
+class ComponentRegistry:
+    """
+    프로세스 전체가 공유하는 장수명 객체 레지스트리
+    (에이전트 실행기, 외부 API 클라이언트 / 서비스, 도구, AgentExecutor 등)
+
+    - get(name, factory): 처음 요청될 때만 factory 로 만들고 이후 같은 객체를 반환.
+      factory 가 예외를 던지면 (API 키 누락 등) 캐시하지 않고 다음 요청에서 다시 시도한다.
+      version 을 주면 (프롬프트 파일 mtime 등) 값이 바뀔 때 다시 만든다
+    - register(name, component): 미리 만든 객체를 등록 (이후 get 은 이 객체를 반환)
+    - reload(): 설정이 바뀌었을 때 객체를 모두 버리고 (close() 가 있으면 호출) 리로드 훅 실행.
+      Django setting_changed 시그널에도 연결되어 있다
+    - track_request(): 요청 하나 동안 새로 만들어진 객체 수를 집계 (정상 상태에서는 0)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._components: Dict[str, Any] = {}
+        self._versions: Dict[str, Any] = {}
+        self._reload_hooks: List[Callable[[], None]] = []
+        self._builds: Counter = Counter()
+        self._requests = 0
+        self._requests_with_builds = 0
+
+    def get(self, name: str, factory: Callable[[], Any], version: Any = None) -> Any:
+        # factory 가 None 을 반환한 경우(선택 구성 요소 없음)도 캐시한다
+        component = self._components.get(name, _MISSING)
+        if component is not _MISSING and self._versions.get(name) == version:
+            return component
+
+        with self._lock:
+            if name not in self._components or self._versions.get(name) != version:
+                with startup_report.measure(f"component:{name}"):
+                    self._components[name] = factory()
+                self._versions[name] = version
+                self._record_build(name)
+            return self._components[name]
+
+    def register(self, name: str, component: Any, version: Any = None):
+        """factory 없이 객체를 직접 등록하거나 교체한다 (부하 테스트용 fake 서비스 등)"""
+        with self._lock:
+            self._components[name] = component
+            self._versions[name] = version
+
+    def add_reload_hook(self, hook: Callable[[], None]):
+        self._reload_hooks.append(hook)
+
+    def reload(self):
+        with self._lock:
+            components = list(self._components.items())
+            self._components.clear()
+            self._versions.clear()
+
+        for name, component in components:
+            close = getattr(component, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"[구성 요소 리로드] {name} 정리 실패: {str(e)}")
+        for hook in self._reload_hooks:
+            hook()
+        logger.info(f"[구성 요소 리로드] {len(components)}개 폐기")
+
+    @contextmanager
+    def track_request(self, label: str = "request"):
+        builds = Counter()
+        token = _request_builds.set(builds)
+        try:
+            yield builds
+        finally:
+            try:
+                _request_builds.reset(token)
+            except ValueError:
+                # 스트리밍 응답 제너레이터가 다른 컨텍스트에서 정리되는 경우
+                pass
+            with self._lock:
+                self._requests += 1
+                if builds:
+                    self._requests_with_builds += 1
+            if builds:
+                logger.info(
+                    f"[구성 요소 생성] {label}: {sum(builds.values())}개 {dict(builds)}"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "components": sorted(self._components),
+                "builds": dict(self._builds),
+                "requests": self._requests,
+                "requests_with_builds": self._requests_with_builds,
+            }
+
+    def render_prometheus(self) -> str:
+        stats = self.get_stats()
+        lines = [
+            "# HELP tripmind_component_builds_total 공유 구성 요소 생성 횟수",
+            "# TYPE tripmind_component_builds_total counter",
+        ]
+        for name, count in sorted(stats["builds"].items()):
+            lines.append(
+                f'tripmind_component_builds_total{{component="{name}"}} {count}'
+            )
+        lines += [
+            "# HELP tripmind_requests_with_builds_total 구성 요소를 새로 만든 요청 수",
+            "# TYPE tripmind_requests_with_builds_total counter",
+            f"tripmind_requests_with_builds_total {stats['requests_with_builds']}",
+            "# HELP tripmind_tracked_requests_total 구성 요소 생성을 집계한 요청 수",
+            "# TYPE tripmind_tracked_requests_total counter",
+            f"tripmind_tracked_requests_total {stats['requests']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _record_build(self, name: str):
+        self._builds[name] += 1
+        builds = _request_builds.get()
+        if builds is not None:
+            builds[name] += 1
+
+
+component_registry = ComponentRegistry()
+
+
+def _reload_on_setting_changed(**kwargs):
+    component_registry.reload()
+
+
+setting_changed.connect(_reload_on_setting_changed)
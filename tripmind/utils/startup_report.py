@@ -0,0 +1,58 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """
+    워커 프로세스별 콜드 스타트 구성 요소(모듈 import, LLM 클라이언트, 그래프 빌드 등) 소요 시간
+
+    lazy 로 만들어지는 구성 요소가 처음 만들어질 때 measure 로 기록하며,
+    /api/tripmind/metrics/ 에 Prometheus 게이지로 노출된다 (워커별 pid 라벨).
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._steps: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, component: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(component, time.perf_counter() - started)
+
+    def record(self, component: str, seconds: float):
+        with self._lock:
+            self._steps[component] = seconds
+        logger.info(f"[콜드 스타트] {component}: {seconds * 1000:.0f}ms")
+
+    def get_steps(self) -> List[Dict[str, float]]:
+        with self._lock:
+            return [
+                {"component": component, "seconds": round(seconds, 4)}
+                for component, seconds in self._steps.items()
+            ]
+
+    def render_prometheus(self) -> str:
+        name = "tripmind_startup_seconds"
+        lines = [
+            f"# HELP {name} 구성 요소를 처음 만들 때 걸린 시간 (초)",
+            f"# TYPE {name} gauge",
+        ]
+        for step in self.get_steps():
+            lines.append(
+                f'{name}{{pid="{self.pid}",component="{step["component"]}"}} '
+                f'{step["seconds"]:g}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+startup_report = StartupReport()
@@ -0,0 +1,50 @@
+import zlib
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class HashedNgramFeaturizer:
+    """문자 n-gram 을 해시 버킷으로 매핑한 L2 정규화 특징 벡터 (로컬 의도 분류기, 세션 턴 인덱스 공용)"""
+
+    def __init__(self, n_features: int = 2**14, ngram_range: Tuple[int, int] = (1, 3)):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+
+    def transform_one(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """희소 표현 (인덱스, 값) 반환"""
+        text = f" {text.lower().strip()} "
+        counts = {}
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            for i in range(len(text) - n + 1):
+                index = zlib.crc32(text[i : i + n].encode("utf-8")) % self.n_features
+                counts[index] = counts.get(index, 0) + 1
+
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        return indices, values / np.linalg.norm(values)
+
+    def transform_sparse(
+        self, texts: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        여러 문장의 희소 COO 표현 (행, 인덱스, 값).
+        n_features 크기의 밀집 행렬을 만들지 않으므로 메모리는 0이 아닌 값 수에 비례한다.
+        """
+        rows, indices, values = [], [], []
+        for row, text in enumerate(texts):
+            row_indices, row_values = self.transform_one(text)
+            rows.append(np.full(len(row_indices), row, dtype=np.int64))
+            indices.append(row_indices)
+            values.append(row_values)
+        if not rows:
+            return (
+                np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype=np.float32),
+            )
+        return np.concatenate(rows), np.concatenate(indices), np.concatenate(values)
@@ -0,0 +1,133 @@
+import importlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from tripmind.utils.startup_report import startup_report
+
+logger = logging.getLogger(__name__)
+
+AGENTS_DIR = Path(__file__).resolve().parents[1] / "agents"
+
+
+def warmup(
+    graphs: Optional[List[str]] = None, skip_llm: bool = False
+) -> Dict[str, Any]:
+    """
+    첫 요청이 느려지지 않도록 API 모듈, LLM 클라이언트와 HTTP 커넥션 풀, 에이전트 그래프,
+    프롬프트 템플릿 캐시, 공유 실행기 / 도구, 로컬 의도 분류기를 현재 프로세스에 미리 만든다.
+    구성 요소별 소요 시간은 startup_report 에 기록된다.
+
+    graphs 가 없으면 AGENT_SUPERGRAPH 설정에 맞는 그래프를 만든다 (없는 이름이면 KeyError).
+    """
+    started = time.perf_counter()
+    warnings: List[str] = []
+
+    with startup_report.measure("import:tripmind.api.views"):
+        importlib.import_module("tripmind.api.views.itinerary_api_view")
+
+    if not skip_llm:
+        _warm_llm_client()
+
+    from tripmind.agents.common.graph_registry import SUPERGRAPH, graph_registry
+
+    if graphs:
+        names = graphs
+    elif settings.AGENT_SUPERGRAPH:
+        # supergraph 는 에이전트 그래프를 서브그래프로 직접 컴파일한다
+        names = [SUPERGRAPH]
+    else:
+        names = [name for name in graph_registry.names() if name != SUPERGRAPH]
+    graph_registry.build_all(names)
+
+    from tripmind.services.prompt.prompt_service import prompt_service
+
+    with startup_report.measure("prompt_templates"):
+        template_count = sum(
+            prompt_service.preload(path)
+            for path in AGENTS_DIR.glob("*/prompt_templates")
+        )
+
+    _warm_components(skip_llm, warnings)
+
+    return {
+        "templates": template_count,
+        "seconds": time.perf_counter() - started,
+        "warnings": warnings,
+    }
+
+
+def warmup_on_startup():
+    """
+    WARMUP_ON_STARTUP 이면 워커 진입점(config/asgi.py, config/wsgi.py)에서 warmup 실행.
+    실패해도 워커는 뜨고, 남은 구성 요소는 첫 요청에서 만든다.
+    """
+    if not settings.WARMUP_ON_STARTUP:
+        return
+    try:
+        result = warmup()
+    except Exception as e:
+        logger.exception(f"[warmup] 시작 시 워밍업 실패: {str(e)}")
+        return
+    for warning in result["warnings"]:
+        logger.warning(f"[warmup] {warning}")
+    logger.info(
+        f"[warmup] 완료: templates={result['templates']} "
+        f"total={result['seconds'] * 1000:.0f}ms"
+    )
+
+
+def _warm_llm_client():
+    from tripmind.clients.llm.llm_client_factory import get_llm_client
+    from tripmind.clients.llm.llm_gateway import llm_gateway
+
+    llm_client = get_llm_client()
+    with startup_report.measure("llm_models"):
+        llms = [
+            llm_client.get_llm(node_name) for node_name in settings.LLM_MODEL_PROFILES
+        ]
+
+    if settings.LLM_BACKEND != "claude":
+        return
+    # 프로세스 공유 커넥션 풀과 모델별 SDK 클라이언트 (연결은 첫 요청에서 맺음)
+    with startup_report.measure("http_pools"):
+        llm_gateway.http_client
+        llm_gateway.async_http_client
+        for llm in llms:
+            llm._client
+            llm._async_client
+
+
+def _warm_components(skip_llm: bool, warnings: List[str]):
+    from tripmind.agents.prompt_router.intent.local_classifier import (
+        get_local_intent_classifier,
+    )
+    from tripmind.api.views.itinerary_api_view import (
+        AGENT_EXECUTOR_CLASSES,
+        ItineraryAPIView,
+    )
+
+    view = ItineraryAPIView()
+    if settings.AGENT_SUPERGRAPH:
+        view._get_supergraph_executor()
+    else:
+        for intent in AGENT_EXECUTOR_CLASSES:
+            view._get_agent_executor(intent)
+
+    get_local_intent_classifier()
+
+    if skip_llm:
+        return
+    from tripmind.agents.itinerary.nodes.itinerary_node import (
+        get_itinerary_agent_executor,
+    )
+    from tripmind.clients.llm.llm_client_factory import get_llm_client
+
+    try:
+        get_itinerary_agent_executor(get_llm_client())
+    except Exception as e:
+        # 장소 검색 / 캘린더 키가 없으면 첫 요청에서 다시 시도
+        warnings.append(f"일정 에이전트 도구 생성 실패: {e}")